@@ -1,3 +1,4 @@
+from .async_graph_data_science import AsyncGraphDataScience
 from .graph.graph_create_result import GraphCreateResult
 from .graph.graph_object import Graph
 from .graph_data_science import GraphDataScience
@@ -10,15 +11,19 @@ from .model.simple_rel_embedding_model import SimpleRelEmbeddingModel
 from .pipeline.lp_training_pipeline import LPTrainingPipeline
 from .pipeline.nc_training_pipeline import NCTrainingPipeline
 from .pipeline.nr_training_pipeline import NRTrainingPipeline
-from .query_runner.query_runner import QueryRunner
+from .query_runner.gds_arrow_client import PandasConversionOptions
+from .query_runner.query_runner import ProcedureCall, QueryRunner
 from .server_version.server_version import ServerVersion
 from .session.gds_sessions import GdsSessions
 from .version import __version__
 
 __all__ = [
     "GraphDataScience",
+    "AsyncGraphDataScience",
     "GdsSessions",
     "QueryRunner",
+    "ProcedureCall",
+    "PandasConversionOptions",
     "__version__",
     "ServerVersion",
     "Graph",
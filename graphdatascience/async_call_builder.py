@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Any
+
+from pandas import DataFrame
+
+from .call_parameters import CallParameters
+from .query_runner.async_query_runner import AsyncQueryRunner
+
+
+class AsyncCallBuilder:
+    """
+    Resolves attribute access into a GDS procedure name, which is called when awaiting the builder's call.
+    Positional arguments are passed to the procedure in order, keyword arguments as its configuration.
+
+    This is a low-level API: the arguments are passed as they are and the procedure's result is returned as a
+    DataFrame, without the `Graph` and model objects of the `GraphDataScience` endpoints.
+    """
+
+    # the graph catalog operations which create a graph and are tracked as jobs on the server
+    _LOGGED_GRAPH_OPERATIONS = {"project", "filter", "sample", "generate"}
+    # the execution modes of algorithms, trainings and predictions, which are tracked as jobs on the server
+    _LOGGED_MODES = {"stream", "stats", "mutate", "write", "train"}
+
+    def __init__(self, query_runner: AsyncQueryRunner, namespace: str):
+        self._query_runner = query_runner
+        self._namespace = namespace
+
+    def __getattr__(self, attr: str) -> AsyncCallBuilder:
+        if attr.startswith("_"):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attr}'")
+
+        return AsyncCallBuilder(self._query_runner, f"{self._namespace}.{attr}")
+
+    async def __call__(self, *args: Any, **config: Any) -> DataFrame:
+        params = CallParameters({f"arg{idx}": arg for idx, arg in enumerate(args)})
+        if config:
+            params["config"] = config
+
+        return await self._query_runner.call_procedure(
+            endpoint=self._namespace, params=params, logging=AsyncCallBuilder._with_logging(self._namespace)
+        )
+
+    @staticmethod
+    def _with_logging(endpoint: str) -> bool:
+        parts = endpoint.split(".")
+        # estimations are fast and not tracked as jobs on the server
+        if parts[-1] == "estimate":
+            return False
+
+        if "graph" in parts:
+            operation = parts[parts.index("graph") + 1 : parts.index("graph") + 2]
+            return bool(operation) and operation[0] in AsyncCallBuilder._LOGGED_GRAPH_OPERATIONS
+
+        return parts[-1] in AsyncCallBuilder._LOGGED_MODES
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import warnings
+from concurrent.futures import Executor
+from types import TracebackType
+from typing import Any, Optional, Type, Union
+
+import neo4j
+from pandas import DataFrame
+
+from .async_call_builder import AsyncCallBuilder
+from .query_runner.arrow_info import ArrowInfo
+from .query_runner.async_arrow_query_runner import AsyncArrowQueryRunner
+from .query_runner.async_neo4j_query_runner import AsyncNeo4jQueryRunner
+from .query_runner.async_query_runner import AsyncQueryRunner
+from .query_runner.gds_arrow_client import GdsArrowClient
+from .server_version.server_version import ServerVersion
+from .version import __min_server_version__
+
+
+class AsyncGraphDataScience:
+    """
+    Client API for the Neo4j Graph Data Science library, which can be used from an asyncio event loop.
+
+    Every GDS procedure is available as an attribute path which is awaited when called,
+    such as `await gds.pageRank.stream("my-graph", maxIterations=10)`.
+    Positional arguments are passed to the procedure in order and keyword arguments as its configuration.
+
+    This is a low-level API, which returns the result of each procedure as a DataFrame.
+    Graphs and models are referenced by their names, as the `Graph` and model objects, the pipeline builders
+    and the other higher-level endpoints of `GraphDataScience` are not available.
+    """
+
+    def __init__(self, query_runner: AsyncQueryRunner, server_version: ServerVersion):
+        """
+        Use `AsyncGraphDataScience.create` to construct a client connected to a Neo4j DBMS.
+        """
+        self._query_runner = query_runner
+        self._server_version = server_version
+
+    @classmethod
+    async def create(
+        cls: Type[AsyncGraphDataScience],
+        endpoint: Union[str, neo4j.AsyncDriver, AsyncQueryRunner],
+        auth: Optional[tuple[str, str]] = None,
+        database: Optional[str] = None,
+        arrow: Union[str, bool] = True,
+        arrow_disable_server_verification: bool = True,
+        arrow_tls_root_certs: Optional[bytes] = None,
+        arrow_executor: Optional[Executor] = None,
+        bookmarks: Optional[Any] = None,
+        show_progress: bool = True,
+    ) -> AsyncGraphDataScience:
+        """
+        Construct a new AsyncGraphDataScience object.
+
+        Parameters
+        ----------
+        endpoint : Union[str, neo4j.AsyncDriver, AsyncQueryRunner]
+            The Neo4j connection URI, an asynchronous Neo4j driver or a query runner.
+        auth : Optional[tuple[str, str]], default None
+            A username, password pair for authentication.
+        database: Optional[str], default None
+            The Neo4j database to query against.
+        arrow : Union[str, bool], default True
+            Arrow connection information. This is either a string or a bool.
+
+            - If it is a string, it will be interpreted as a connection URL to a GDS Arrow Server.
+            - If it is a bool:
+                - True will make the client discover the connection URI to the GDS Arrow server via the Neo4j endpoint.
+                - False will make the client use Bolt for all operations.
+        arrow_disable_server_verification : bool, default True
+            A flag that indicates that, if the flight client is connecting with
+            TLS, that it skips server verification. If this is enabled, all
+            other TLS settings are overridden.
+        arrow_tls_root_certs : Optional[bytes], default None
+            PEM-encoded certificates that are used for the connection to the
+            GDS Arrow Flight server.
+        arrow_executor : Optional[Executor], default None
+            The executor on which the blocking Arrow transfers are run.
+            Defaults to the default executor of the event loop.
+        bookmarks : Optional[Any], default None
+            The Neo4j bookmarks to require a certain state before the next query gets executed.
+        show_progress : bool, default True
+            A flag to indicate whether to show progress bars for running procedures.
+
+        Returns
+        -------
+        AsyncGraphDataScience
+            A client connected to the given endpoint.
+        """
+        if isinstance(endpoint, AsyncQueryRunner):
+            query_runner: AsyncQueryRunner = endpoint
+        else:
+            query_runner = AsyncNeo4jQueryRunner.create(endpoint, auth, database, bookmarks, show_progress)
+
+        server_version = await query_runner.server_version()
+
+        if server_version < ServerVersion.from_string(__min_server_version__):
+            warnings.warn(
+                DeprecationWarning(
+                    f"Client does not support the given server version `{server_version}`."
+                    + " We recommend to either update the GDS server version or use a compatible version of the `graphdatascience` package."
+                    + " Please refer to the compatibility matrix at https://neo4j.com/docs/graph-data-science-client/current/installation/#python-client-system-requirements."
+                )
+            )
+
+        if arrow:
+            arrow_info = await cls._arrow_info(query_runner, server_version)
+            if arrow_info.enabled:
+                gds_arrow_client = GdsArrowClient.create(
+                    arrow_info,
+                    auth,
+                    query_runner.encrypted(),
+                    arrow_disable_server_verification,
+                    arrow_tls_root_certs,
+                    None if arrow is True else arrow,
+                )
+                query_runner = AsyncArrowQueryRunner(gds_arrow_client, query_runner, arrow_executor)
+
+        query_runner.set_show_progress(show_progress)
+
+        return cls(query_runner, server_version)
+
+    @staticmethod
+    async def _arrow_info(query_runner: AsyncQueryRunner, server_version: ServerVersion) -> ArrowInfo:
+        result = await query_runner.call_procedure(
+            endpoint="gds.debug.arrow", custom_error=False, yields=ArrowInfo.debug_yields(server_version)
+        )
+
+        return ArrowInfo.from_debug_result(result)
+
+    def __getattr__(self, attr: str) -> AsyncCallBuilder:
+        if attr.startswith("_"):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attr}'")
+
+        return AsyncCallBuilder(self._query_runner, f"gds.{attr}")
+
+    async def run_cypher(
+        self, query: str, params: Optional[dict[str, Any]] = None, database: Optional[str] = None
+    ) -> DataFrame:
+        """
+        Run a Cypher query
+
+        Parameters
+        ----------
+        query: str
+            the Cypher query
+        params: Dict[str, Any]
+            parameters to the query
+        database: str
+            the database on which to run the query
+
+        Returns:
+            The query result as a DataFrame
+        """
+        return await self._query_runner.run_cypher(query, params, database, False)
+
+    def server_version(self) -> ServerVersion:
+        """
+        Get the version of the GDS library installed on the server.
+
+        Returns:
+            The version of the GDS library.
+        """
+        return self._server_version
+
+    def set_database(self, database: str) -> None:
+        """
+        Set the database which queries are run against.
+
+        Parameters
+        -------
+        database: str
+            The name of the database to run queries against.
+        """
+        self._query_runner.set_database(database)
+
+    def database(self) -> Optional[str]:
+        """
+        Get the database which queries are run against.
+
+        Returns:
+            The name of the database.
+        """
+        return self._query_runner.database()
+
+    def set_show_progress(self, show_progress: bool) -> None:
+        """
+        Set whether to show progress for running procedures.
+
+        Parameters
+        ----------
+        show_progress: bool
+            Whether to show progress for procedures.
+        """
+        self._query_runner.set_show_progress(show_progress)
+
+    async def close(self) -> None:
+        """
+        Close the AsyncGraphDataScience object and release any resources held by it.
+        """
+        await self._query_runner.close()
+
+    async def __aenter__(self) -> AsyncGraphDataScience:
+        return self
+
+    async def __aexit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import glob
+import itertools
 import os
 import pathlib
 import warnings
 from typing import Any, List, Optional, Union
 
 import pandas as pd
+import pyarrow.dataset
 from multimethod import multimethod
 from neo4j import __version__ as neo4j_driver_version
 from pandas import DataFrame, Series, read_parquet
+from pyarrow.dataset import Expression
 
 from ..call_parameters import CallParameters
 from ..error.client_only_endpoint import client_only_endpoint
 from ..error.illegal_attr_checker import IllegalAttrChecker
 from ..error.uncallable_namespace import UncallableNamespace
+from ..query_runner.arrow_graph_constructor import ArrowGraphConstructor, DatasetScan
+from ..query_runner.arrow_result_format import ArrowResult
+from ..query_runner.graph_constructor import GraphData
 from ..server_version.compatible_with import compatible_with
 from ..server_version.server_version import ServerVersion
 from .graph_create_result import GraphCreateResult
@@ -63,22 +70,135 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
     def construct(
         self,
         graph_name: str,
-        nodes: Union[DataFrame, list[DataFrame]],
-        relationships: Optional[Union[DataFrame, list[DataFrame]]] = None,
+        nodes: Union[GraphData, list[GraphData]],
+        relationships: Optional[Union[GraphData, list[GraphData]]] = None,
         concurrency: int = 4,
         undirected_relationship_types: Optional[list[str]] = None,
+        batch_size: Optional[int] = None,
     ) -> Graph:
         nodes = nodes if isinstance(nodes, list) else [nodes]
 
-        if isinstance(relationships, DataFrame):
-            relationships = [relationships]
-        elif relationships is None:
+        if relationships is None:
             relationships = []
+        elif not isinstance(relationships, list):
+            relationships = [relationships]
+
+        node_columns, nodes = self._peek_columns(nodes)
+        relationship_columns, relationships = self._peek_columns(relationships)
+
+        self._validate_construct(
+            graph_name,
+            node_columns,
+            relationship_columns,
+            undirected_relationship_types,
+            "dataframe",
+        )
 
-        # Filter empty dataframes
-        nodes = [df for df in nodes if not df.empty]
-        relationships = [df for df in relationships if not df.empty]
+        constructor = self._query_runner.create_graph_constructor(
+            graph_name, concurrency, undirected_relationship_types
+        )
+        constructor.run(nodes, relationships, batch_size)
 
+        return Graph(graph_name, self._query_runner)
+
+    @staticmethod
+    def _peek_columns(graph_data: list[GraphData]) -> tuple[list[list[str]], list[GraphData]]:
+        # validates the columns without consuming lazily produced data and filters out empty data
+        columns: list[list[str]] = []
+        non_empty_data: list[GraphData] = []
+        for data in graph_data:
+            if isinstance(data, DataFrame):
+                if data.empty:
+                    continue
+                columns.append(list(data.columns.values))
+            elif isinstance(data, pyarrow.Table):
+                if data.num_rows == 0:
+                    continue
+                columns.append(data.schema.names)
+            elif isinstance(data, pyarrow.RecordBatchReader):
+                columns.append(data.schema.names)
+            else:
+                items = iter(data)
+                first_item = next(items, None)
+                if first_item is None:
+                    continue
+                if isinstance(first_item, DataFrame):
+                    columns.append(list(first_item.columns.values))
+                else:
+                    columns.append(first_item.schema.names)
+                data = itertools.chain([first_item], items)
+
+            non_empty_data.append(data)
+
+        return columns, non_empty_data
+
+    @client_only_endpoint("gds.graph")
+    @compatible_with("construct_from_files", min_inclusive=ServerVersion(2, 1, 0))
+    def construct_from_files(
+        self,
+        graph_name: str,
+        nodes: Union[str, list[str]],
+        relationships: Optional[Union[str, list[str]]] = None,
+        node_columns: Optional[list[str]] = None,
+        relationship_columns: Optional[list[str]] = None,
+        node_filter: Optional[Expression] = None,
+        relationship_filter: Optional[Expression] = None,
+        format: str = "parquet",
+        concurrency: int = 4,
+        undirected_relationship_types: Optional[list[str]] = None,
+    ) -> Graph:
+        node_scans = [self._scan_files(nodes, format, node_columns, node_filter)]
+        relationship_scans = (
+            [self._scan_files(relationships, format, relationship_columns, relationship_filter)]
+            if relationships
+            else []
+        )
+
+        self._validate_construct(
+            graph_name,
+            [scan.columns for scan in node_scans],
+            [scan.columns for scan in relationship_scans],
+            undirected_relationship_types,
+            "files",
+        )
+
+        constructor = self._query_runner.create_graph_constructor(
+            graph_name, concurrency, undirected_relationship_types
+        )
+        if not isinstance(constructor, ArrowGraphConstructor):
+            raise ValueError("Constructing a graph from files requires a connection to the GDS Arrow Flight server.")
+        constructor.run(node_scans, relationship_scans)
+
+        return Graph(graph_name, self._query_runner)
+
+    @staticmethod
+    def _scan_files(
+        paths: Union[str, list[str]], format: str, columns: Optional[list[str]], filter: Optional[Expression]
+    ) -> DatasetScan:
+        if isinstance(paths, str) and any(c in paths for c in "*?["):
+            pattern = paths
+            paths = sorted(glob.glob(pattern))
+            if not paths:
+                raise ValueError(f"No files match the pattern '{pattern}'.")
+
+        dataset = pyarrow.dataset.dataset(paths, format=format)
+        if columns is None:
+            columns = dataset.schema.names
+
+        unknown_columns = set(columns) - set(dataset.schema.names)
+        if unknown_columns:
+            raise ValueError(f"The columns {sorted(unknown_columns)} do not exist in the files of '{paths}'.")
+
+        return DatasetScan(dataset, columns, filter)
+
+    def _validate_construct(
+        self,
+        graph_name: str,
+        node_columns: list[Any],
+        relationship_columns: list[Any],
+        undirected_relationship_types: Optional[list[str]],
+        source: str,
+    ) -> None:
         errors = []
 
         exists = self._query_runner.call_procedure(
@@ -94,14 +214,14 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
                 f"Graph '{graph_name}' already exists. Please drop the existing graph or use a different name."
             )
 
-        for idx, node_df in enumerate(nodes):
-            if "nodeId" not in node_df.columns.values:
-                errors.append(f"Node dataframe at index {idx} needs to contain a 'nodeId' column.")
+        for idx, columns in enumerate(node_columns):
+            if "nodeId" not in columns:
+                errors.append(f"Node {source} at index {idx} needs to contain a 'nodeId' column.")
 
-        for idx, rel_df in enumerate(relationships):
+        for idx, columns in enumerate(relationship_columns):
             for expected_col in ["sourceNodeId", "targetNodeId"]:
-                if expected_col not in rel_df.columns.values:
-                    errors.append(f"Relationship dataframe at index {idx} needs to contain a '{expected_col}' column.")
+                if expected_col not in columns:
+                    errors.append(f"Relationship {source} at index {idx} needs to contain a '{expected_col}' column.")
 
         if self._server_version < ServerVersion(2, 3, 0) and undirected_relationship_types:
             errors.append("The parameter 'undirected_relationship_types' is only supported since GDS 2.3.0.")
@@ -109,13 +229,6 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         if len(errors) > 0:
             raise ValueError(os.linesep.join(errors))
 
-        constructor = self._query_runner.create_graph_constructor(
-            graph_name, concurrency, undirected_relationship_types
-        )
-        constructor.run(nodes, relationships)
-
-        return Graph(graph_name, self._query_runner)
-
     @client_only_endpoint("gds.graph")
     def load_cora(self, graph_name: str = "cora", undirected: bool = False) -> Graph:
         file = self._path("graphdatascience.resources.cora", "cora_nodes.parquet.gzip")
@@ -377,6 +490,23 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
             params=params,
         )
 
+    @graph_type_check
+    def _stream_properties(
+        self,
+        G: Graph,
+        properties: Strings,
+        entities: Strings,
+        config: dict[str, Any],
+    ) -> ArrowResult:
+        params = CallParameters(
+            graph_name=G.name(),
+            properties=properties,
+            entities=entities,
+            config=config,
+        )
+
+        return self._query_runner.call_stream_procedure(endpoint=self._namespace, params=params)
+
     @property
     def nodeProperty(self) -> GraphNodePropertyRunner:
         self._namespace += ".nodeProperty"
@@ -414,10 +544,14 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         node_labels: Strings = ["*"],
         separate_property_columns: bool = False,
         **config: Any,
-    ) -> DataFrame:
+    ) -> ArrowResult:
         self._namespace += ".streamNodeProperties"
 
-        result = self._handle_properties(G, node_properties, node_labels, config)
+        result = self._stream_properties(G, node_properties, node_labels, config)
+
+        if not isinstance(result, DataFrame):
+            # a non-pandas Arrow result format was configured, so the result is returned in the wide Arrow layout
+            return result
 
         # new format was requested, but the query was run via Cypher
         if separate_property_columns and "propertyValue" in result.keys():
@@ -438,10 +572,10 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         node_properties: str,
         node_labels: Strings = ["*"],
         **config: Any,
-    ) -> DataFrame:
+    ) -> ArrowResult:
         self._namespace += ".streamNodeProperty"
 
-        return self._handle_properties(G, node_properties, node_labels, config)
+        return self._stream_properties(G, node_properties, node_labels, config)
 
     def streamRelationshipProperties(
         self,
@@ -450,10 +584,14 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         relationship_types: Strings = ["*"],
         separate_property_columns: bool = False,
         **config: Any,
-    ) -> DataFrame:
+    ) -> ArrowResult:
         self._namespace += ".streamRelationshipProperties"
 
-        result = self._handle_properties(G, relationship_properties, relationship_types, config)
+        result = self._stream_properties(G, relationship_properties, relationship_types, config)
+
+        if not isinstance(result, DataFrame):
+            # a non-pandas Arrow result format was configured, so the result is returned in the wide Arrow layout
+            return result
 
         # new format was requested, but the query was run via Cypher
         if separate_property_columns and "propertyValue" in result.keys():
@@ -478,10 +616,10 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         relationship_properties: str,
         relationship_types: Strings = ["*"],
         **config: Any,
-    ) -> DataFrame:
+    ) -> ArrowResult:
         self._namespace += ".streamRelationshipProperty"
 
-        return self._handle_properties(G, relationship_properties, relationship_types, config)
+        return self._stream_properties(G, relationship_properties, relationship_types, config)
 
     def writeNodeProperties(
         self,
@@ -11,6 +11,7 @@ from ..error.cypher_warning_handler import (
 )
 from ..error.illegal_attr_checker import IllegalAttrChecker
 from ..error.uncallable_namespace import UncallableNamespace
+from ..query_runner.arrow_result_format import ArrowResult
 from ..query_runner.query_runner import QueryRunner
 from ..server_version.compatible_with import compatible_with
 from ..server_version.server_version import ServerVersion
@@ -69,6 +70,23 @@ class GraphEntityOpsBaseRunner(UncallableNamespace, IllegalAttrChecker):
             params=params,
         )
 
+    @graph_type_check
+    def _stream_properties(
+        self,
+        G: Graph,
+        properties: Strings,
+        entities: Strings,
+        config: dict[str, Any],
+    ) -> ArrowResult:
+        params = CallParameters(
+            graph_name=G.name(),
+            properties=properties,
+            entities=entities,
+            config=config,
+        )
+
+        return self._query_runner.call_stream_procedure(endpoint=self._namespace, params=params)
+
 
 class GraphNodePropertyRunner(GraphEntityOpsBaseRunner):
     @compatible_with("stream", min_inclusive=ServerVersion(2, 2, 0))
@@ -80,7 +98,7 @@ class GraphNodePropertyRunner(GraphEntityOpsBaseRunner):
         node_labels: Strings = ["*"],
         db_node_properties: list[str] = [],
         **config: Any,
-    ) -> DataFrame:
+    ) -> ArrowResult:
         self._namespace += ".stream"
 
         if len(set(db_node_properties)) != len(db_node_properties):
@@ -88,7 +106,7 @@ class GraphNodePropertyRunner(GraphEntityOpsBaseRunner):
                 f"The provided db_node_properties contain duplicate property names: `{db_node_properties}`."
             )
 
-        result = self._handle_properties(G, node_property, node_labels, config)
+        result = self._stream_properties(G, node_property, node_labels, config)
 
         return GraphNodePropertiesRunner._process_result(
             self._query_runner, list(node_property), False, db_node_properties, result, config
@@ -106,7 +124,7 @@ class GraphNodePropertiesRunner(GraphEntityOpsBaseRunner):
         separate_property_columns: bool = False,
         db_node_properties: list[str] = [],
         **config: Any,
-    ) -> DataFrame:
+    ) -> ArrowResult:
         self._namespace += ".stream"
 
         # find if list contain duplicates
@@ -117,7 +135,7 @@ class GraphNodePropertiesRunner(GraphEntityOpsBaseRunner):
                 f"The provided db_node_properties contain duplicate property names: `{db_node_properties}`."
             )
 
-        result = self._handle_properties(G, node_properties, node_labels, config)
+        result = self._stream_properties(G, node_properties, node_labels, config)
 
         return GraphNodePropertiesRunner._process_result(
             self._query_runner, node_properties, separate_property_columns, db_node_properties, result, config
@@ -129,9 +147,15 @@ class GraphNodePropertiesRunner(GraphEntityOpsBaseRunner):
         node_properties: list[str],
         separate_property_columns: bool,
         db_node_properties: list[str],
-        result: DataFrame,
+        result: ArrowResult,
         config: dict[str, Any],
-    ) -> DataFrame:
+    ) -> ArrowResult:
+        if not isinstance(result, DataFrame):
+            # a non-pandas Arrow result format was configured, so the result is returned in the wide Arrow layout
+            if db_node_properties:
+                raise ValueError("The `db_node_properties` parameter is only supported for pandas results")
+            return result
+
         # new format was requested, but the query was run via Cypher
         if separate_property_columns and "propertyValue" in result.keys():
             wide_result = result.pivot(index=["nodeId"], columns=["nodeProperty"], values="propertyValue")
@@ -148,8 +172,7 @@ class GraphNodePropertiesRunner(GraphEntityOpsBaseRunner):
             result.columns.name = None
         # old format was requested but the query was run via Arrow
         elif not separate_property_columns and "propertyValue" not in result.keys():
-            id_vars = ["nodeId", "nodeLabels"] if config.get("listNodeLabels", False) else ["nodeId"]
-            result = result.melt(id_vars=id_vars, var_name="nodeProperty", value_name="propertyValue")
+            result = GraphNodePropertiesRunner._to_long_layout(result, config.get("listNodeLabels", False))
 
         if db_node_properties:
             duplicate_properties = set(db_node_properties).intersection(set(node_properties))
@@ -177,6 +200,12 @@ class GraphNodePropertiesRunner(GraphEntityOpsBaseRunner):
 
         return result
 
+    @staticmethod
+    def _to_long_layout(result: DataFrame, list_node_labels: bool) -> DataFrame:
+        # Arrow returns one column per property, Cypher one row per node and property
+        id_vars = ["nodeId", "nodeLabels"] if list_node_labels else ["nodeId"]
+        return result.melt(id_vars=id_vars, var_name="nodeProperty", value_name="propertyValue")
+
     @staticmethod
     def _build_query(db_node_properties: list[str]) -> str:
         query_prefix = "MATCH (n) WHERE id(n) IN $ids RETURN id(n) AS nodeId"
@@ -211,10 +240,10 @@ class GraphRelationshipPropertyRunner(GraphEntityOpsBaseRunner):
     @compatible_with("stream", min_inclusive=ServerVersion(2, 2, 0))
     def stream(
         self, G: Graph, relationship_property: str, relationship_types: Strings = ["*"], **config: Any
-    ) -> DataFrame:
+    ) -> ArrowResult:
         self._namespace += ".stream"
         relationship_types = [relationship_types] if isinstance(relationship_types, str) else relationship_types
-        return self._handle_properties(G, relationship_property, relationship_types, config)
+        return self._stream_properties(G, relationship_property, relationship_types, config)
 
 
 class GraphRelationshipPropertiesRunner(GraphEntityOpsBaseRunner):
@@ -226,12 +255,16 @@ class GraphRelationshipPropertiesRunner(GraphEntityOpsBaseRunner):
         relationship_types: Strings = ["*"],
         separate_property_columns: bool = False,
         **config: Any,
-    ) -> DataFrame:
+    ) -> ArrowResult:
         self._namespace += ".stream"
 
         relationship_types = [relationship_types] if isinstance(relationship_types, str) else relationship_types
 
-        result = self._handle_properties(G, relationship_properties, relationship_types, config)
+        result = self._stream_properties(G, relationship_properties, relationship_types, config)
+
+        if not isinstance(result, DataFrame):
+            # a non-pandas Arrow result format was configured, so the result is returned in the wide Arrow layout
+            return result
 
         # new format was requested, but the query was run via Cypher
         if separate_property_columns and "propertyValue" in result.keys():
@@ -244,12 +277,17 @@ class GraphRelationshipPropertiesRunner(GraphEntityOpsBaseRunner):
             result.columns.name = None
         # old format was requested but the query was run via Arrow
         elif not separate_property_columns and "propertyValue" not in result.keys():
-            result = result.melt(id_vars=["sourceNodeId", "targetNodeId", "relationshipType"]).rename(
-                columns={"variable": "relationshipProperty", "value": "propertyValue"}
-            )
+            result = GraphRelationshipPropertiesRunner._to_long_layout(result)
 
         return result
 
+    @staticmethod
+    def _to_long_layout(result: DataFrame) -> DataFrame:
+        # Arrow returns one column per property, Cypher one row per relationship and property
+        return result.melt(id_vars=["sourceNodeId", "targetNodeId", "relationshipType"]).rename(
+            columns={"variable": "relationshipProperty", "value": "propertyValue"}
+        )
+
     @compatible_with("write", min_inclusive=ServerVersion(2, 4, 0))
     @graph_type_check
     def write(
@@ -336,10 +374,16 @@ class GraphRelationshipsRunner(GraphEntityOpsBaseRunner):
 
     @compatible_with("stream", min_inclusive=ServerVersion(2, 5, 0))
     @graph_type_check
-    def stream(self, G: Graph, relationship_types: list[str] = ["*"], **config: Any) -> TopologyDataFrame:
+    def stream(
+        self, G: Graph, relationship_types: list[str] = ["*"], **config: Any
+    ) -> Union[TopologyDataFrame, ArrowResult]:
         self._namespace += ".stream"
         params = CallParameters(graph_name=G.name(), relationship_types=relationship_types, config=config)
-        result = self._query_runner.call_procedure(endpoint=self._namespace, params=params)
+        result = self._query_runner.call_stream_procedure(endpoint=self._namespace, params=params)
+
+        if not isinstance(result, DataFrame):
+            # a non-pandas Arrow result format was configured
+            return result
 
         return TopologyDataFrame(result)
 
@@ -353,11 +397,18 @@ class GraphRelationshipsRunner(GraphEntityOpsBaseRunner):
 class GraphRelationshipsBetaRunner(GraphEntityOpsBaseRunner):
     @compatible_with("stream", min_inclusive=ServerVersion(2, 2, 0))
     @graph_type_check
-    def stream(self, G: Graph, relationship_types: list[str] = ["*"], **config: Any) -> TopologyDataFrame:
+    def stream(
+        self, G: Graph, relationship_types: list[str] = ["*"], **config: Any
+    ) -> Union[TopologyDataFrame, ArrowResult]:
         self._namespace += ".stream"
         params = CallParameters(graph_name=G.name(), relationship_types=relationship_types, config=config)
+        result = self._query_runner.call_stream_procedure(endpoint=self._namespace, params=params)
 
-        return TopologyDataFrame(self._query_runner.call_procedure(endpoint=self._namespace, params=params))
+        if not isinstance(result, DataFrame):
+            # a non-pandas Arrow result format was configured
+            return result
+
+        return TopologyDataFrame(result)
 
     @property
     @compatible_with("toUndirected", min_inclusive=ServerVersion(2, 3, 0))
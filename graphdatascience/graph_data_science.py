@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import warnings
 from types import TracebackType
-from typing import Any, Optional, Type, Union
+from typing import Any, Iterator, Optional, Type, Union
 
 from neo4j import Driver
 from pandas import DataFrame
@@ -13,8 +13,9 @@ from .error.uncallable_namespace import UncallableNamespace
 from .graph.graph_proc_runner import GraphProcRunner
 from .query_runner.arrow_info import ArrowInfo
 from .query_runner.arrow_query_runner import ArrowQueryRunner
+from .query_runner.gds_arrow_client import PandasConversionOptions
 from .query_runner.neo4j_query_runner import Neo4jQueryRunner
-from .query_runner.query_runner import QueryRunner
+from .query_runner.query_runner import ProcedureCall, QueryRunner
 from .server_version.server_version import ServerVersion
 from .utils.util_proc_runner import UtilProcRunner
 from .version import __min_server_version__
@@ -38,6 +39,12 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
         arrow_tls_root_certs: Optional[bytes] = None,
         bookmarks: Optional[Any] = None,
         show_progress: bool = True,
+        arrow_compression: Optional[str] = None,
+        arrow_result_format: str = "pandas",
+        connectivity_check_interval: float = 60.0,
+        arrow_upload_window: int = 1,
+        arrow_parallel_streams: int = 1,
+        arrow_pandas_conversion: Optional[PandasConversionOptions] = None,
     ):
         """
         Construct a new GraphDataScience object.
@@ -69,6 +76,24 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
             The Neo4j bookmarks to require a certain state before the next query gets executed.
         show_progress : bool, default True
             A flag to indicate whether to show progress bars for running procedures.
+        arrow_compression : Optional[str], default None
+            The codec used to compress data sent to the GDS Arrow Flight server, either "lz4" or "zstd".
+            Requires a GDS Arrow Flight server that supports the codec.
+        arrow_result_format : str, default "pandas"
+            The format of results streamed over Arrow, one of "pandas", "arrow", "polars" or "numpy".
+            Other formats than "pandas" skip the conversion into a pandas DataFrame.
+        connectivity_check_interval : float, default 60.0
+            The number of seconds after a successful query during which the connectivity to the database is not
+            verified again before the next query. Set to 0 to verify the connectivity before every query.
+        arrow_upload_window : int, default 1
+            The number of record batches uploaded to the GDS Arrow Flight server which may be awaiting an
+            acknowledgement at the same time.
+        arrow_parallel_streams : int, default 1
+            The number of streams used to download node properties and relationships over Arrow, partitioned by
+            node label or relationship type.
+        arrow_pandas_conversion : Optional[PandasConversionOptions], default None
+            Options for converting results streamed over Arrow into pandas DataFrames,
+            if `arrow_result_format` is "pandas".
         """
         if aura_ds:
             GraphDataScience._validate_endpoint(endpoint)
@@ -77,7 +102,13 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
             self._query_runner = endpoint
         else:
             self._query_runner = Neo4jQueryRunner.create_for_db(
-                endpoint, auth, aura_ds, database, bookmarks, show_progress
+                endpoint,
+                auth,
+                aura_ds,
+                database,
+                bookmarks,
+                show_progress,
+                connectivity_check_interval=connectivity_check_interval,
             )
 
         self._server_version = self._query_runner.server_version()
@@ -101,6 +132,11 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
                 arrow_disable_server_verification,
                 arrow_tls_root_certs,
                 None if arrow is True else arrow,
+                pandas_conversion=arrow_pandas_conversion,
+                parallel_streams=arrow_parallel_streams,
+                upload_window=arrow_upload_window,
+                compression=arrow_compression,
+                result_format=arrow_result_format,
             )
 
         self._query_runner.set_show_progress(show_progress)
@@ -213,6 +249,58 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
 
         return qr.run_cypher(query, params, database, False)
 
+    def run_cypher_iter(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        database: Optional[str] = None,
+        chunk_size: int = 10_000,
+    ) -> Iterator[DataFrame]:
+        """
+        Run a Cypher query and consume its result in chunks
+
+        Parameters
+        ----------
+        query: str
+            the Cypher query
+        params: Dict[str, Any]
+            parameters to the query
+        database: str
+            the database on which to run the query
+        chunk_size: int
+            the maximum number of rows per chunk
+
+        Returns:
+            An iterator over the query result as DataFrames of at most `chunk_size` rows
+        """
+        qr = self._query_runner
+
+        # The Arrow query runner should not be used to execute arbitrary Cypher
+        if isinstance(self._query_runner, ArrowQueryRunner):
+            qr = self._query_runner.fallback_query_runner()
+
+        return qr.run_cypher_iter(query, params, database, False, chunk_size)
+
+    def call_procedures(self, calls: list[ProcedureCall], database: Optional[str] = None) -> list[DataFrame]:
+        """
+        Call several procedures with a single query, instead of one round trip per procedure
+
+        Parameters
+        ----------
+        calls: List[ProcedureCall]
+            the procedures to call in order, with their parameters and optionally the columns to yield
+        database: str
+            the database on which to call the procedures
+
+        Returns:
+            The result of every call as a DataFrame, in the order of the calls.
+            As procedures may yield any number of rows, results are not reduced to a Series;
+            use `iloc[0]` on the result of a procedure yielding a single row to get it as a Series.
+            The output columns of procedures called without explicit `yields` are looked up once per
+            procedure and then reused for later calls.
+        """
+        return self._query_runner.call_procedures(calls, database)
+
     def driver_config(self) -> dict[str, Any]:
         """
         Get the configuration used to create the underlying driver used to make queries to Neo4j.
@@ -232,6 +320,11 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
         arrow_disable_server_verification: bool = True,
         arrow_tls_root_certs: Optional[bytes] = None,
         bookmarks: Optional[Any] = None,
+        arrow_compression: Optional[str] = None,
+        arrow_result_format: str = "pandas",
+        arrow_upload_window: int = 1,
+        arrow_parallel_streams: int = 1,
+        arrow_pandas_conversion: Optional[PandasConversionOptions] = None,
     ) -> "GraphDataScience":
         return cls(
             driver,
@@ -241,6 +334,11 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
             arrow_disable_server_verification=arrow_disable_server_verification,
             arrow_tls_root_certs=arrow_tls_root_certs,
             bookmarks=bookmarks,
+            arrow_compression=arrow_compression,
+            arrow_result_format=arrow_result_format,
+            arrow_upload_window=arrow_upload_window,
+            arrow_parallel_streams=arrow_parallel_streams,
+            arrow_pandas_conversion=arrow_pandas_conversion,
         )
 
     @staticmethod
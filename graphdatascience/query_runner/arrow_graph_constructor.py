@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 import concurrent
+import itertools
 import math
-import warnings
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Optional
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from queue import Full, Queue
+from typing import Any, Iterator, Optional, Sequence, Union
 
-import numpy
+import pyarrow
 from pandas import DataFrame
+from pyarrow import RecordBatch, Table
+from pyarrow.dataset import Dataset, Expression
 from tqdm.auto import tqdm
 
 from .gds_arrow_client import GdsArrowClient
-from .graph_constructor import GraphConstructor
+from .graph_constructor import GraphConstructor, GraphData
 
 
 class ArrowGraphConstructor(GraphConstructor):
@@ -23,6 +28,7 @@ class ArrowGraphConstructor(GraphConstructor):
         concurrency: int,
         undirected_relationship_types: Optional[list[str]],
         chunk_size: int = 10_000,
+        target_batch_bytes: Optional[int] = 8 * 1024 * 1024,
     ):
         self._database = database
         self._concurrency = concurrency
@@ -33,8 +39,22 @@ class ArrowGraphConstructor(GraphConstructor):
         )
         self._chunk_size = chunk_size
         self._min_batch_size = chunk_size * 10
+        # batches are sized by bytes if set, so that wide and narrow data frames result in similarly sized batches
+        self._target_batch_bytes = target_batch_bytes
 
-    def run(self, node_dfs: list[DataFrame], relationship_dfs: list[DataFrame]) -> None:
+    def run(
+        self,
+        nodes: Sequence[Union[GraphData, DatasetScan]],
+        relationships: Sequence[Union[GraphData, DatasetScan]],
+        batch_size: Optional[int] = None,
+    ) -> None:
+        self._validate_batch_size(batch_size)
+
+        # an explicit batch size limits the rows per uploaded record batch instead of sizing the batches by bytes
+        upload_batch_size = self._min_batch_size if batch_size is None else batch_size
+        target_batch_bytes = self._target_batch_bytes if batch_size is None else None
+
+        stop_conversion = threading.Event()
         try:
             config: dict[str, Any] = {
                 "name": self._graph_name,
@@ -52,67 +72,199 @@ class ArrowGraphConstructor(GraphConstructor):
                 concurrency=self._concurrency,
             )
 
-            self._send_dfs(node_dfs, "node")
+            # the data frames are converted in the background while the previous ones are uploaded
+            node_partitions: Queue[Any] = Queue(maxsize=self._concurrency)
+            relationship_partitions: Queue[Any] = Queue(maxsize=self._concurrency)
+            converter = threading.Thread(
+                target=self._convert_dfs,
+                args=([(nodes, node_partitions), (relationships, relationship_partitions)], stop_conversion),
+                daemon=True,
+            )
+            converter.start()
+
+            self._send_partitions(
+                self._drain(node_partitions), self._num_rows(nodes), "node", upload_batch_size, target_batch_bytes
+            )
 
             self._client.node_load_done(self._graph_name)
 
-            self._send_dfs(relationship_dfs, "relationship")
+            self._send_partitions(
+                self._drain(relationship_partitions),
+                self._num_rows(relationships),
+                "relationship",
+                upload_batch_size,
+                target_batch_bytes,
+            )
 
             self._client.relationship_load_done(self._graph_name)
         except (Exception, KeyboardInterrupt) as e:
             self._client.abort(self._graph_name)
 
             raise e
+        finally:
+            stop_conversion.set()
 
-    def _partition_dfs(self, dfs: list[DataFrame]) -> list[DataFrame]:
-        partitioned_dfs: list[DataFrame] = []
+    def _partition_df(self, df: DataFrame) -> list[Table]:
+        # convert once, the partitions are zero-copy slices sharing the same schema
+        return self._partition_table(pyarrow.Table.from_pandas(df))
 
-        for df in dfs:
-            num_rows = df.shape[0]
-            num_batches = math.ceil(num_rows / self._min_batch_size)
-
-            # pandas 2.1.0 deprecates swapaxes, but numpy did not catch up yet.
-            warnings.filterwarnings(
-                "ignore",
-                message=(
-                    r"^'DataFrame.swapaxes' is deprecated and will be removed in a future version. "
-                    + r"Please use 'DataFrame.transpose' instead.$"
-                ),
-            )
-            partitioned_dfs += numpy.array_split(df, num_batches)  # type: ignore
+    def _partition_table(self, table: Table) -> list[Table]:
+        num_rows = table.num_rows
+        num_batches = math.ceil(num_rows / self._min_batch_size)
+
+        # distribute the rows evenly, the first partitions get one additional row if it does not divide evenly
+        base_size, remainder = divmod(num_rows, max(num_batches, 1))
+        partitions: list[Table] = []
+        offset = 0
+        for i in range(num_batches):
+            length = base_size + (1 if i < remainder else 0)
+            partitions.append(table.slice(offset, length))
+            offset += length
+
+        return partitions
 
-        return partitioned_dfs
+    def _partition(self, data: Union[GraphData, DatasetScan]) -> Iterator[Union[Table, Iterator[RecordBatch]]]:
+        if isinstance(data, DatasetScan):
+            # one lazy stream per file, so that the files are read and uploaded in parallel
+            for fragment in data.dataset.get_fragments(filter=data.filter):
+                yield fragment.to_batches(
+                    schema=data.dataset.schema,
+                    columns=data.columns,
+                    filter=data.filter,
+                    batch_size=self._min_batch_size,
+                )
+        elif isinstance(data, DataFrame):
+            yield from self._partition_df(data)
+        elif isinstance(data, pyarrow.Table):
+            yield from self._partition_table(data)
+        elif isinstance(data, pyarrow.RecordBatchReader):
+            yield data
+        else:
+            items = iter(data)
+            first_item = next(items, None)
+            if first_item is None:
+                return
 
-    def _send_dfs(self, dfs: list[DataFrame], entity_type: str) -> None:
+            if isinstance(first_item, RecordBatch):
+                # the batches are produced lazily, so they are uploaded as a single stream
+                yield itertools.chain([first_item], items)
+            else:
+                # each data frame is only converted once the previous ones have been queued for upload
+                for df in itertools.chain([first_item], items):
+                    yield from self._partition_df(df)
+
+    def _convert_dfs(
+        self,
+        dfs_per_queue: list[tuple[Sequence[Union[GraphData, DatasetScan]], Queue[Any]]],
+        stop: threading.Event,
+    ) -> None:
+        def put(partitions: Queue[Any], item: Any) -> bool:
+            # a bounded queue keeps at most a few converted partitions in memory ahead of the uploads
+            while not stop.is_set():
+                try:
+                    partitions.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        for dfs, partitions in dfs_per_queue:
+            try:
+                for df in dfs:
+                    for partition in self._partition(df):
+                        if not put(partitions, partition):
+                            return
+            except Exception as e:
+                put(partitions, e)
+                return
+
+            if not put(partitions, None):
+                return
+
+    @staticmethod
+    def _drain(partitions: Queue[Any]) -> Iterator[Union[Table, Iterator[RecordBatch]]]:
+        while True:
+            item = partitions.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    @staticmethod
+    def _num_rows(dfs: Sequence[Union[GraphData, DatasetScan]]) -> Optional[int]:
+        num_rows = 0
+        for df in dfs:
+            if isinstance(df, DataFrame):
+                num_rows += df.shape[0]
+            elif isinstance(df, pyarrow.Table):
+                num_rows += df.num_rows
+            else:
+                # the number of rows of files and lazily produced data is not known upfront
+                return None
+        return num_rows
+
+    def _send_partitions(
+        self,
+        partitions: Iterator[Union[Table, Iterator[RecordBatch]]],
+        num_rows: Optional[int],
+        entity_type: str,
+        batch_size: int,
+        target_batch_bytes: Optional[int],
+    ) -> None:
         desc = "Uploading Nodes" if entity_type == "node" else "Uploading Relationships"
-        pbar = tqdm(total=sum([df.shape[0] for df in dfs]), unit="Records", desc=desc)
+        pbar = tqdm(total=num_rows, unit="Records", desc=desc)
 
-        partitioned_dfs = self._partition_dfs(dfs)
+        # spread the concurrent uploads across separate connections
+        self._client.ensure_client_pool_size(self._concurrency)
 
         with ThreadPoolExecutor(self._concurrency) as executor:
 
-            def run_upload(df: DataFrame) -> None:
+            def run_upload(table: Union[Table, Iterator[RecordBatch]]) -> None:
                 def progress_callback(rows: int) -> None:
                     pbar.update(rows)  # pbar would
 
                 if entity_type == "node":
                     self._client.upload_nodes(
                         self._graph_name,
-                        node_data=df,
-                        batch_size=self._min_batch_size,
+                        node_data=table,
+                        batch_size=batch_size,
                         progress_callback=progress_callback,
+                        target_batch_bytes=target_batch_bytes,
                     )
                 else:
                     self._client.upload_relationships(
                         self._graph_name,
-                        relationship_data=df,
-                        batch_size=self._min_batch_size,
+                        relationship_data=table,
+                        batch_size=batch_size,
                         progress_callback=progress_callback,
+                        target_batch_bytes=target_batch_bytes,
                     )
                 pbar.refresh()
 
-            futures = [executor.submit(run_upload, df) for df in partitioned_dfs]
-            for future in concurrent.futures.as_completed(futures):
-                if not future.exception():
-                    continue
-                raise future.exception()  # type: ignore
+            def raise_failed(futures: set[Future[None]]) -> None:
+                for future in futures:
+                    if future.exception():
+                        raise future.exception()  # type: ignore
+
+            # only take the next partition once an upload slot is free, so that the conversion is throttled
+            running: set[Future[None]] = set()
+            for partition in partitions:
+                if len(running) >= self._concurrency:
+                    done, running = concurrent.futures.wait(running, return_when=FIRST_COMPLETED)
+                    raise_failed(done)
+                running.add(executor.submit(run_upload, partition))
+
+            done, _ = concurrent.futures.wait(running)
+            raise_failed(done)
+
+
+@dataclass(frozen=True)
+class DatasetScan:
+    """
+    A scan of a file based dataset, reading only the given columns of the rows matching the filter.
+    """
+
+    dataset: Dataset
+    columns: Optional[list[str]] = None
+    filter: Optional[Expression] = None
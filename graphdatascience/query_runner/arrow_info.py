@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pandas import DataFrame
 
-from ..query_runner.query_runner import QueryRunner
 from ..server_version.server_version import ServerVersion
 
+if TYPE_CHECKING:
+    from ..query_runner.query_runner import QueryRunner
+
 
 @dataclass(frozen=True)
 class ArrowInfo:
@@ -15,17 +20,26 @@ class ArrowInfo:
 
     @staticmethod
     def create(query_runner: QueryRunner) -> ArrowInfo:
-        debugYields = ["listenAddress", "enabled", "running"]
-        if query_runner.server_version() > ServerVersion(2, 6, 0):
-            debugYields.append("versions")
+        return query_runner.server_capabilities().arrow_info()
+
+    @staticmethod
+    def debug_yields(server_version: ServerVersion) -> list[str]:
+        """
+        The columns of `gds.debug.arrow` to yield, which depend on the version of the GDS server.
+        """
+        yields = ["listenAddress", "enabled", "running"]
+        if server_version > ServerVersion(2, 6, 0):
+            yields.append("versions")
+
+        return yields
 
-        procResult = query_runner.call_procedure(
-            endpoint="gds.debug.arrow", custom_error=False, yields=debugYields
-        ).iloc[0]
+    @staticmethod
+    def from_debug_result(result: DataFrame) -> ArrowInfo:
+        row = result.iloc[0]
 
         return ArrowInfo(
-            listenAddress=procResult["listenAddress"],
-            enabled=procResult["enabled"],
-            running=procResult["running"],
-            versions=procResult.get("versions", []),
+            listenAddress=row["listenAddress"],
+            enabled=row["enabled"],
+            running=row["running"],
+            versions=row.get("versions", []),
         )
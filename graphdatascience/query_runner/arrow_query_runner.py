@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import warnings
-from typing import Any, Optional
+from typing import Any, Iterator, Optional, Union, cast
 
 from pandas import DataFrame
 
@@ -9,9 +9,11 @@ from ..call_parameters import CallParameters
 from ..query_runner.arrow_info import ArrowInfo
 from ..server_version.server_version import ServerVersion
 from .arrow_graph_constructor import ArrowGraphConstructor
-from .gds_arrow_client import GdsArrowClient
+from .arrow_result_format import ArrowResult, ArrowResultFormat
+from .gds_arrow_client import GdsArrowClient, PandasConversionOptions
 from .graph_constructor import GraphConstructor
-from .query_runner import QueryRunner
+from .query_runner import ProcedureCall, QueryRunner
+from .server_capabilities import ServerCapabilities
 
 
 class ArrowQueryRunner(QueryRunner):
@@ -24,6 +26,11 @@ class ArrowQueryRunner(QueryRunner):
         disable_server_verification: bool = False,
         tls_root_certs: Optional[bytes] = None,
         connection_string_override: Optional[str] = None,
+        pandas_conversion: Optional[PandasConversionOptions] = None,
+        parallel_streams: int = 1,
+        upload_window: int = 1,
+        compression: Optional[str] = None,
+        result_format: Union[str, ArrowResultFormat] = ArrowResultFormat.PANDAS,
     ) -> ArrowQueryRunner:
         if not arrow_info.enabled:
             raise ValueError("Arrow is not enabled on the server")
@@ -35,19 +42,45 @@ class ArrowQueryRunner(QueryRunner):
             disable_server_verification,
             tls_root_certs,
             connection_string_override,
+            pandas_conversion,
+            upload_window,
+            compression=compression,
+            result_format=result_format,
         )
 
-        return ArrowQueryRunner(gds_arrow_client, fallback_query_runner, fallback_query_runner.server_version())
+        return ArrowQueryRunner(
+            gds_arrow_client, fallback_query_runner, fallback_query_runner.server_version(), parallel_streams
+        )
+
+    _ARROW_ENDPOINTS = {
+        "gds.graph.streamNodeProperty",
+        "gds.graph.nodeProperty.stream",
+        "gds.graph.streamNodeProperties",
+        "gds.graph.nodeProperties.stream",
+        "gds.graph.streamRelationshipProperty",
+        "gds.graph.relationshipProperty.stream",
+        "gds.graph.streamRelationshipProperties",
+        "gds.graph.relationshipProperties.stream",
+        "gds.beta.graph.relationships.stream",
+        "gds.graph.relationships.stream",
+    }
+
+    # procedures which cannot change the labels or relationship types of the graphs in the catalog
+    _READ_ONLY_ENDPOINT_SUFFIXES = (".stream", ".stats", ".estimate", "gds.graph.list", "gds.graph.exists")
 
     def __init__(
         self,
         gds_arrow_client: GdsArrowClient,
         fallback_query_runner: QueryRunner,
         server_version: ServerVersion,
+        parallel_streams: int = 1,
     ):
         self._fallback_query_runner = fallback_query_runner
         self._gds_arrow_client = gds_arrow_client
         self._server_version = server_version
+        self._parallel_streams = parallel_streams
+        # the labels and relationship types of a graph, resolved for partitioning its streams
+        self._graph_schemas: dict[tuple[Optional[str], str], dict[str, list[str]]] = {}
 
     def warn_about_deprecation(self, old_endpoint: str, new_endpoint: str) -> None:
         warnings.warn(
@@ -61,11 +94,33 @@ class ArrowQueryRunner(QueryRunner):
         database: Optional[str] = None,
         custom_error: bool = True,
     ) -> DataFrame:
+        self._graph_schemas.clear()
         return self._fallback_query_runner.run_cypher(query, params, database, custom_error)
 
+    def run_cypher_iter(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+        chunk_size: int = 10_000,
+    ) -> Iterator[DataFrame]:
+        self._graph_schemas.clear()
+        return self._fallback_query_runner.run_cypher_iter(query, params, database, custom_error, chunk_size)
+
     def call_function(self, endpoint: str, params: Optional[CallParameters] = None) -> Any:
         return self._fallback_query_runner.call_function(endpoint, params)
 
+    def call_procedures(self, calls: list[ProcedureCall], database: Optional[str] = None) -> list[DataFrame]:
+        # calls streaming data over Arrow cannot be combined with the other calls
+        if any(call.endpoint in ArrowQueryRunner._ARROW_ENDPOINTS for call in calls):
+            return super().call_procedures(calls, database)
+
+        if not all(call.endpoint.endswith(ArrowQueryRunner._READ_ONLY_ENDPOINT_SUFFIXES) for call in calls):
+            self._graph_schemas.clear()
+
+        return self._fallback_query_runner.call_procedures(calls, database)
+
     def call_procedure(
         self,
         endpoint: str,
@@ -75,6 +130,30 @@ class ArrowQueryRunner(QueryRunner):
         logging: bool = False,
         custom_error: bool = True,
     ) -> DataFrame:
+        if endpoint in ArrowQueryRunner._ARROW_ENDPOINTS:
+            # procedures called by name return a DataFrame, as over Bolt, regardless of the configured result format
+            return cast(DataFrame, self._stream_over_arrow(endpoint, params, ArrowResultFormat.PANDAS))
+
+        if not endpoint.endswith(ArrowQueryRunner._READ_ONLY_ENDPOINT_SUFFIXES):
+            # the call might drop, replace or mutate a graph, so its resolved schema could be outdated
+            self._graph_schemas.clear()
+
+        return self._fallback_query_runner.call_procedure(endpoint, params, yields, database, logging, custom_error)
+
+    def call_stream_procedure(
+        self, endpoint: str, params: Optional[CallParameters] = None, database: Optional[str] = None
+    ) -> ArrowResult:
+        if endpoint in ArrowQueryRunner._ARROW_ENDPOINTS:
+            return self._stream_over_arrow(endpoint, params)
+
+        return self._fallback_query_runner.call_stream_procedure(endpoint, params, database)
+
+    def _stream_over_arrow(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters],
+        result_format: Optional[ArrowResultFormat] = None,
+    ) -> ArrowResult:
         if params is None:
             params = CallParameters()
 
@@ -94,7 +173,14 @@ class ArrowQueryRunner(QueryRunner):
             concurrency = params["config"].get("concurrency")
 
             return self._gds_arrow_client.get_node_properties(
-                graph_name, self._database_or_throw(), properties, node_labels, list_node_labels, concurrency
+                graph_name,
+                self._database_or_throw(),
+                properties,
+                self._partitionable_entities(graph_name, node_labels, "nodes"),
+                list_node_labels,
+                concurrency,
+                self._parallel_streams,
+                result_format,
             )
         elif (
             old_endpoint := ("gds.graph.streamNodeProperties" == endpoint)
@@ -111,7 +197,14 @@ class ArrowQueryRunner(QueryRunner):
             concurrency = params["config"].get("concurrency")
 
             return self._gds_arrow_client.get_node_properties(
-                graph_name, self._database_or_throw(), properties, node_labels, list_node_labels, concurrency
+                graph_name,
+                self._database_or_throw(),
+                properties,
+                self._partitionable_entities(graph_name, node_labels, "nodes"),
+                list_node_labels,
+                concurrency,
+                self._parallel_streams,
+                result_format,
             )
 
         elif (
@@ -129,7 +222,13 @@ class ArrowQueryRunner(QueryRunner):
             concurrency = params["config"].get("concurrency")
 
             return self._gds_arrow_client.get_relationship_properties(
-                graph_name, self._database_or_throw(), property_name, relationship_types, concurrency
+                graph_name,
+                self._database_or_throw(),
+                property_name,
+                self._partitionable_entities(graph_name, relationship_types, "relationships"),
+                concurrency,
+                self._parallel_streams,
+                result_format,
             )
         elif (
             old_endpoint := ("gds.graph.streamRelationshipProperties" == endpoint)
@@ -146,7 +245,13 @@ class ArrowQueryRunner(QueryRunner):
             concurrency = params["config"].get("concurrency")
 
             return self._gds_arrow_client.get_relationship_properties(
-                graph_name, self._database_or_throw(), property_name, relationship_types, concurrency
+                graph_name,
+                self._database_or_throw(),
+                property_name,
+                self._partitionable_entities(graph_name, relationship_types, "relationships"),
+                concurrency,
+                self._parallel_streams,
+                result_format,
             )
 
         elif (
@@ -163,14 +268,49 @@ class ArrowQueryRunner(QueryRunner):
             concurrency = params["config"].get("concurrency")
 
             return self._gds_arrow_client.get_relationships(
-                graph_name, self._database_or_throw(), relationship_types, concurrency
+                graph_name,
+                self._database_or_throw(),
+                self._partitionable_entities(graph_name, relationship_types, "relationships"),
+                concurrency,
+                self._parallel_streams,
+                result_format,
             )
 
-        return self._fallback_query_runner.call_procedure(endpoint, params, yields, database, logging, custom_error)
+        raise ValueError(f"The endpoint '{endpoint}' is not streamed over Arrow")
+
+    def _partitionable_entities(self, graph_name: str, entities: Any, schema_key: str) -> Any:
+        """
+        Resolves the `*` wildcard into the actual labels or relationship types of the graph,
+        so that the data can be downloaded in parallel streams partitioned by them.
+        The schema is looked up once per graph, until a call which might change the graph is made.
+        """
+        if self._parallel_streams < 2 or not isinstance(entities, list) or "*" not in entities:
+            return entities
+
+        key = (self.database(), graph_name)
+        if key not in self._graph_schemas:
+            schema = self._fallback_query_runner.call_procedure(
+                endpoint="gds.graph.list",
+                params=CallParameters(graph_name=graph_name),
+                yields=["schema"],
+                custom_error=False,
+            ).squeeze()
+            self._graph_schemas[key] = {
+                "nodes": list(schema["nodes"].keys()),
+                "relationships": list(schema["relationships"].keys()),
+            }
+
+        resolved_entities = self._graph_schemas[key][schema_key]
+
+        # graphs without labels or types use an internal placeholder which cannot be used as a filter
+        return resolved_entities if len(resolved_entities) > 1 else entities
 
     def server_version(self) -> ServerVersion:
         return self._fallback_query_runner.server_version()
 
+    def server_capabilities(self) -> ServerCapabilities:
+        return self._fallback_query_runner.server_capabilities()
+
     def driver_config(self) -> dict[str, Any]:
         return self._fallback_query_runner.driver_config()
 
@@ -206,6 +346,15 @@ class ArrowQueryRunner(QueryRunner):
         self._fallback_query_runner.close()
         self._gds_arrow_client.close()
 
+    def set_parallel_streams(self, parallel_streams: int) -> None:
+        self._parallel_streams = parallel_streams
+
+    def set_pandas_conversion(self, pandas_conversion: PandasConversionOptions) -> None:
+        self._gds_arrow_client.set_pandas_conversion(pandas_conversion)
+
+    def set_result_format(self, result_format: Union[str, ArrowResultFormat]) -> None:
+        self._gds_arrow_client.set_result_format(result_format)
+
     def fallback_query_runner(self) -> QueryRunner:
         return self._fallback_query_runner
 
@@ -216,6 +365,7 @@ class ArrowQueryRunner(QueryRunner):
         self, graph_name: str, concurrency: int, undirected_relationship_types: Optional[list[str]]
     ) -> GraphConstructor:
         database = self._database_or_throw()
+        self._graph_schemas.clear()
 
         return ArrowGraphConstructor(
             database,
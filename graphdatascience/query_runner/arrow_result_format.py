@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Union
+
+import numpy.typing as npt
+from pandas import DataFrame
+from pyarrow import Table
+
+if TYPE_CHECKING:
+    import polars
+
+
+class ArrowResultFormat(Enum):
+    """
+    The format in which results streamed over Arrow are returned.
+    """
+
+    PANDAS = "pandas"
+    ARROW = "arrow"
+    POLARS = "polars"
+    NUMPY = "numpy"
+
+    @staticmethod
+    def parse(result_format: str | ArrowResultFormat) -> ArrowResultFormat:
+        if isinstance(result_format, ArrowResultFormat):
+            return result_format
+
+        try:
+            return ArrowResultFormat(result_format.lower())
+        except ValueError:
+            supported = ", ".join(f"`{f.value}`" for f in ArrowResultFormat)
+            raise ValueError(f"Invalid result format `{result_format}`. Supported are {supported}")
+
+
+# A result streamed over Arrow in one of the formats above, a dict of numpy arrays per column for `numpy`
+ArrowResult = Union[DataFrame, Table, "polars.DataFrame", dict[str, "npt.NDArray[Any]"]]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional, cast
+
+from pandas import DataFrame
+
+from ..call_parameters import CallParameters
+from ..graph.graph_entity_ops_runner import GraphNodePropertiesRunner, GraphRelationshipPropertiesRunner
+from ..server_version.server_version import ServerVersion
+from .arrow_result_format import ArrowResult, ArrowResultFormat
+from .async_query_runner import AsyncQueryRunner
+from .gds_arrow_client import GdsArrowClient
+
+
+class AsyncArrowQueryRunner(AsyncQueryRunner):
+    """
+    Streams graph data over Arrow Flight and runs everything else on the fallback query runner.
+    The Flight client is blocking, so each transfer is run on the given executor and awaited.
+    """
+
+    _NODE_PROPERTY_ENDPOINTS = {
+        "gds.graph.nodeProperty.stream",
+        "gds.graph.nodeProperties.stream",
+    }
+    _RELATIONSHIP_PROPERTY_ENDPOINTS = {
+        "gds.graph.relationshipProperty.stream",
+        "gds.graph.relationshipProperties.stream",
+    }
+    _RELATIONSHIPS_ENDPOINTS = {
+        "gds.graph.relationships.stream",
+    }
+
+    def __init__(
+        self,
+        gds_arrow_client: GdsArrowClient,
+        fallback_query_runner: AsyncQueryRunner,
+        executor: Optional[Executor] = None,
+    ):
+        self._gds_arrow_client = gds_arrow_client
+        self._fallback_query_runner = fallback_query_runner
+        self._executor = executor
+
+    async def call_procedure(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[list[str]] = None,
+        database: Optional[str] = None,
+        logging: bool = False,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        if params is None:
+            params = CallParameters()
+
+        # the arguments are passed positionally, followed by the optional configuration
+        args = [value for key, value in params.items() if key != "config"]
+        config = params.get("config", {})
+
+        if endpoint in AsyncArrowQueryRunner._NODE_PROPERTY_ENDPOINTS:
+            graph_name, properties, *rest = args
+            node_labels = rest[0] if rest else ["*"]
+            result = await self._stream_in_executor(
+                self._gds_arrow_client.get_node_properties,
+                graph_name,
+                self._database_or_throw(),
+                properties,
+                node_labels,
+                config.get("listNodeLabels", False),
+                config.get("concurrency"),
+            )
+
+            # return the same layout as the procedure run via Cypher, like the synchronous client does
+            if "propertyValue" not in result.keys():
+                result = GraphNodePropertiesRunner._to_long_layout(result, config.get("listNodeLabels", False))
+            return result
+        elif endpoint in AsyncArrowQueryRunner._RELATIONSHIP_PROPERTY_ENDPOINTS:
+            graph_name, properties, *rest = args
+            relationship_types = rest[0] if rest else ["*"]
+            result = await self._stream_in_executor(
+                self._gds_arrow_client.get_relationship_properties,
+                graph_name,
+                self._database_or_throw(),
+                properties,
+                relationship_types,
+                config.get("concurrency"),
+            )
+
+            if "propertyValue" not in result.keys():
+                result = GraphRelationshipPropertiesRunner._to_long_layout(result)
+            return result
+        elif endpoint in AsyncArrowQueryRunner._RELATIONSHIPS_ENDPOINTS:
+            graph_name, *rest = args
+            relationship_types = rest[0] if rest else ["*"]
+            return await self._stream_in_executor(
+                self._gds_arrow_client.get_relationships,
+                graph_name,
+                self._database_or_throw(),
+                relationship_types,
+                config.get("concurrency"),
+            )
+
+        return await self._fallback_query_runner.call_procedure(
+            endpoint, params, yields, database, logging, custom_error
+        )
+
+    async def _stream_in_executor(self, func: Callable[..., ArrowResult], *args: Any) -> DataFrame:
+        loop = asyncio.get_running_loop()
+        # procedures are called by name, so their result is a DataFrame as over Bolt
+        stream = functools.partial(func, *args, result_format=ArrowResultFormat.PANDAS)
+        return cast(DataFrame, await loop.run_in_executor(self._executor, stream))
+
+    async def call_function(self, endpoint: str, params: Optional[CallParameters] = None) -> Any:
+        return await self._fallback_query_runner.call_function(endpoint, params)
+
+    async def run_cypher(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        return await self._fallback_query_runner.run_cypher(query, params, database, custom_error)
+
+    async def server_version(self) -> ServerVersion:
+        return await self._fallback_query_runner.server_version()
+
+    def encrypted(self) -> bool:
+        return self._fallback_query_runner.encrypted()
+
+    def set_database(self, database: str) -> None:
+        self._fallback_query_runner.set_database(database)
+
+    def database(self) -> Optional[str]:
+        return self._fallback_query_runner.database()
+
+    def set_show_progress(self, show_progress: bool) -> None:
+        self._fallback_query_runner.set_show_progress(show_progress)
+
+    def _database_or_throw(self) -> str:
+        database = self.database()
+        if not database:
+            raise ValueError(
+                "For this call you must have explicitly specified a valid Neo4j database to target, "
+                "using `AsyncGraphDataScience.set_database`."
+            )
+
+        return database
+
+    async def close(self) -> None:
+        self._gds_arrow_client.close()
+        await self._fallback_query_runner.close()
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any, Optional, Union
+
+import neo4j
+from pandas import DataFrame
+
+from ..call_parameters import CallParameters
+from ..error.endpoint_suggester import generate_suggestive_error_message
+from ..server_version.server_version import ServerVersion
+from ..version import __version__
+from .async_query_runner import AsyncQueryRunner
+from .neo4j_query_runner import Neo4jQueryRunner
+from .progress.async_query_progress_logger import AsyncQueryProgressLogger
+
+
+class AsyncNeo4jQueryRunner(AsyncQueryRunner):
+    _NEO4J_DRIVER_VERSION = Neo4jQueryRunner._NEO4J_DRIVER_VERSION
+
+    @staticmethod
+    def create(
+        endpoint: Union[str, neo4j.AsyncDriver],
+        auth: Optional[tuple[str, str]] = None,
+        database: Optional[str] = None,
+        bookmarks: Optional[Any] = None,
+        show_progress: bool = True,
+    ) -> AsyncNeo4jQueryRunner:
+        if AsyncNeo4jQueryRunner._NEO4J_DRIVER_VERSION < ServerVersion(5, 0, 0):
+            raise RuntimeError(
+                "The asynchronous client requires version 5.0.0 or later of the `neo4j` package, "
+                f"but version {AsyncNeo4jQueryRunner._NEO4J_DRIVER_VERSION} is installed."
+            )
+
+        if isinstance(endpoint, str):
+            config: dict[str, Any] = {"user_agent": f"neo4j-graphdatascience-v{__version__}"}
+
+            driver = neo4j.AsyncGraphDatabase.driver(endpoint, auth=auth, **config)
+
+            return AsyncNeo4jQueryRunner(
+                driver,
+                bookmarks=bookmarks,
+                database=database,
+                show_progress=show_progress,
+            )
+
+        elif isinstance(endpoint, neo4j.AsyncDriver):
+            return AsyncNeo4jQueryRunner(
+                endpoint,
+                bookmarks=bookmarks,
+                database=database,
+                show_progress=show_progress,
+            )
+
+        else:
+            raise ValueError(f"Invalid endpoint type: {type(endpoint)}")
+
+    def __init__(
+        self,
+        driver: neo4j.AsyncDriver,
+        database: Optional[str] = neo4j.DEFAULT_DATABASE,
+        bookmarks: Optional[Any] = None,
+        show_progress: bool = True,
+    ):
+        self._driver = driver
+        self._database = database
+        self._logger = logging.getLogger()
+        self._bookmarks = bookmarks
+        self._last_bookmarks: Optional[Any] = None
+        self._server_version: Optional[ServerVersion] = None
+        self._show_progress = show_progress
+        self._progress_logger = AsyncQueryProgressLogger(self.__run_cypher_for_progress_logger, self.server_version)
+
+    async def __run_cypher_for_progress_logger(self, query: str, database: Optional[str]) -> DataFrame:
+        return await self.run_cypher(query=query, database=database)
+
+    async def run_cypher(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        if params is None:
+            params = {}
+
+        if database is None:
+            database = self._database
+
+        async with self._driver.session(database=database, bookmarks=self._bookmarks) as session:
+            try:
+                result = await session.run(query, params)
+                df = await result.to_df()
+            except Exception as e:
+                if custom_error:
+                    await self.handle_driver_exception(session, e)
+                raise e
+
+            self._last_bookmarks = await session.last_bookmarks()
+
+            notifications = (await result.consume()).notifications
+            if notifications:
+                for notification in notifications:
+                    Neo4jQueryRunner._forward_cypher_warnings(notification, self._logger)
+
+            return df
+
+    async def call_function(self, endpoint: str, params: Optional[CallParameters] = None) -> Any:
+        if params is None:
+            params = CallParameters()
+        query = f"RETURN {endpoint}({params.placeholder_str()})"
+
+        return (await self.run_cypher(query, params)).squeeze()
+
+    async def call_procedure(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[list[str]] = None,
+        database: Optional[str] = None,
+        logging: bool = False,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        if params is None:
+            params = CallParameters()
+
+        yields_clause = "" if yields is None else " YIELD " + ", ".join(yields)
+        query = f"CALL {endpoint}({params.placeholder_str()}){yields_clause}"
+
+        async def run_cypher_query() -> DataFrame:
+            return await self.run_cypher(query, params, database, custom_error)
+
+        if self._show_progress and logging:
+            job_id = Neo4jQueryRunner._extract_or_create_job_id(params)
+            return await self._progress_logger.run_with_progress_logging(run_cypher_query, job_id, database)
+        else:
+            return await run_cypher_query()
+
+    async def server_version(self) -> ServerVersion:
+        if self._server_version:
+            return self._server_version
+
+        try:
+            server_version = ServerVersion.from_string(
+                (await self.run_cypher(Neo4jQueryRunner._SERVER_VERSION_QUERY, custom_error=False)).squeeze()
+            )
+        except Exception as e:
+            raise Neo4jQueryRunner._server_version_error(e, "Neo4j DBMS")
+
+        self._server_version = server_version
+        return server_version
+
+    @staticmethod
+    async def handle_driver_exception(session: neo4j.AsyncSession, e: Exception) -> None:
+        reg_gds_hit = re.search(
+            r"There is no procedure with the name `(gds(?:\.\w+)+)` registered for this database instance",
+            str(e),
+        )
+        if not reg_gds_hit:
+            return
+
+        requested_endpoint = reg_gds_hit.group(1)
+
+        list_result = await session.run("CALL gds.list() YIELD name")
+        all_endpoints = (await list_result.to_df())["name"].tolist()
+
+        raise SyntaxError(generate_suggestive_error_message(requested_endpoint, all_endpoints)) from e
+
+    def encrypted(self) -> bool:
+        return bool(self._driver.encrypted)
+
+    def set_database(self, database: str) -> None:
+        self._database = database
+
+    def database(self) -> Optional[str]:
+        return self._database
+
+    def set_bookmarks(self, bookmarks: Optional[Any]) -> None:
+        self._bookmarks = bookmarks
+
+    def bookmarks(self) -> Optional[Any]:
+        return self._bookmarks
+
+    def last_bookmarks(self) -> Optional[Any]:
+        return self._last_bookmarks
+
+    def set_show_progress(self, show_progress: bool) -> None:
+        self._show_progress = show_progress
+
+    async def close(self) -> None:
+        await self._driver.close()
@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from pandas import DataFrame
+
+from ..call_parameters import CallParameters
+from ..server_version.server_version import ServerVersion
+
+
+class AsyncQueryRunner(ABC):
+    @abstractmethod
+    async def call_procedure(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[list[str]] = None,
+        database: Optional[str] = None,
+        logging: bool = False,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        pass
+
+    @abstractmethod
+    async def call_function(self, endpoint: str, params: Optional[CallParameters] = None) -> Any:
+        pass
+
+    @abstractmethod
+    async def run_cypher(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        pass
+
+    @abstractmethod
+    async def server_version(self) -> ServerVersion:
+        pass
+
+    @abstractmethod
+    def encrypted(self) -> bool:
+        pass
+
+    @abstractmethod
+    def set_database(self, database: str) -> None:
+        pass
+
+    @abstractmethod
+    def database(self) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def set_show_progress(self, show_progress: bool) -> None:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
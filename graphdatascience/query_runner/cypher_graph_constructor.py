@@ -1,14 +1,12 @@
 import itertools
-import os
 import warnings
 from dataclasses import dataclass
-from typing import Any, Optional
-from uuid import uuid4
+from typing import Any, Optional, Sequence
 
-from pandas import DataFrame, concat
+from pandas import DataFrame
 
 from ..server_version.server_version import ServerVersion
-from .graph_constructor import GraphConstructor
+from .graph_constructor import GraphConstructor, GraphData
 from .query_runner import QueryRunner
 
 
@@ -20,6 +18,8 @@ class CypherProjectionApi:
     TARGET_NODE_PROPERTIES = "targetNodeProperties"
     REL_PROPERTIES = "properties"
     REL_PROPERTIES_NEW = "relationshipProperties"
+    SOURCE_NODE_ID = "sourceNodeId"
+    TARGET_NODE_ID = "targetNodeId"
 
 
 @dataclass
@@ -66,7 +66,23 @@ class CypherGraphConstructor(GraphConstructor):
         self._server_version = server_version
         self._undirected_relationship_types = undirected_relationship_types
 
-    def run(self, node_dfs: list[DataFrame], relationship_dfs: list[DataFrame]) -> None:
+    def run(
+        self,
+        nodes: Sequence[GraphData],
+        relationships: Sequence[GraphData],
+        batch_size: Optional[int] = None,
+    ) -> None:
+        self._validate_batch_size(batch_size)
+        if batch_size is not None:
+            # a Cypher aggregation projects the whole graph in one query, so it cannot be split into transactions
+            raise ValueError(
+                "Graph construction in batches requires Apache Arrow. "
+                "Without Arrow, all rows are projected in a single transaction."
+            )
+
+        node_dfs = self._to_dfs(nodes)
+        relationship_dfs = self._to_dfs(relationships)
+
         if self._should_warn_about_arrow_missing():
             warnings.warn(
                 "GDS Enterprise users can use Apache Arrow for fast graph construction; please see the documentation "
@@ -103,26 +119,10 @@ class CypherGraphConstructor(GraphConstructor):
             )
 
     def _should_warn_about_arrow_missing(self) -> bool:
-        try:
-            license: str = self._query_runner.run_cypher(
-                "CALL gds.debug.sysInfo() YIELD key, value WHERE key = 'gdsEdition' RETURN value", custom_error=False
-            ).squeeze()
-            should_warn = license == "Licensed"
-        except Exception as e:
-            # It's not a user's concern whether Arrow is set up or not in AuraDS.
-            if (
-                "There is no procedure with the name `gds.debug.sysInfo` "
-                "registered for this database instance." in str(e)
-            ):
-                should_warn = False
-            else:
-                raise e
-
-        return should_warn
+        # It's not a user's concern whether Arrow is set up or not in AuraDS, which has no edition.
+        return self._query_runner.server_capabilities().edition() == "Licensed"
 
     class CypherProjectionRunner:
-        _BIT_COL_SUFFIX = "_is_present" + str(uuid4())
-
         def __init__(
             self,
             query_runner: QueryRunner,
@@ -156,34 +156,23 @@ class CypherGraphConstructor(GraphConstructor):
                 else CypherProjectionApi.REL_PROPERTIES
             )
 
-            aligned_node_dfs = self.adjust_node_dfs(node_dfs, graph_schema, rel_properties_key)
-            aligned_rel_dfs = self.adjust_rel_dfs(relationship_dfs, graph_schema, rel_properties_key)
+            aligned_node_columns = self.adjust_node_dfs(node_dfs, graph_schema, rel_properties_key)
+            aligned_rel_columns = self.adjust_rel_dfs(relationship_dfs, graph_schema, rel_properties_key)
 
-            # concat instead of join as we want to first have all nodes and then the rels
+            # each column is sent as its own list parameter, first all nodes and then the rels
             # this way we don't duplicate the node property data and its cheaper
-            combined_df: DataFrame = concat(aligned_node_dfs + aligned_rel_dfs, ignore_index=True, copy=False)
+            aligned_columns = aligned_node_columns + aligned_rel_columns
             # sort the columns to ensure the order is the same (for testing)
-            combined_df.sort_index(axis="columns", inplace=True)
-            # using a list and not a set to preserve the order
-            combined_cols: list[str] = combined_df.columns.tolist()
+            combined_cols: list[str] = sorted(aligned_columns[0].keys()) if aligned_columns else []
+            columns: dict[str, list[Any]] = {
+                col: list(itertools.chain.from_iterable(aligned[col] for aligned in aligned_columns))
+                for col in combined_cols
+            }
 
-            property_clauses: list[str] = [
-                self.check_value_clause(combined_cols, prop_col)
-                for prop_col in [CypherProjectionApi.SOURCE_NODE_PROPERTIES, rel_properties_key]
+            value_clauses = [
+                self.value_clause(col) for col in combined_cols if col != CypherProjectionApi.SOURCE_NODE_ID
             ]
 
-            source_node_labels_clause = (
-                self.check_value_clause(combined_cols, CypherProjectionApi.SOURCE_NODE_LABEL)
-                if CypherProjectionApi.SOURCE_NODE_LABEL in combined_cols
-                else ""
-            )
-            rel_type_clause = (
-                self.check_value_clause(combined_cols, "relationshipType")
-                if "relationshipType" in combined_cols
-                else ""
-            )
-            target_id_clause = self.check_value_clause(combined_cols, "targetNodeId")
-
             nodes_config_part = self.nodes_config_part(graph_schema.nodes_per_df, is_cypher_projection_v2)
             rels_config_part = self.rels_config_part(graph_schema.rels_per_df, rel_properties_key)
 
@@ -192,16 +181,14 @@ class CypherGraphConstructor(GraphConstructor):
             else:
                 data_config = f"{{{', '.join(nodes_config_part)}}}, {{{', '.join(rels_config_part)}}}"
 
-            property_clauses_str = f"{os.linesep}" if len(property_clauses) > 0 else ""
-            property_clauses_str += f"{os.linesep}".join(property_clauses)[:-2]  # remove the final comma
-
             tier = "" if is_cypher_projection_v2 else ".alpha"
 
+            # the rows are reassembled on the server, absent values are sent as null
             query = (
-                "UNWIND $data AS data"
-                f" WITH data, {source_node_labels_clause}{rel_type_clause}{target_id_clause}{property_clauses_str}"
+                f"UNWIND range(0, size(${CypherProjectionApi.SOURCE_NODE_ID}) - 1) AS i"
+                f" WITH i, {', '.join(value_clauses)}"
                 f" RETURN gds{tier}.graph.project("
-                f"$graph_name, data[{combined_cols.index('sourceNodeId')}], targetNodeId, "
+                f"$graph_name, ${CypherProjectionApi.SOURCE_NODE_ID}[i], {CypherProjectionApi.TARGET_NODE_ID}, "
                 f"{data_config}, $configuration)"
             )
 
@@ -213,21 +200,16 @@ class CypherGraphConstructor(GraphConstructor):
             self._query_runner.run_cypher(
                 query,
                 {
-                    "data": combined_df.values.tolist(),
+                    **columns,
                     "graph_name": self._graph_name,
                     "configuration": configuration,
                 },
                 custom_error=False,
             )
 
-        def check_value_clause(self, combined_cols: list[str], col: str) -> str:
-            return (
-                f"CASE"
-                f" WHEN data[{combined_cols.index(col + self._BIT_COL_SUFFIX)}]"
-                f" THEN data[{combined_cols.index(col)}]"
-                f" ELSE null"
-                f" END AS {col}, "
-            )
+        @staticmethod
+        def value_clause(col: str) -> str:
+            return f"${col}[i] AS {col}"
 
         def schema(self, node_dfs: list[DataFrame], rel_dfs: list[DataFrame]) -> GraphColumnSchema:
             node_schema = []
@@ -246,75 +228,67 @@ class CypherGraphConstructor(GraphConstructor):
 
         def adjust_node_dfs(
             self, node_dfs: list[DataFrame], schema: GraphColumnSchema, rel_properties_key: str
-        ) -> list[DataFrame]:
-            adjusted_dfs = []
+        ) -> list[dict[str, list[Any]]]:
+            adjusted_columns = []
 
             for i, df in enumerate(node_dfs):
-                node_dict: dict[str, Any] = {
-                    "sourceNodeId": df["nodeId"],
-                    "targetNodeId": -1,
-                    f"targetNodeId{self._BIT_COL_SUFFIX}": False,
+                absent = [None] * len(df)
+                node_columns: dict[str, list[Any]] = {
+                    CypherProjectionApi.SOURCE_NODE_ID: df["nodeId"].tolist(),
+                    CypherProjectionApi.TARGET_NODE_ID: absent,
+                    CypherProjectionApi.SOURCE_NODE_PROPERTIES: self.collect_properties(
+                        df, schema.nodes_per_df[i].properties
+                    ),
+                    rel_properties_key: absent,
                 }
 
                 if CypherProjectionApi.RELATIONSHIP_TYPE in schema.all_rels.all:
-                    node_dict[CypherProjectionApi.RELATIONSHIP_TYPE] = None
-                    node_dict[CypherProjectionApi.RELATIONSHIP_TYPE + self._BIT_COL_SUFFIX] = False
+                    node_columns[CypherProjectionApi.RELATIONSHIP_TYPE] = absent
 
                 if "labels" in schema.nodes_per_df[i].all:
-                    node_dict[CypherProjectionApi.SOURCE_NODE_LABEL + self._BIT_COL_SUFFIX] = True
-                    node_dict[CypherProjectionApi.SOURCE_NODE_LABEL] = df["labels"]
+                    node_columns[CypherProjectionApi.SOURCE_NODE_LABEL] = df["labels"].tolist()
                 elif "labels" in schema.all_nodes.all:
-                    node_dict[CypherProjectionApi.SOURCE_NODE_LABEL + self._BIT_COL_SUFFIX] = False
-                    node_dict[CypherProjectionApi.SOURCE_NODE_LABEL] = ""
-
-                def collect_to_dict(row: dict[str, Any]) -> dict[str, Any]:
-                    return {column: row[column] for column in schema.nodes_per_df[i].properties}
-
-                node_dict_df = DataFrame(node_dict)
-                node_dict_df[CypherProjectionApi.SOURCE_NODE_PROPERTIES] = df.apply(collect_to_dict, axis=1)
-                node_dict_df[CypherProjectionApi.SOURCE_NODE_PROPERTIES + self._BIT_COL_SUFFIX] = True
-                node_dict_df[rel_properties_key] = None
-                node_dict_df[rel_properties_key + self._BIT_COL_SUFFIX] = False
+                    node_columns[CypherProjectionApi.SOURCE_NODE_LABEL] = absent
 
-                adjusted_dfs.append(node_dict_df)
+                adjusted_columns.append(node_columns)
 
-            return adjusted_dfs
+            return adjusted_columns
 
         def adjust_rel_dfs(
             self, rel_dfs: list[DataFrame], schema: GraphColumnSchema, rel_properties_key: str
-        ) -> list[DataFrame]:
-            adjusted_dfs = []
+        ) -> list[dict[str, list[Any]]]:
+            adjusted_columns = []
 
             for i, df in enumerate(rel_dfs):
-                rel_dict: dict[str, Any] = {
-                    "sourceNodeId": df["sourceNodeId"],
-                    "targetNodeId": df["targetNodeId"],
-                    f"targetNodeId{self._BIT_COL_SUFFIX}": True,
+                absent = [None] * len(df)
+                rel_columns: dict[str, list[Any]] = {
+                    CypherProjectionApi.SOURCE_NODE_ID: df["sourceNodeId"].tolist(),
+                    CypherProjectionApi.TARGET_NODE_ID: df["targetNodeId"].tolist(),
+                    rel_properties_key: self.collect_properties(df, schema.rels_per_df[i].properties),
+                    CypherProjectionApi.SOURCE_NODE_PROPERTIES: absent,
                 }
 
                 if CypherProjectionApi.RELATIONSHIP_TYPE in schema.rels_per_df[i].all:
-                    rel_dict[CypherProjectionApi.RELATIONSHIP_TYPE + self._BIT_COL_SUFFIX] = True
-                    rel_dict[CypherProjectionApi.RELATIONSHIP_TYPE] = df[CypherProjectionApi.RELATIONSHIP_TYPE]
+                    rel_columns[CypherProjectionApi.RELATIONSHIP_TYPE] = df[
+                        CypherProjectionApi.RELATIONSHIP_TYPE
+                    ].tolist()
                 elif CypherProjectionApi.RELATIONSHIP_TYPE in schema.all_rels.all:
-                    rel_dict[CypherProjectionApi.RELATIONSHIP_TYPE + self._BIT_COL_SUFFIX] = False
-                    rel_dict[CypherProjectionApi.RELATIONSHIP_TYPE] = None
+                    rel_columns[CypherProjectionApi.RELATIONSHIP_TYPE] = absent
 
                 if "labels" in schema.all_nodes.all:
-                    rel_dict[CypherProjectionApi.SOURCE_NODE_LABEL] = None
-                    rel_dict[CypherProjectionApi.SOURCE_NODE_LABEL + self._BIT_COL_SUFFIX] = False
+                    rel_columns[CypherProjectionApi.SOURCE_NODE_LABEL] = absent
 
-                def collect_to_dict(row: dict[str, Any]) -> dict[str, Any]:
-                    return {column: row[column] for column in schema.rels_per_df[i].properties}
+                adjusted_columns.append(rel_columns)
 
-                rel_dict_df = DataFrame(rel_dict)
-                rel_dict_df[rel_properties_key] = df.apply(collect_to_dict, axis=1)
-                rel_dict_df[rel_properties_key + self._BIT_COL_SUFFIX] = True
-                rel_dict_df[CypherProjectionApi.SOURCE_NODE_PROPERTIES] = None
-                rel_dict_df[CypherProjectionApi.SOURCE_NODE_PROPERTIES + self._BIT_COL_SUFFIX] = False
+            return adjusted_columns
 
-                adjusted_dfs.append(rel_dict_df)
+        @staticmethod
+        def collect_properties(df: DataFrame, properties: set[str]) -> list[dict[str, Any]]:
+            if not properties:
+                return [{} for _ in range(len(df))]
 
-            return adjusted_dfs
+            # converts column by column, instead of calling back into Python for every row
+            return df[list(properties)].to_dict("records")  # type: ignore
 
         def nodes_config_part(self, node_cols: list[EntityColumnSchema], is_cypher_projection_v2: bool) -> list[str]:
             # Cannot use a dictionary as we need to refer to the `data` variable in the cypher query.
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
 import base64
+import itertools
 import json
 import re
+import threading
 import time
 import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from types import TracebackType
-from typing import Any, Callable, Dict, Iterable, Optional, Type, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Type, Union
 
+import numpy
+import numpy.typing as npt
+import pandas
 import pyarrow
 from neo4j.exceptions import ClientError
 from pandas import DataFrame
-from pyarrow import Array, ChunkedArray, DictionaryArray, RecordBatch, Table, chunked_array, flight
+from pyarrow import Array, ChunkedArray, DictionaryArray, RecordBatch, Table, chunked_array, flight, ipc
 from pyarrow import __version__ as arrow_version
 from pyarrow.flight import ClientMiddleware, ClientMiddlewareFactory
 from pyarrow.types import is_dictionary
@@ -21,6 +28,7 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt, stop_af
 from ..version import __version__
 from .arrow_endpoint_version import ArrowEndpointVersion
 from .arrow_info import ArrowInfo
+from .arrow_result_format import ArrowResult, ArrowResultFormat
 
 
 class GdsArrowClient:
@@ -32,6 +40,10 @@ class GdsArrowClient:
         disable_server_verification: bool = False,
         tls_root_certs: Optional[bytes] = None,
         connection_string_override: Optional[str] = None,
+        pandas_conversion: Optional[PandasConversionOptions] = None,
+        upload_window: int = 1,
+        compression: Optional[str] = None,
+        result_format: Union[str, ArrowResultFormat] = ArrowResultFormat.PANDAS,
     ) -> GdsArrowClient:
         connection_string: str
         if connection_string_override is not None:
@@ -51,6 +63,10 @@ class GdsArrowClient:
             disable_server_verification,
             tls_root_certs,
             arrow_endpoint_version,
+            pandas_conversion=pandas_conversion,
+            upload_window=upload_window,
+            compression=compression,
+            result_format=result_format,
         )
 
     def __init__(
@@ -63,6 +79,10 @@ class GdsArrowClient:
         tls_root_certs: Optional[bytes] = None,
         arrow_endpoint_version: ArrowEndpointVersion = ArrowEndpointVersion.V1,
         user_agent: Optional[str] = None,
+        pandas_conversion: Optional[PandasConversionOptions] = None,
+        upload_window: int = 1,
+        compression: Optional[str] = None,
+        result_format: Union[str, ArrowResultFormat] = ArrowResultFormat.PANDAS,
     ):
         """Creates a new GdsArrowClient instance.
 
@@ -84,7 +104,25 @@ class GdsArrowClient:
             The version of the Arrow endpoint to use (default is ArrowEndpointVersion.V1)
         user_agent: Optional[str]
             The user agent string to use for the connection. (default is `neo4j-graphdatascience-v[VERSION] pyarrow-v[PYARROW_VERSION])
+        pandas_conversion: Optional[PandasConversionOptions]
+            Options for converting Arrow results into pandas DataFrames (default is the pyarrow default conversion)
+        upload_window: int
+            The maximum number of uploaded batches that may be awaiting an acknowledgement from the server.
+            Larger windows hide the network latency of the acknowledgements (default is 1)
+        compression: Optional[str]
+            The codec used to compress the record batch bodies of uploads, either `lz4` or `zstd`.
+            The server must support the codec. Compressed downloads are decompressed transparently (default is None)
+        result_format: Union[str, ArrowResultFormat]
+            The format of streamed results, one of `pandas`, `arrow`, `polars` or `numpy` (default is `pandas`)
         """
+        if upload_window < 1:
+            raise ValueError(f"The upload window must be at least 1, but was {upload_window}")
+        if compression is not None:
+            if compression not in ["lz4", "zstd"]:
+                raise ValueError(f"Invalid compression `{compression}`. Supported are `lz4` and `zstd`")
+            if not pyarrow.Codec.is_available(compression):
+                raise ValueError(f"The compression `{compression}` is not available in the installed pyarrow")
+
         self._arrow_endpoint_version = arrow_endpoint_version
         self._host = host
         self._port = port
@@ -93,11 +131,19 @@ class GdsArrowClient:
         self._disable_server_verification = disable_server_verification
         self._tls_root_certs = tls_root_certs
         self._user_agent = user_agent
+        self._pandas_conversion = pandas_conversion if pandas_conversion else PandasConversionOptions()
+        self._upload_window = upload_window
+        self._compression = compression
+        self._result_format = ArrowResultFormat.parse(result_format)
 
         if auth:
             self._auth_middleware = AuthMiddleware(auth)
 
         self._flight_client = self._instantiate_flight_client()
+        # additional clients with their own connections, used for concurrent streams
+        self._pooled_flight_clients: list[flight.FlightClient] = []
+        self._pool_lock = threading.Lock()
+        self._pool_counter = itertools.count()
 
     def _instantiate_flight_client(self) -> flight.FlightClient:
         location = (
@@ -105,7 +151,11 @@ class GdsArrowClient:
             if self._encrypted
             else flight.Location.for_grpc_tcp(self._host, self._port)
         )
-        client_options: dict[str, Any] = {"disable_server_verification": self._disable_server_verification}
+        client_options: dict[str, Any] = {
+            "disable_server_verification": self._disable_server_verification,
+            # do not share the connection with other clients to the same server
+            "generic_options": [("grpc.use_local_subchannel_pool", 1)],
+        }
         if self._auth:
             user_agent = f"neo4j-graphdatascience-v{__version__} pyarrow-v{arrow_version}"
             if self._user_agent:
@@ -119,6 +169,22 @@ class GdsArrowClient:
             client_options["tls_root_certs"] = self._tls_root_certs
         return flight.FlightClient(location, **client_options)
 
+    def ensure_client_pool_size(self, size: int) -> None:
+        """
+        Makes sure that at least `size` connections to the server are available for concurrent streams.
+
+        All pooled connections share the same authentication token.
+
+        Parameters
+        ----------
+        size: int
+            The minimum number of connections used for concurrent streams
+        """
+        self._client()
+        with self._pool_lock:
+            while len(self._pooled_flight_clients) + 1 < size:
+                self._pooled_flight_clients.append(self._instantiate_flight_client())
+
     def connection_info(self) -> tuple[str, int]:
         """
         Returns the host and port of the GDS Arrow server.
@@ -130,16 +196,45 @@ class GdsArrowClient:
         """
         return self._host, self._port
 
+    def set_pandas_conversion(self, pandas_conversion: PandasConversionOptions) -> None:
+        """
+        Sets the options used for converting Arrow results into pandas DataFrames.
+
+        Parameters
+        ----------
+        pandas_conversion: PandasConversionOptions
+            The conversion options to use for subsequent results
+        """
+        self._pandas_conversion = pandas_conversion
+
+    def set_result_format(self, result_format: Union[str, ArrowResultFormat]) -> None:
+        """
+        Sets the format in which streamed results are returned.
+
+        Parameters
+        ----------
+        result_format: Union[str, ArrowResultFormat]
+            One of `pandas` for a pandas DataFrame, `arrow` for the unconverted pyarrow Table,
+            `polars` for a polars DataFrame or `numpy` for a dict of numpy arrays per column
+        """
+        self._result_format = ArrowResultFormat.parse(result_format)
+
     def request_token(self) -> Optional[str]:
         """
         Requests a token from the server and returns it.
 
+        A previously received token is reused as long as it is valid for at least half of its lifetime.
+
         Returns
         -------
         Optional[str]
             a token from the server and returns it.
         """
         if self._auth:
+            token = self._auth_middleware.token(min_remaining_lifetime=AuthMiddleware.TOKEN_LIFETIME / 2)
+            if token:
+                return token
+
             client = self._client()
             client.authenticate_basic_token(self._auth[0], self._auth[1])
             return self._auth_middleware.token()
@@ -154,7 +249,9 @@ class GdsArrowClient:
         node_labels: Optional[list[str]] = None,
         list_node_labels: bool = False,
         concurrency: Optional[int] = None,
-    ) -> DataFrame:
+        parallel_streams: Optional[int] = None,
+        result_format: Optional[Union[str, ArrowResultFormat]] = None,
+    ) -> ArrowResult:
         """
         Get node properties from the graph.
 
@@ -172,29 +269,74 @@ class GdsArrowClient:
             A flag that indicates whether the node labels should be included in the result
         concurrency : Optional[int]
             The number of threads used on the server side when serving the data
+        parallel_streams : Optional[int]
+            The maximum number of streams used to download the data in parallel.
+            The data is partitioned by the given node labels, so at most one stream per node label is used.
+        result_format : Optional[Union[str, ArrowResultFormat]]
+            The format of the result, overriding the configured result format
 
         Returns
         -------
-        DataFrame
-            The requested node property as a DataFrame
+        ArrowResult
+            The requested node property as a DataFrame, or in the configured result format
         """
-        config: dict[str, Any] = {
-            "list_node_labels": list_node_labels,
-        }
+        proc, config = self._node_properties_command(node_properties, node_labels, list_node_labels)
+
+        if parallel_streams and parallel_streams > 1:
+            return self._do_get_partitioned(
+                database,
+                graph_name,
+                proc,
+                concurrency,
+                config,
+                "node_labels",
+                parallel_streams,
+                "nodeId",
+                result_format=result_format,
+            )
 
-        if isinstance(node_properties, str):
-            config["node_property"] = node_properties
-            proc = "gds.graph.nodeProperty.stream"
-        else:
-            config["node_properties"] = node_properties
-            proc = "gds.graph.nodeProperties.stream"
+        return self._do_get(database, graph_name, proc, concurrency, config, result_format)
 
-        if node_labels:
-            config["node_labels"] = node_labels
+    def get_node_properties_iter(
+        self,
+        graph_name: str,
+        database: str,
+        node_properties: Union[str, list[str]],
+        node_labels: Optional[list[str]] = None,
+        list_node_labels: bool = False,
+        concurrency: Optional[int] = None,
+    ) -> Iterator[RecordBatch]:
+        """
+        Get node properties from the graph as a stream of record batches.
 
-        return self._do_get(database, graph_name, proc, concurrency, config)
+        The batches are yielded as soon as they are received from the server,
+        so that the result can be processed without holding it in memory at once.
 
-    def get_node_labels(self, graph_name: str, database: str, concurrency: Optional[int] = None) -> DataFrame:
+        Parameters
+        ----------
+        graph_name : str
+            The name of the graph
+        database : str
+            The name of the database to which the graph belongs
+        node_properties : Union[str, List[str]]
+            The name of the node properties to retrieve
+        node_labels : Optional[List[str]]
+            A list of node labels to filter the nodes
+        list_node_labels : bool
+            A flag that indicates whether the node labels should be included in the result
+        concurrency : Optional[int]
+            The number of threads used on the server side when serving the data
+
+        Returns
+        -------
+        Iterator[RecordBatch]
+            The requested node properties as an iterator of record batches
+        """
+        proc, config = self._node_properties_command(node_properties, node_labels, list_node_labels)
+
+        return self._do_get_iter(database, graph_name, proc, concurrency, config)
+
+    def get_node_labels(self, graph_name: str, database: str, concurrency: Optional[int] = None) -> ArrowResult:
         """
         Get all nodes and their labels from the graph.
 
@@ -209,17 +351,67 @@ class GdsArrowClient:
 
         Returns
         -------
-        DataFrame
-            The requested nodes as a DataFrame
+        ArrowResult
+            The requested nodes as a DataFrame, or in the configured result format
         """
         return self._do_get(database, graph_name, "gds.graph.nodeLabels.stream", concurrency, {})
 
     def get_relationships(
-        self, graph_name: str, database: str, relationship_types: list[str], concurrency: Optional[int] = None
-    ) -> DataFrame:
+        self,
+        graph_name: str,
+        database: str,
+        relationship_types: list[str],
+        concurrency: Optional[int] = None,
+        parallel_streams: Optional[int] = None,
+        result_format: Optional[Union[str, ArrowResultFormat]] = None,
+    ) -> ArrowResult:
         """
         Get relationships from the graph.
 
+        Parameters
+        ----------
+        graph_name : str
+            The name of the graph
+        database : str
+            The name of the database to which the graph belongs
+        relationship_types : List[str]
+            The name of the relationship types to retrieve
+        concurrency : Optional[int]
+            The number of threads used on the server side when serving the data
+        parallel_streams : Optional[int]
+            The maximum number of streams used to download the data in parallel.
+            The data is partitioned by the given relationship types, so at most one stream per type is used.
+        result_format : Optional[Union[str, ArrowResultFormat]]
+            The format of the result, overriding the configured result format
+
+        Returns
+        -------
+        ArrowResult
+            The requested relationships as a DataFrame, or in the configured result format
+        """
+        proc = "gds.graph.relationships.stream"
+        config = {"relationship_types": relationship_types}
+
+        if parallel_streams and parallel_streams > 1:
+            return self._do_get_partitioned(
+                database,
+                graph_name,
+                proc,
+                concurrency,
+                config,
+                "relationship_types",
+                parallel_streams,
+                result_format=result_format,
+            )
+
+        return self._do_get(database, graph_name, proc, concurrency, config, result_format)
+
+    def get_relationships_iter(
+        self, graph_name: str, database: str, relationship_types: list[str], concurrency: Optional[int] = None
+    ) -> Iterator[RecordBatch]:
+        """
+        Get relationships from the graph as a stream of record batches.
+
         Parameters
         ----------
         graph_name : str
@@ -233,10 +425,10 @@ class GdsArrowClient:
 
         Returns
         -------
-        DataFrame
-            The requested relationships as a DataFrame
+        Iterator[RecordBatch]
+            The requested relationships as an iterator of record batches
         """
-        return self._do_get(
+        return self._do_get_iter(
             database,
             graph_name,
             "gds.graph.relationships.stream",
@@ -251,7 +443,9 @@ class GdsArrowClient:
         relationship_properties: Union[str, list[str]],
         relationship_types: list[str],
         concurrency: Optional[int] = None,
-    ) -> DataFrame:
+        parallel_streams: Optional[int] = None,
+        result_format: Optional[Union[str, ArrowResultFormat]] = None,
+    ) -> ArrowResult:
         """
         Get relationships and their properties from the graph.
 
@@ -267,12 +461,90 @@ class GdsArrowClient:
             The name of the relationship types to retrieve
         concurrency : Optional[int]
             The number of threads used on the server side when serving the data
+        parallel_streams : Optional[int]
+            The maximum number of streams used to download the data in parallel.
+            The data is partitioned by the given relationship types, so at most one stream per type is used.
+        result_format : Optional[Union[str, ArrowResultFormat]]
+            The format of the result, overriding the configured result format
 
         Returns
         -------
-        DataFrame
-            The requested relationships as a DataFrame
+        ArrowResult
+            The requested relationships as a DataFrame, or in the configured result format
         """
+        proc, config = self._relationship_properties_command(relationship_properties, relationship_types)
+
+        if parallel_streams and parallel_streams > 1:
+            return self._do_get_partitioned(
+                database,
+                graph_name,
+                proc,
+                concurrency,
+                config,
+                "relationship_types",
+                parallel_streams,
+                result_format=result_format,
+            )
+
+        return self._do_get(database, graph_name, proc, concurrency, config, result_format)
+
+    def get_relationship_properties_iter(
+        self,
+        graph_name: str,
+        database: str,
+        relationship_properties: Union[str, list[str]],
+        relationship_types: list[str],
+        concurrency: Optional[int] = None,
+    ) -> Iterator[RecordBatch]:
+        """
+        Get relationships and their properties from the graph as a stream of record batches.
+
+        Parameters
+        ----------
+        graph_name : str
+            The name of the graph
+        database : str
+            The name of the database to which the graph belongs
+        relationship_properties : Union[str, List[str]]
+            The name of the relationship properties to retrieve
+        relationship_types : List[str]
+            The name of the relationship types to retrieve
+        concurrency : Optional[int]
+            The number of threads used on the server side when serving the data
+
+        Returns
+        -------
+        Iterator[RecordBatch]
+            The requested relationships as an iterator of record batches
+        """
+        proc, config = self._relationship_properties_command(relationship_properties, relationship_types)
+
+        return self._do_get_iter(database, graph_name, proc, concurrency, config)
+
+    @staticmethod
+    def _node_properties_command(
+        node_properties: Union[str, list[str]], node_labels: Optional[list[str]], list_node_labels: bool
+    ) -> tuple[str, dict[str, Any]]:
+        config: dict[str, Any] = {
+            "list_node_labels": list_node_labels,
+        }
+
+        if isinstance(node_properties, str):
+            config["node_property"] = node_properties
+            proc = "gds.graph.nodeProperty.stream"
+        else:
+            config["node_properties"] = node_properties
+            proc = "gds.graph.nodeProperties.stream"
+
+        if node_labels:
+            config["node_labels"] = node_labels
+
+        return proc, config
+
+    @staticmethod
+    def _relationship_properties_command(
+        relationship_properties: Union[str, list[str]], relationship_types: list[str]
+    ) -> tuple[str, dict[str, Any]]:
         config: dict[str, Any] = {}
         if isinstance(relationship_properties, str):
             config = {"relationship_property": relationship_properties}
@@ -284,7 +556,7 @@ class GdsArrowClient:
         if relationship_types:
             config["relationship_types"] = relationship_types
 
-        return self._do_get(database, graph_name, proc, concurrency, config)
+        return proc, config
 
     def create_graph(
         self,
@@ -491,10 +763,16 @@ class GdsArrowClient:
         node_data: Union[pyarrow.Table, Iterable[pyarrow.RecordBatch], DataFrame],
         batch_size: int = 10_000,
         progress_callback: Callable[[int], None] = lambda x: None,
+        target_batch_bytes: Optional[int] = None,
     ) -> None:
         """
         Uploads node data to the server.
 
+        If the upload stream fails with a transient connection error while no sent batch is awaiting its
+        acknowledgement, the upload continues on a new stream after the last acknowledged batch.
+        If a sent batch was not acknowledged, the server might have applied it, so the upload fails instead of
+        sending it again.
+
         Parameters
         ----------
         graph_name : str
@@ -505,8 +783,11 @@ class GdsArrowClient:
             The number of rows per batch
         progress_callback : Callable[[int], None]
             A callback function that is called with the number of rows uploaded after each batch
+        target_batch_bytes : Optional[int]
+            The approximate size of each batch in bytes. If set, the number of rows per batch is derived from the
+            in-memory size of the data instead of using `batch_size`. Does not apply to already batched data
         """
-        self._upload_data(graph_name, "node", node_data, batch_size, progress_callback)
+        self._upload_data(graph_name, "node", node_data, batch_size, progress_callback, target_batch_bytes)
 
     def upload_relationships(
         self,
@@ -514,10 +795,16 @@ class GdsArrowClient:
         relationship_data: Union[pyarrow.Table, Iterable[pyarrow.RecordBatch], DataFrame],
         batch_size: int = 10_000,
         progress_callback: Callable[[int], None] = lambda x: None,
+        target_batch_bytes: Optional[int] = None,
     ) -> None:
         """
         Uploads relationship data to the server.
 
+        If the upload stream fails with a transient connection error while no sent batch is awaiting its
+        acknowledgement, the upload continues on a new stream after the last acknowledged batch.
+        If a sent batch was not acknowledged, the server might have applied it, so the upload fails instead of
+        sending it again.
+
         Parameters
         ----------
         graph_name : str
@@ -528,8 +815,13 @@ class GdsArrowClient:
             The number of rows per batch
         progress_callback : Callable[[int], None]
             A callback function that is called with the number of rows uploaded after each batch
+        target_batch_bytes : Optional[int]
+            The approximate size of each batch in bytes. If set, the number of rows per batch is derived from the
+            in-memory size of the data instead of using `batch_size`. Does not apply to already batched data
         """
-        self._upload_data(graph_name, "relationship", relationship_data, batch_size, progress_callback)
+        self._upload_data(
+            graph_name, "relationship", relationship_data, batch_size, progress_callback, target_batch_bytes
+        )
 
     def upload_triplets(
         self,
@@ -537,10 +829,16 @@ class GdsArrowClient:
         triplet_data: Union[pyarrow.Table, Iterable[pyarrow.RecordBatch], DataFrame],
         batch_size: int = 10_000,
         progress_callback: Callable[[int], None] = lambda x: None,
+        target_batch_bytes: Optional[int] = None,
     ) -> None:
         """
         Uploads triplet data to the server.
 
+        If the upload stream fails with a transient connection error while no sent batch is awaiting its
+        acknowledgement, the upload continues on a new stream after the last acknowledged batch.
+        If a sent batch was not acknowledged, the server might have applied it, so the upload fails instead of
+        sending it again.
+
         Parameters
         ----------
         graph_name : str
@@ -551,16 +849,27 @@ class GdsArrowClient:
             The number of rows per batch
         progress_callback : Callable[[int], None]
             A callback function that is called with the number of rows uploaded after each batch
+        target_batch_bytes : Optional[int]
+            The approximate size of each batch in bytes. If set, the number of rows per batch is derived from the
+            in-memory size of the data instead of using `batch_size`. Does not apply to already batched data
         """
-        self._upload_data(graph_name, "triplet", triplet_data, batch_size, progress_callback)
+        self._upload_data(graph_name, "triplet", triplet_data, batch_size, progress_callback, target_batch_bytes)
 
     def __getstate__(self) -> Dict[str, Any]:
         state = self.__dict__.copy()
-        # Remove the FlightClient as it isn't serializable
+        # Remove the FlightClients as they aren't serializable
         if "_flight_client" in state:
             del state["_flight_client"]
+        for key in ["_pooled_flight_clients", "_pool_lock", "_pool_counter"]:
+            state.pop(key, None)
         return state
 
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._pooled_flight_clients = []
+        self._pool_lock = threading.Lock()
+        self._pool_counter = itertools.count()
+
     def _client(self) -> flight.FlightClient:
         """
         Lazy client construction to help pickle this class because a PyArrow
@@ -570,6 +879,19 @@ class GdsArrowClient:
             self._flight_client = self._instantiate_flight_client()
         return self._flight_client
 
+    def _pooled_client(self) -> flight.FlightClient:
+        """
+        Returns the clients of the pool in a round-robin fashion, so that concurrent streams use different connections.
+        """
+        clients = [self._client()] + self._pooled_flight_clients
+        return clients[next(self._pool_counter) % len(clients)]
+
+    def _upload_call_options(self) -> flight.FlightCallOptions:
+        if self._compression is None:
+            return flight.FlightCallOptions()
+
+        return flight.FlightCallOptions(write_options=ipc.IpcWriteOptions(compression=self._compression))
+
     def _send_action(self, action_type: str, meta_data: dict[str, Any]) -> dict[str, Any]:
         action_type = self._versioned_action_type(action_type)
 
@@ -590,22 +912,33 @@ class GdsArrowClient:
         self,
         graph_name: str,
         entity_type: str,
-        data: Union[pyarrow.Table, list[pyarrow.RecordBatch], DataFrame],
+        data: Union[pyarrow.Table, Iterable[pyarrow.RecordBatch], DataFrame],
         batch_size: int,
         progress_callback: Callable[[int], None],
+        target_batch_bytes: Optional[int] = None,
     ) -> None:
+        if isinstance(data, DataFrame):
+            data = pyarrow.Table.from_pandas(data)
+
         if isinstance(data, pyarrow.Table):
+            if target_batch_bytes is not None:
+                batch_size = self._rows_per_batch(data, target_batch_bytes)
             batches = data.to_batches(batch_size)
-        elif isinstance(data, DataFrame):
-            batches = pyarrow.Table.from_pandas(data).to_batches(batch_size)
         else:
             batches = data
 
         flight_descriptor = self._versioned_flight_descriptor({"name": graph_name, "entity_type": entity_type})
         upload_descriptor = flight.FlightDescriptor.for_command(json.dumps(flight_descriptor).encode("utf-8"))
 
-        client = self._client()
-        put_stream, ack_stream = client.do_put(upload_descriptor, batches[0].schema)
+        remaining_batches = iter(batches)
+        # peek at the first batch for the schema, as the batches might be a lazy iterator
+        first_batch = next(remaining_batches, None)
+        if first_batch is None:
+            return
+        schema = first_batch.schema
+        remaining_batches = itertools.chain([first_batch], remaining_batches)
+        # batches which have been sent but not yet acknowledged by the server
+        unacknowledged_batches: deque[RecordBatch] = deque()
 
         @retry(
             stop=(stop_after_delay(10) | stop_after_attempt(5)),
@@ -615,19 +948,59 @@ class GdsArrowClient:
                 | retry_if_exception_type(flight.FlightTimedOutError)
                 | retry_if_exception_type(flight.FlightInternalError)
             ),
+            reraise=True,
         )
-        def upload_batch(p: RecordBatch) -> None:
-            put_stream.write_batch(p)
+        def upload_stream() -> None:
+            # a new stream continues after the last acknowledged batch, as no batch is awaiting an acknowledgement
+            put_stream, ack_stream = self._pooled_client().do_put(
+                upload_descriptor, schema, options=self._upload_call_options()
+            )
+
+            def await_ack() -> bool:
+                if ack_stream.read() is None:
+                    # the server ended the stream, the cause is raised when closing it
+                    return False
+                progress_callback(unacknowledged_batches.popleft().num_rows)
+                return True
+
+            try:
+                with put_stream:
+                    for batch in remaining_batches:
+                        # a batch counts as sent as soon as writing starts, as it might reach the server partially
+                        unacknowledged_batches.append(batch)
+                        put_stream.write_batch(batch)
+                        if len(unacknowledged_batches) >= self._upload_window and not await_ack():
+                            break
+
+                    while unacknowledged_batches and await_ack():
+                        pass
+            except (flight.FlightUnavailableError, flight.FlightTimedOutError, flight.FlightInternalError) as e:
+                if unacknowledged_batches:
+                    # the server might have applied the batches without the acknowledgement reaching the client,
+                    # so sending them again could duplicate their rows
+                    raise flight.FlightServerError(
+                        f"The upload stream was interrupted while {len(unacknowledged_batches)} sent batches were "
+                        f"awaiting an acknowledgement: {e}"
+                    ) from e
+                raise
+
+            if unacknowledged_batches:
+                raise flight.FlightServerError("The server closed the upload stream before acknowledging all batches")
 
         try:
-            with put_stream:
-                for partition in batches:
-                    upload_batch(partition)
-                    ack_stream.read()
-                    progress_callback(partition.num_rows)
+            upload_stream()
         except Exception as e:
             GdsArrowClient.handle_flight_error(e)
 
+    @staticmethod
+    def _rows_per_batch(table: Table, target_batch_bytes: int) -> int:
+        if table.num_rows == 0:
+            return 1
+
+        # wide tables, such as nodes with embeddings, get fewer rows per batch than narrow relationship tables
+        bytes_per_row = max(table.nbytes / table.num_rows, 1)
+        return max(int(target_batch_bytes // bytes_per_row), 1)
+
     def _do_get(
         self,
         database: str,
@@ -635,7 +1008,276 @@ class GdsArrowClient:
         procedure_name: str,
         concurrency: Optional[int],
         configuration: dict[str, Any],
-    ) -> DataFrame:
+        result_format: Optional[Union[str, ArrowResultFormat]] = None,
+    ) -> ArrowResult:
+        arrow_table = self._do_get_table(database, graph_name, procedure_name, concurrency, configuration)
+
+        return self._convert_table(arrow_table, result_format)
+
+    def _do_get_partitioned(
+        self,
+        database: str,
+        graph_name: str,
+        procedure_name: str,
+        concurrency: Optional[int],
+        configuration: dict[str, Any],
+        partition_key: str,
+        parallel_streams: int,
+        deduplication_key: Optional[str] = None,
+        result_format: Optional[Union[str, ArrowResultFormat]] = None,
+    ) -> ArrowResult:
+        partition_values = configuration.get(partition_key)
+        if not partition_values or "*" in partition_values or len(partition_values) < 2:
+            # the partitions are not known upfront, so we fall back to a single stream
+            return self._do_get(database, graph_name, procedure_name, concurrency, configuration, result_format)
+
+        num_partitions = min(parallel_streams, len(partition_values))
+        self.ensure_client_pool_size(num_partitions)
+        partition_configs = [
+            {**configuration, partition_key: partition_values[i::num_partitions]} for i in range(num_partitions)
+        ]
+
+        with ThreadPoolExecutor(num_partitions) as executor:
+            tables = list(
+                executor.map(
+                    lambda config: self._do_get_table(database, graph_name, procedure_name, concurrency, config),
+                    partition_configs,
+                )
+            )
+
+        arrow_table = pyarrow.concat_tables(tables)
+        del tables
+
+        if deduplication_key:
+            # entities matching multiple partitions, such as nodes with several labels, are streamed more than once
+            arrow_table = self._drop_duplicates(arrow_table, deduplication_key)
+
+        return self._convert_table(arrow_table, result_format)
+
+    def _do_get_table(
+        self,
+        database: str,
+        graph_name: str,
+        procedure_name: str,
+        concurrency: Optional[int],
+        configuration: dict[str, Any],
+    ) -> Table:
+        ticket = self._get_ticket(database, graph_name, procedure_name, concurrency, configuration)
+
+        client = self._pooled_client()
+        try:
+            get = client.do_get(ticket)
+            arrow_table = get.read_all()
+        except Exception as e:
+            self.handle_flight_error(e)
+
+        if configuration.get("list_node_labels", False):
+            arrow_table = arrow_table.rename_columns(self._fix_node_labels_column_names(arrow_table.column_names))
+
+        return arrow_table
+
+    def _do_get_iter(
+        self,
+        database: str,
+        graph_name: str,
+        procedure_name: str,
+        concurrency: Optional[int],
+        configuration: dict[str, Any],
+    ) -> Iterator[RecordBatch]:
+        ticket = self._get_ticket(database, graph_name, procedure_name, concurrency, configuration)
+        rename_node_labels = configuration.get("list_node_labels", False)
+
+        client = self._client()
+        try:
+            get = client.do_get(ticket)
+        except Exception as e:
+            self.handle_flight_error(e)
+
+        fully_consumed = False
+        try:
+            while True:
+                try:
+                    chunk = get.read_chunk()
+                except StopIteration:
+                    break
+                except Exception as e:
+                    self.handle_flight_error(e)
+
+                batch = chunk.data
+                if rename_node_labels:
+                    batch = RecordBatch.from_arrays(
+                        batch.columns, names=self._fix_node_labels_column_names(batch.schema.names)
+                    )
+
+                yield self._sanitize_record_batch(batch, self._pandas_conversion.dictionaries_as_categorical)
+            fully_consumed = True
+        finally:
+            # Stop the server from sending more data if the consumer stopped early
+            if not fully_consumed:
+                get.cancel()
+
+    def _convert_table(
+        self, arrow_table: Table, result_format: Optional[Union[str, ArrowResultFormat]] = None
+    ) -> ArrowResult:
+        target_format = self._result_format if result_format is None else ArrowResultFormat.parse(result_format)
+
+        if target_format == ArrowResultFormat.ARROW:
+            return arrow_table
+
+        if target_format == ArrowResultFormat.POLARS:
+            try:
+                import polars
+            except ModuleNotFoundError:
+                raise ModuleNotFoundError(
+                    "This result format requires polars support. "
+                    "You can add polars support by running `pip install graphdatascience[polars]`"
+                )
+
+            # scalar dictionaries become polars Categoricals, dictionaries of lists such as node labels are decoded
+            return polars.from_arrow(self._sanitize_arrow_table(arrow_table, keep_dictionaries=True))
+
+        if target_format == ArrowResultFormat.NUMPY:
+            return self._to_numpy(self._sanitize_arrow_table(arrow_table))
+
+        return self._to_pandas(
+            self._sanitize_arrow_table(arrow_table, self._pandas_conversion.dictionaries_as_categorical)
+        )
+
+    def _to_numpy(self, arrow_table: Table) -> dict[str, npt.NDArray[Any]]:
+        columns: dict[str, npt.NDArray[Any]] = {}
+        for name, column in zip(arrow_table.column_names, arrow_table.columns):
+            # numeric list columns, such as embeddings, become one 2-D matrix instead of an array of arrays
+            matrix = self._list_column_to_matrix(column)
+            columns[name] = matrix if matrix is not None else column.to_numpy()
+
+        return columns
+
+    def _to_pandas(self, arrow_table: Table) -> DataFrame:
+        options = self._pandas_conversion
+
+        # Pandas 2.2.0 deprecated an API used by ArrowTable.to_pandas() (< pyarrow 15.0)
+        warnings.filterwarnings(
+            "ignore",
+            category=DeprecationWarning,
+            message=r"Passing a BlockManager to DataFrame is deprecated",
+        )
+
+        # (position, name, matrix) of the list columns that are converted into a contiguous matrix
+        matrices: list[tuple[int, str, npt.NDArray[Any]]] = []
+        if options.embeddings_as_matrix:
+            for idx in reversed(range(arrow_table.num_columns)):
+                matrix = self._list_column_to_matrix(arrow_table.column(idx))
+                if matrix is not None:
+                    matrices.append((idx, arrow_table.column_names[idx], matrix))
+                    arrow_table = arrow_table.remove_column(idx)
+
+        conversion_kwargs: dict[str, Any] = {}
+        if options.self_destruct:
+            conversion_kwargs["self_destruct"] = True
+        if options.split_blocks:
+            conversion_kwargs["split_blocks"] = True
+        if options.arrow_dtypes:
+            conversion_kwargs["types_mapper"] = pandas.ArrowDtype
+
+        df = arrow_table.to_pandas(**conversion_kwargs)
+        del arrow_table
+
+        # insert in ascending order so that the original column positions are restored
+        for idx, name, matrix in reversed(matrices):
+            # every row is a view into the same contiguous matrix
+            df.insert(idx, name, list(matrix))
+
+        return df  # type: ignore
+
+    @staticmethod
+    def embedding_matrix(column: pandas.Series[Any]) -> npt.NDArray[Any]:
+        """
+        Get a column of equally long numeric arrays, such as embeddings, as one 2-D numpy array.
+
+        For columns converted with `PandasConversionOptions.embeddings_as_matrix`, the rows are views into one
+        contiguous block of memory, which is then returned as a matrix without copying.
+        Otherwise, such as after filtering or reordering the rows, the rows are copied into a new matrix.
+
+        Parameters
+        ----------
+        column : pandas.Series
+            The column of arrays, for example `df["embedding"]`
+
+        Returns
+        -------
+        numpy.ndarray
+            The matrix with one row per element of the column
+        """
+        rows = column.to_numpy()
+        if len(rows) == 0:
+            return numpy.empty((0, 0))
+
+        first_row = rows[0]
+        if (
+            isinstance(first_row, numpy.ndarray)
+            and first_row.ndim == 1
+            and first_row.flags.c_contiguous
+            and first_row.base is not None
+        ):
+            address = first_row.__array_interface__["data"][0]
+            is_contiguous = all(
+                isinstance(row, numpy.ndarray)
+                and row.base is first_row.base
+                and row.dtype == first_row.dtype
+                and row.shape == first_row.shape
+                and row.__array_interface__["data"][0] == address + idx * first_row.nbytes
+                for idx, row in enumerate(rows)
+            )
+            if is_contiguous:
+                # the rows are consecutive slices of the same buffer, so they can be viewed as one matrix
+                matrix: npt.NDArray[Any] = numpy.lib.stride_tricks.as_strided(
+                    first_row,
+                    shape=(len(rows), len(first_row)),
+                    strides=(first_row.nbytes, first_row.itemsize),
+                    writeable=False,
+                )
+                return matrix
+
+        return numpy.stack([numpy.asarray(row) for row in rows])
+
+    @staticmethod
+    def _list_column_to_matrix(column: ChunkedArray) -> Optional[npt.NDArray[Any]]:
+        column_type = column.type
+        if not (
+            pyarrow.types.is_list(column_type)
+            or pyarrow.types.is_large_list(column_type)
+            or pyarrow.types.is_fixed_size_list(column_type)
+        ):
+            return None
+        if not (pyarrow.types.is_floating(column_type.value_type) or pyarrow.types.is_integer(column_type.value_type)):
+            return None
+        if len(column) == 0 or column.null_count > 0:
+            return None
+
+        array = column.combine_chunks()
+        if pyarrow.types.is_fixed_size_list(column_type):
+            width = column_type.list_size
+        else:
+            lengths = array.value_lengths().to_numpy()
+            width = int(lengths[0])
+            if not (lengths == width).all():
+                return None
+
+        values = array.flatten()
+        if values.null_count > 0:
+            return None
+
+        matrix: npt.NDArray[Any] = values.to_numpy(zero_copy_only=False).reshape(len(array), width)
+        return matrix
+
+    def _get_ticket(
+        self,
+        database: str,
+        graph_name: str,
+        procedure_name: str,
+        concurrency: Optional[int],
+        configuration: dict[str, Any],
+    ) -> flight.Ticket:
         payload: dict[str, Any] = {
             "database_name": database,
             "graph_name": graph_name,
@@ -653,28 +1295,20 @@ class GdsArrowClient:
                 "body": payload,
             }
 
-        ticket = flight.Ticket(json.dumps(payload).encode("utf-8"))
+        return flight.Ticket(json.dumps(payload).encode("utf-8"))
 
-        client = self._client()
-        try:
-            get = client.do_get(ticket)
-            arrow_table = get.read_all()
-        except Exception as e:
-            self.handle_flight_error(e)
+    @staticmethod
+    def _drop_duplicates(arrow_table: Table, key: str) -> Table:
+        _, first_indices = numpy.unique(arrow_table.column(key).to_numpy(), return_index=True)
+        if len(first_indices) == len(arrow_table):
+            return arrow_table
 
-        if configuration.get("list_node_labels", False):
-            # GDS 2.5 had an inconsistent naming of the node labels column
-            new_colum_names = ["nodeLabels" if i == "labels" else i for i in arrow_table.column_names]
-            arrow_table = arrow_table.rename_columns(new_colum_names)
+        return arrow_table.take(numpy.sort(first_indices))
 
-        # Pandas 2.2.0 deprecated an API used by ArrowTable.to_pandas() (< pyarrow 15.0)
-        warnings.filterwarnings(
-            "ignore",
-            category=DeprecationWarning,
-            message=r"Passing a BlockManager to DataFrame is deprecated",
-        )
-
-        return self._sanitize_arrow_table(arrow_table).to_pandas()  # type: ignore
+    @staticmethod
+    def _fix_node_labels_column_names(column_names: list[str]) -> list[str]:
+        # GDS 2.5 had an inconsistent naming of the node labels column
+        return ["nodeLabels" if i == "labels" else i for i in column_names]
 
     def __enter__(self) -> GdsArrowClient:
         return self
@@ -690,6 +1324,9 @@ class GdsArrowClient:
     def close(self) -> None:
         if self._flight_client:
             self._flight_client.close()
+        for pooled_client in self._pooled_flight_clients:
+            pooled_client.close()
+        self._pooled_flight_clients = []
 
     def _versioned_action_type(self, action_type: str) -> str:
         return self._arrow_endpoint_version.prefix() + action_type
@@ -706,7 +1343,7 @@ class GdsArrowClient:
         )
 
     @staticmethod
-    def _sanitize_arrow_table(arrow_table: Table) -> Table:
+    def _sanitize_arrow_table(arrow_table: Table, keep_dictionaries: bool = False) -> Table:
         # empty columns cannot be used to build a chunked_array in pyarrow
         if len(arrow_table) == 0:
             return arrow_table
@@ -716,9 +1353,7 @@ class GdsArrowClient:
         ]
 
         for idx, field in dict_encoded_fields:
-            try:
-                field.type.to_pandas_dtype()
-            except NotImplementedError:
+            if GdsArrowClient._requires_decoding(field.type, keep_dictionaries):
                 # we need to decode the dictionary column before transforming to pandas
                 if isinstance(arrow_table[field.name], ChunkedArray):
                     decoded_col: Array = chunked_array(
@@ -730,6 +1365,35 @@ class GdsArrowClient:
                 arrow_table = arrow_table.set_column(idx, field.name, decoded_col)
         return arrow_table
 
+    @staticmethod
+    def _sanitize_record_batch(batch: RecordBatch, keep_dictionaries: bool = False) -> RecordBatch:
+        if batch.num_rows == 0:
+            return batch
+
+        columns = list(batch.columns)
+        decoded = False
+        for idx, field in enumerate(batch.schema):
+            if is_dictionary(field.type) and GdsArrowClient._requires_decoding(field.type, keep_dictionaries):
+                columns[idx] = GdsArrowClient._decode_pyarrow_array(columns[idx])
+                decoded = True
+
+        if not decoded:
+            return batch
+
+        return RecordBatch.from_arrays(columns, names=batch.schema.names)
+
+    @staticmethod
+    def _requires_decoding(dictionary_type: pyarrow.DictionaryType, keep_dictionaries: bool) -> bool:
+        # dictionaries of scalar values are converted into a pandas Categorical
+        if keep_dictionaries and not pyarrow.types.is_nested(dictionary_type.value_type):
+            return False
+
+        try:
+            dictionary_type.to_pandas_dtype()
+            return False
+        except NotImplementedError:
+            return True
+
     @staticmethod
     def _decode_pyarrow_array(array: Array) -> Array:
         if isinstance(array, DictionaryArray):
@@ -794,22 +1458,30 @@ class AuthFactory(ClientMiddlewareFactory):  # type: ignore
 
 
 class AuthMiddleware(ClientMiddleware):  # type: ignore
+    # seconds after which a token is considered expired
+    TOKEN_LIFETIME = 600
+
     def __init__(self, auth: tuple[str, str], *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._auth = auth
         self._token: Optional[str] = None
-        self._token_timestamp = 0
+        self._token_timestamp = 0.0
+
+    def token(self, min_remaining_lifetime: float = 0) -> Optional[str]:
+        token_age = time.time() - self._token_timestamp
 
-    def token(self) -> Optional[str]:
         # check whether the token is older than 10 minutes. If so, reset it.
-        if self._token and int(time.time()) - self._token_timestamp > 600:
+        if self._token and token_age > self.TOKEN_LIFETIME:
             self._token = None
 
+        if token_age > self.TOKEN_LIFETIME - min_remaining_lifetime:
+            return None
+
         return self._token
 
     def _set_token(self, token: str) -> None:
         self._token = token
-        self._token_timestamp = int(time.time())
+        self._token_timestamp = time.time()
 
     def received_headers(self, headers: dict[str, Any]) -> None:
         auth_header = headers.get("authorization", None)
@@ -838,6 +1510,40 @@ class AuthMiddleware(ClientMiddleware):  # type: ignore
             return {"authorization": "Bearer " + token}
 
 
+@dataclass(frozen=True)
+class PandasConversionOptions:
+    """
+    Options for converting Arrow results into pandas DataFrames.
+
+    Attributes
+    ----------
+    self_destruct : bool
+        Release the Arrow buffers of each column as soon as it has been converted (default is False)
+    split_blocks : bool
+        Create one pandas block per column instead of consolidating them into a single copy (default is False)
+    arrow_dtypes : bool
+        Back the DataFrame columns by pyarrow using `pandas.ArrowDtype` instead of numpy (default is False)
+    embeddings_as_matrix : bool
+        Convert numeric list columns with a fixed length, such as embeddings, into one contiguous 2-D numpy array.
+        Each row of the resulting column is a view into that array, which can be retrieved without copying via
+        `GdsArrowClient.embedding_matrix`. The "numpy" result format returns such columns as a matrix directly
+        (default is False)
+    dictionaries_as_categorical : bool
+        Keep dictionary encoded columns of scalar values, such as relationship types, encoded and convert them into a
+        `pandas.Categorical` instead of decoding them into a value per row (default is False)
+    """
+
+    self_destruct: bool = False
+    split_blocks: bool = False
+    arrow_dtypes: bool = False
+    embeddings_as_matrix: bool = False
+    dictionaries_as_categorical: bool = False
+
+    def __post_init__(self) -> None:
+        if self.arrow_dtypes and not hasattr(pandas, "ArrowDtype"):
+            raise ValueError("Using `arrow_dtypes` requires pandas 2.0 or later")
+
+
 @dataclass(repr=True, frozen=True)
 class NodeLoadDoneResult:
     name: str
@@ -1,9 +1,44 @@
 from abc import ABC, abstractmethod
+from typing import Iterator, Optional, Sequence, Union
 
+import pyarrow
 from pandas import DataFrame
+from pyarrow import RecordBatch, RecordBatchReader, Table
+
+# graph data is either materialized or produced lazily, such as by a generator
+GraphData = Union[DataFrame, Table, RecordBatchReader, Iterator[DataFrame], Iterator[RecordBatch]]
 
 
 class GraphConstructor(ABC):
     @abstractmethod
-    def run(self, node_dfs: list[DataFrame], relationship_dfs: list[DataFrame]) -> None:
+    def run(
+        self,
+        nodes: Sequence[GraphData],
+        relationships: Sequence[GraphData],
+        batch_size: Optional[int] = None,
+    ) -> None:
         pass
+
+    @staticmethod
+    def _validate_batch_size(batch_size: Optional[int]) -> None:
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"The batch size must be a positive number, but got {batch_size}.")
+
+    @staticmethod
+    def _to_dfs(graph_data: Sequence[GraphData]) -> list[DataFrame]:
+        dfs: list[DataFrame] = []
+        for data in graph_data:
+            if isinstance(data, DataFrame):
+                dfs.append(data)
+            elif isinstance(data, pyarrow.Table):
+                dfs.append(data.to_pandas())
+            elif isinstance(data, pyarrow.RecordBatchReader):
+                dfs.append(data.read_pandas())
+            else:
+                items = list(data)
+                if isinstance(items[0], DataFrame):
+                    dfs.extend(items)
+                else:
+                    dfs.append(pyarrow.Table.from_batches(items).to_pandas())
+
+        return dfs
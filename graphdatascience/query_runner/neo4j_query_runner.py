@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import itertools
 import logging
 import re
+import threading
 import time
 import warnings
-from typing import Any, NamedTuple, Optional, Union
+from contextlib import contextmanager
+from typing import Any, Iterator, NamedTuple, Optional, Union
 from uuid import uuid4
 
 import neo4j
@@ -19,12 +22,13 @@ from ..version import __version__
 from .cypher_graph_constructor import CypherGraphConstructor
 from .graph_constructor import GraphConstructor
 from .progress.query_progress_logger import QueryProgressLogger
-from .query_runner import QueryRunner
+from .query_runner import ProcedureCall, QueryRunner
 
 
 class Neo4jQueryRunner(QueryRunner):
     _AURA_DS_PROTOCOL = "neo4j+s"
     _LOG_POLLING_INTERVAL = 0.5
+    _SERVER_VERSION_QUERY = "RETURN gds.version()"
     _NEO4J_DRIVER_VERSION = ServerVersion.from_string(neo4j.__version__)
 
     @staticmethod
@@ -35,6 +39,8 @@ class Neo4jQueryRunner(QueryRunner):
         database: Optional[str] = None,
         bookmarks: Optional[Any] = None,
         show_progress: bool = True,
+        reuse_sessions: bool = False,
+        connectivity_check_interval: float = 60.0,
     ) -> Neo4jQueryRunner:
         if isinstance(endpoint, str):
             config: dict[str, Any] = {"user_agent": f"neo4j-graphdatascience-v{__version__}"}
@@ -42,6 +48,13 @@ class Neo4jQueryRunner(QueryRunner):
             if aura_ds:
                 Neo4jQueryRunner._configure_aura(config)
 
+            if Neo4jQueryRunner._NEO4J_DRIVER_VERSION >= ServerVersion(5, 0, 0):
+                # pooled connections idle for longer than the interval are checked by the driver before sending a
+                # query on them, which replaces the connectivity check skipped for recently connected databases
+                config["liveness_check_timeout"] = connectivity_check_interval
+            else:
+                connectivity_check_interval = 0
+
             driver = neo4j.GraphDatabase.driver(endpoint, auth=auth, **config)
 
             query_runner = Neo4jQueryRunner(
@@ -51,11 +64,19 @@ class Neo4jQueryRunner(QueryRunner):
                 config=config,
                 database=database,
                 show_progress=show_progress,
+                reuse_sessions=reuse_sessions,
+                connectivity_check_interval=connectivity_check_interval,
             )
 
         elif isinstance(endpoint, neo4j.Driver):
             query_runner = Neo4jQueryRunner(
-                endpoint, auto_close=False, bookmarks=bookmarks, database=database, show_progress=show_progress
+                endpoint,
+                auto_close=False,
+                bookmarks=bookmarks,
+                database=database,
+                show_progress=show_progress,
+                reuse_sessions=reuse_sessions,
+                connectivity_check_interval=connectivity_check_interval,
             )
 
         else:
@@ -120,6 +141,8 @@ class Neo4jQueryRunner(QueryRunner):
         bookmarks: Optional[Any] = None,
         show_progress: bool = True,
         instance_description: str = "Neo4j DBMS",
+        connectivity_check_interval: float = 60.0,
+        reuse_sessions: bool = False,
     ):
         self._driver = driver
         self._config = config
@@ -134,6 +157,14 @@ class Neo4jQueryRunner(QueryRunner):
             self.__run_cypher_simplified_for_query_progress_logger, self.server_version
         )
         self._instance_description = instance_description
+        self._connectivity_check_interval = connectivity_check_interval
+        # time of the last successful query or connectivity check per database
+        self._connected_at: dict[Optional[str], float] = {}
+        self._reuse_sessions = reuse_sessions
+        # sessions are not thread safe, so they are reused per thread and database.
+        # keying by the thread object rather than its identifier, as identifiers are recycled for new threads
+        self._sessions: dict[tuple[threading.Thread, Optional[str]], tuple[neo4j.Session, Optional[Any]]] = {}
+        self._sessions_lock = threading.Lock()
 
     def __run_cypher_simplified_for_query_progress_logger(self, query: str, database: Optional[str]) -> DataFrame:
         # progress logging should not retry a lot as it perodically fetches the latest progress anyway
@@ -156,11 +187,22 @@ class Neo4jQueryRunner(QueryRunner):
 
         if connectivity_retry_config is None:
             connectivity_retry_config = Neo4jQueryRunner.ConnectivityRetriesConfig()
-        self._verify_connectivity(database=database, retry_config=connectivity_retry_config)
 
-        with self._driver.session(database=database, bookmarks=self.bookmarks()) as session:
+        # verifying the connectivity costs a round trip, so it is skipped if a query succeeded recently.
+        # a query failing on a lost connection is not sent again, as it might have reached the server already.
+        # instead, the connectivity is verified before the next query
+        if not self._recently_connected(database):
+            self._verify_connectivity(database=database, retry_config=connectivity_retry_config)
+
+        return self._run_query(query, params, database, custom_error)
+
+    def _run_query(self, query: str, params: dict[str, Any], database: Optional[str], custom_error: bool) -> DataFrame:
+        with self._session(database) as session:
             try:
                 result = session.run(query, params)
+            except (neo4j.exceptions.ServiceUnavailable, neo4j.exceptions.SessionExpired) as e:
+                self._connected_at.pop(database, None)
+                raise e
             except Exception as e:
                 if custom_error:
                     self.handle_driver_exception(session, e)
@@ -176,27 +218,127 @@ class Neo4jQueryRunner(QueryRunner):
 
             df = result.to_df()
 
-            if self._NEO4J_DRIVER_VERSION < ServerVersion(5, 0, 0):
-                self._last_bookmarks = [session.last_bookmark()]
-            else:
-                self._last_bookmarks = session.last_bookmarks()
-
-            if (
-                Neo4jQueryRunner._NEO4J_DRIVER_VERSION >= ServerVersion(5, 21, 0)
-                and result._warn_notification_severity == "WARNING"
-            ):
-                # the client does not expose YIELD fields so we just skip these warnings for now
-                warnings.filterwarnings(
-                    "ignore", message=r".*The query used a deprecated field from a procedure\. .* by 'gds.* "
-                )
-            else:
-                notifications = result.consume().notifications
-                if notifications:
-                    for notification in notifications:
-                        self._forward_cypher_warnings(notification)
+            self._complete_query(session, result, database)
 
             return df
 
+    def run_cypher_iter(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+        chunk_size: int = 10_000,
+    ) -> Iterator[DataFrame]:
+        if chunk_size < 1:
+            raise ValueError(f"The chunk size must be a positive number, but got {chunk_size}.")
+
+        if params is None:
+            params = {}
+
+        if database is None:
+            database = self._database
+
+        return self._iterate_query(query, params, database, custom_error, chunk_size)
+
+    def _iterate_query(
+        self, query: str, params: dict[str, Any], database: Optional[str], custom_error: bool, chunk_size: int
+    ) -> Iterator[DataFrame]:
+        if not self._recently_connected(database):
+            self._verify_connectivity(database=database, retry_config=Neo4jQueryRunner.ConnectivityRetriesConfig())
+
+        # the session stays open while the chunks are consumed, and the records are only pulled from the server
+        # when the next chunk is requested
+        with self._driver.session(database=database, bookmarks=self.bookmarks()) as session:
+            try:
+                result = session.run(query, params)
+            except Exception as e:
+                if custom_error:
+                    self.handle_driver_exception(session, e)
+                else:
+                    raise e
+
+            keys = result.keys()
+            while True:
+                records = list(itertools.islice(result, chunk_size))
+                if not records:
+                    break
+
+                yield DataFrame([record.values() for record in records], columns=keys)
+
+            self._complete_query(session, result, database)
+
+    def _complete_query(self, session: neo4j.Session, result: neo4j.Result, database: Optional[str]) -> None:
+        if self._NEO4J_DRIVER_VERSION < ServerVersion(5, 0, 0):
+            self._last_bookmarks = [session.last_bookmark()]
+        else:
+            self._last_bookmarks = session.last_bookmarks()
+
+        if (
+            Neo4jQueryRunner._NEO4J_DRIVER_VERSION >= ServerVersion(5, 21, 0)
+            and result._warn_notification_severity == "WARNING"
+        ):
+            # the client does not expose YIELD fields so we just skip these warnings for now
+            warnings.filterwarnings(
+                "ignore", message=r".*The query used a deprecated field from a procedure\. .* by 'gds.* "
+            )
+        else:
+            notifications = result.consume().notifications
+            if notifications:
+                for notification in notifications:
+                    Neo4jQueryRunner._forward_cypher_warnings(notification, self._logger)
+
+        self._connected_at[database] = time.monotonic()
+
+    @contextmanager
+    def _session(self, database: Optional[str]) -> Iterator[neo4j.Session]:
+        if not self._reuse_sessions:
+            with self._driver.session(database=database, bookmarks=self.bookmarks()) as session:
+                yield session
+            return
+
+        key = (threading.current_thread(), database)
+        bookmarks = self.bookmarks()
+        with self._sessions_lock:
+            cached = self._sessions.pop(key, None)
+            abandoned_sessions = self._pop_sessions_of_finished_threads()
+
+        for abandoned_session in abandoned_sessions:
+            abandoned_session.close()
+
+        if cached is not None and cached[1] is not bookmarks:
+            # the bookmarks were changed, so the session must not continue the previous causal chain
+            cached[0].close()
+            cached = None
+
+        session = cached[0] if cached is not None else self._driver.session(database=database, bookmarks=bookmarks)
+        try:
+            yield session
+        except BaseException as e:
+            # the session might not be usable anymore, so a new one is opened for the next query
+            session.close()
+            raise e
+
+        with self._sessions_lock:
+            self._sessions[key] = (session, bookmarks)
+
+    def _pop_sessions_of_finished_threads(self) -> list[neo4j.Session]:
+        # short-lived threads, such as executor workers, would otherwise leave their sessions open until `close`
+        finished_keys = [key for key in self._sessions if not key[0].is_alive()]
+        return [self._sessions.pop(key)[0] for key in finished_keys]
+
+    def _close_sessions(self) -> None:
+        with self._sessions_lock:
+            sessions = [session for session, _ in self._sessions.values()]
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+    def _recently_connected(self, database: Optional[str]) -> bool:
+        connected_at = self._connected_at.get(database)
+        return connected_at is not None and time.monotonic() - connected_at < self._connectivity_check_interval
+
     def call_function(self, endpoint: str, params: Optional[CallParameters] = None) -> Any:
         if params is None:
             params = CallParameters()
@@ -228,6 +370,43 @@ class Neo4jQueryRunner(QueryRunner):
         else:
             return run_cypher_query()
 
+    def call_procedures(self, calls: list[ProcedureCall], database: Optional[str] = None) -> list[DataFrame]:
+        if not calls:
+            return []
+
+        procedure_yields = self.server_capabilities().procedure_yields(
+            [call.endpoint for call in calls if call.yields is None]
+        )
+
+        # every call is run in its own subquery, collecting its records, so all are sent in one query
+        subqueries = []
+        params: dict[str, Any] = {}
+        yields_per_call = []
+        for idx, call in enumerate(calls):
+            yields = call.yields if call.yields is not None else procedure_yields[call.endpoint]
+            yields_per_call.append(yields)
+
+            call_params = {f"p{idx}_{key}": value for key, value in (call.params or CallParameters()).items()}
+            params.update(call_params)
+            arguments = ", ".join(f"${key}" for key in call_params)
+
+            if yields:
+                yield_clause = ", ".join(f"`{y}`" for y in yields)
+                record = ", ".join(f"`{y}`: `{y}`" for y in yields)
+                subqueries.append(
+                    f"CALL {{ CALL {call.endpoint}({arguments}) YIELD {yield_clause} RETURN collect({{{record}}}) AS r{idx} }}"
+                )
+            else:
+                subqueries.append(f"CALL {{ CALL {call.endpoint}({arguments}) RETURN [] AS r{idx} }}")
+
+        query = f"{' '.join(subqueries)} RETURN {', '.join(f'r{idx}' for idx in range(len(calls)))}"
+        result = self.run_cypher(query, params, database)
+
+        return [
+            DataFrame(result[f"r{idx}"][0], columns=yields) if yields else DataFrame()
+            for idx, yields in enumerate(yields_per_call)
+        ]
+
     def _resolve_show_progress(self, show_progress: bool) -> bool:
         return self._show_progress and show_progress
 
@@ -236,25 +415,31 @@ class Neo4jQueryRunner(QueryRunner):
             return self._server_version
 
         try:
-            server_version_string = self.run_cypher("RETURN gds.version()", custom_error=False).squeeze()
-            server_version = ServerVersion.from_string(server_version_string)
-            self._server_version = server_version
-            return server_version
+            server_version = ServerVersion.from_string(
+                self.run_cypher(Neo4jQueryRunner._SERVER_VERSION_QUERY, custom_error=False).squeeze()
+            )
         except Exception as e:
-            if "Unknown function 'gds.version'" in str(e):
+            error = Neo4jQueryRunner._server_version_error(e, self._instance_description)
+            if isinstance(error, GdsNotFound):
                 # Some Python versions appear to not call __del__ of self._query_runner when an exception
                 # is raised, so we have to close the driver manually.
                 self._driver.close()
-                # if isinstance(endpoint, str):
-                #    driver.close()
 
-                raise GdsNotFound(
-                    f"""The Graph Data Science library is not correctly installed on the {self._instance_description}.
-                    Please refer to https://neo4j.com/docs/graph-data-science/current/installation/.
-                    """
-                )
+            raise error
+
+        self._server_version = server_version
+        return server_version
 
-            raise UnableToConnectError(e)
+    @staticmethod
+    def _server_version_error(e: Exception, instance_description: str) -> Exception:
+        if "Unknown function 'gds.version'" in str(e):
+            return GdsNotFound(
+                f"""The Graph Data Science library is not correctly installed on the {instance_description}.
+                Please refer to https://neo4j.com/docs/graph-data-science/current/installation/.
+                """
+            )
+
+        return UnableToConnectError(e)
 
     def encrypted(self) -> bool:
         return self._driver.encrypted
@@ -262,7 +447,8 @@ class Neo4jQueryRunner(QueryRunner):
     def driver_config(self) -> dict[str, Any]:
         return self._config
 
-    def _forward_cypher_warnings(self, notification: dict[str, Any]) -> None:
+    @staticmethod
+    def _forward_cypher_warnings(notification: dict[str, Any], logger: logging.Logger) -> None:
         # (see https://neo4j.com/docs/status-codes/current/notifications/ for more details)
         severity = notification["severity"]
         if severity == "WARNING":
@@ -276,7 +462,7 @@ class Neo4jQueryRunner(QueryRunner):
                 warning = RuntimeWarning(notification["description"])
             warnings.warn(warning)
         elif severity == "INFORMATION":
-            self._logger.info(notification)
+            logger.info(notification)
 
     def set_database(self, database: str) -> None:
         self._database = database
@@ -285,6 +471,7 @@ class Neo4jQueryRunner(QueryRunner):
         self._bookmarks = bookmarks
 
     def close(self) -> None:
+        self._close_sessions()
         self._driver.close()
 
     def database(self) -> Optional[str]:
@@ -375,6 +562,7 @@ class Neo4jQueryRunner(QueryRunner):
                         ),
                     )
                 self._driver.verify_connectivity(database=database)
+                self._connected_at[database] = time.monotonic()
                 break
             except neo4j.exceptions.DriverError as e:
                 exception = e
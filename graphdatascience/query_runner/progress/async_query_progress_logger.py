@@ -0,0 +1,84 @@
+import asyncio
+from typing import Awaitable, Callable, NoReturn, Optional
+
+from pandas import DataFrame
+from tqdm.auto import tqdm
+
+from ...server_version.server_version import ServerVersion
+from .progress_provider import TaskWithProgress
+from .query_progress_logger import QueryProgressLogger
+from .query_progress_provider import QueryProgressProvider
+from .static_progress_provider import StaticProgressProvider, StaticProgressStore
+
+AsyncDataFrameProducer = Callable[[], Awaitable[DataFrame]]
+AsyncCypherQueryFunction = Callable[[str, Optional[str]], Awaitable[DataFrame]]
+AsyncServerVersionFunction = Callable[[], Awaitable[ServerVersion]]
+
+
+class AsyncQueryProgressLogger:
+    """
+    Counterpart of `QueryProgressLogger` for the event loop.
+    The progress is polled by the awaiting coroutine itself, so no thread is needed per running procedure.
+    """
+
+    _LOG_POLLING_INTERVAL = QueryProgressLogger._LOG_POLLING_INTERVAL
+
+    def __init__(
+        self,
+        run_cypher_func: AsyncCypherQueryFunction,
+        server_version_func: AsyncServerVersionFunction,
+    ):
+        self._run_cypher_func = run_cypher_func
+        self._server_version_func = server_version_func
+        self._static_progress_provider = StaticProgressProvider()
+
+    async def run_with_progress_logging(
+        self, runnable: AsyncDataFrameProducer, job_id: str, database: Optional[str] = None
+    ) -> DataFrame:
+        server_version = await self._server_version_func()
+        if server_version < ServerVersion(2, 1, 0):
+            return await runnable()
+
+        task = asyncio.ensure_future(runnable())
+        try:
+            await self._log(task, job_id, server_version, database)
+        finally:
+            if not task.done():
+                task.cancel()
+
+        return task.result()
+
+    async def _log(
+        self,
+        task: "asyncio.Future[DataFrame]",
+        job_id: str,
+        server_version: ServerVersion,
+        database: Optional[str] = None,
+    ) -> None:
+        pbar: Optional[tqdm[NoReturn]] = None
+        warn_if_failure = True
+
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=self._LOG_POLLING_INTERVAL)
+            if done:
+                break
+
+            try:
+                task_with_progress = await self._root_task_with_progress(job_id, server_version, database)
+                pbar = QueryProgressLogger.update_progress_bar(pbar, task_with_progress)
+            except Exception as e:
+                warn_if_failure = QueryProgressLogger.handle_progress_failure(e, job_id, warn_if_failure)
+
+        if pbar is not None:
+            QueryProgressLogger.finish_progress_bar(pbar)
+
+    async def _root_task_with_progress(
+        self, job_id: str, server_version: ServerVersion, database: Optional[str]
+    ) -> TaskWithProgress:
+        # entries in the static progress store are already visible at this point
+        if StaticProgressStore.contains_job_id(job_id):
+            return self._static_progress_provider.root_task_with_progress(job_id, database)
+
+        progress = await self._run_cypher_func(QueryProgressProvider.root_task_query(job_id, server_version), database)
+        # expect at exactly one row (query will fail if not existing)
+        return QueryProgressProvider.parse_root_task(progress.squeeze())
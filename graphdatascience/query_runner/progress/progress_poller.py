@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from threading import Condition, Lock, Thread
+from typing import Callable, Optional
+
+from .progress_provider import ProgressProvider, TaskWithProgress
+
+ProgressCallback = Callable[[TaskWithProgress], None]
+ErrorCallback = Callable[[Exception], None]
+
+
+@dataclass(eq=False)
+class ProgressWatch:
+    job_id: str
+    progress_provider: ProgressProvider
+    database: Optional[str]
+    on_progress: ProgressCallback
+    on_error: ErrorCallback
+    interval: float
+    next_poll_at: float
+    last_progress: Optional[TaskWithProgress] = None
+    active: bool = True
+    # held while the callbacks run, so that no callback runs after the watch was removed
+    lock: Lock = field(default_factory=Lock)
+
+
+class ProgressPoller:
+    """
+    Polls the progress of all watched jobs from a single background thread.
+    On every tick, the progress of all due jobs sharing a progress provider and database is fetched together.
+    Jobs whose progress did not change since the last poll are polled less and less frequently.
+    """
+
+    _MIN_POLLING_INTERVAL = 0.5
+    _MAX_POLLING_INTERVAL = 5.0
+    _BACK_OFF_FACTOR = 1.5
+
+    _instance: Optional[ProgressPoller] = None
+    _instance_lock = Lock()
+
+    @staticmethod
+    def instance() -> ProgressPoller:
+        with ProgressPoller._instance_lock:
+            if ProgressPoller._instance is None:
+                ProgressPoller._instance = ProgressPoller()
+            return ProgressPoller._instance
+
+    def __init__(self) -> None:
+        self._watches: list[ProgressWatch] = []
+        self._condition = Condition()
+        self._thread: Optional[Thread] = None
+
+    def watch(
+        self,
+        job_id: str,
+        progress_provider: ProgressProvider,
+        database: Optional[str],
+        on_progress: ProgressCallback,
+        on_error: ErrorCallback,
+    ) -> ProgressWatch:
+        watch = ProgressWatch(
+            job_id,
+            progress_provider,
+            database,
+            on_progress,
+            on_error,
+            interval=self._MIN_POLLING_INTERVAL,
+            next_poll_at=time.monotonic() + self._MIN_POLLING_INTERVAL,
+        )
+
+        with self._condition:
+            self._watches.append(watch)
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="gds-progress-poller", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+        return watch
+
+    def unwatch(self, watch: ProgressWatch) -> None:
+        with self._condition:
+            if watch in self._watches:
+                self._watches.remove(watch)
+
+        # wait for callbacks currently running for the watch
+        with watch.lock:
+            watch.active = False
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                due_watches = self._wait_for_due_watches()
+                if due_watches is None:
+                    self._thread = None
+                    return
+
+            for watches in self._group(due_watches).values():
+                self._poll(watches)
+
+    def _wait_for_due_watches(self) -> Optional[list[ProgressWatch]]:
+        while True:
+            if not self._watches:
+                # no thread is kept around while no job is watched, a new one is started by the next watch
+                return None
+
+            now = time.monotonic()
+            next_poll_at = min(watch.next_poll_at for watch in self._watches)
+            if next_poll_at <= now:
+                # watches becoming due shortly after are polled along, so that their lookups can be batched
+                return [watch for watch in self._watches if watch.next_poll_at <= now + self._MIN_POLLING_INTERVAL / 2]
+
+            self._condition.wait(timeout=next_poll_at - now)
+
+    @staticmethod
+    def _group(watches: list[ProgressWatch]) -> dict[tuple[int, Optional[str]], list[ProgressWatch]]:
+        groups: dict[tuple[int, Optional[str]], list[ProgressWatch]] = {}
+        for watch in watches:
+            groups.setdefault((id(watch.progress_provider), watch.database), []).append(watch)
+        return groups
+
+    def _poll(self, watches: list[ProgressWatch]) -> None:
+        progress_provider = watches[0].progress_provider
+        database = watches[0].database
+
+        error: Optional[Exception] = None
+        tasks: dict[str, TaskWithProgress] = {}
+        try:
+            tasks = progress_provider.root_tasks_with_progress([watch.job_id for watch in watches], database)
+        except Exception as e:
+            error = e
+
+        for watch in watches:
+            with watch.lock:
+                if not watch.active:
+                    continue
+
+                task = tasks.get(watch.job_id)
+                try:
+                    self._dispatch(watch, task, error)
+                except Exception:
+                    # a failing callback must not stop the polling of the other jobs
+                    logging.getLogger(__name__).exception(f"Failed to handle the progress of job `{watch.job_id}`")
+
+                # jobs which have not started yet or already completed are not listed
+                unchanged = task is None or task == watch.last_progress
+                watch.last_progress = task or watch.last_progress
+                watch.interval = (
+                    min(watch.interval * self._BACK_OFF_FACTOR, self._MAX_POLLING_INTERVAL)
+                    if unchanged or error is not None
+                    else self._MIN_POLLING_INTERVAL
+                )
+                watch.next_poll_at = time.monotonic() + watch.interval
+
+    @staticmethod
+    def _dispatch(watch: ProgressWatch, task: Optional[TaskWithProgress], error: Optional[Exception]) -> None:
+        if error is not None:
+            watch.on_error(error)
+            return
+
+        if task is not None:
+            try:
+                watch.on_progress(task)
+            except Exception as e:
+                watch.on_error(e)
@@ -15,3 +15,9 @@ class ProgressProvider(ABC):
     def root_task_with_progress(self, job_id: str, database: Optional[str] = None) -> TaskWithProgress:
         """Return the task with progress for the given job_id."""
         pass
+
+    def root_tasks_with_progress(
+        self, job_ids: list[str], database: Optional[str] = None
+    ) -> dict[str, TaskWithProgress]:
+        """Return the tasks with progress for the given job_ids, omitting jobs which are not running."""
+        return {job_id: self.root_task_with_progress(job_id, database) for job_id in job_ids}
@@ -1,12 +1,12 @@
 import warnings
-from concurrent.futures import Future, ThreadPoolExecutor, wait
-from typing import Any, Callable, NoReturn, Optional
+from typing import Callable, NoReturn, Optional
 
 from pandas import DataFrame
 from tqdm.auto import tqdm
 
 from ...server_version.server_version import ServerVersion
-from .progress_provider import ProgressProvider
+from .progress_poller import ProgressPoller
+from .progress_provider import ProgressProvider, TaskWithProgress
 from .query_progress_provider import CypherQueryFunction, QueryProgressProvider, ServerVersionFunction
 from .static_progress_provider import StaticProgressProvider, StaticProgressStore
 
@@ -20,11 +20,13 @@ class QueryProgressLogger:
         self,
         run_cypher_func: CypherQueryFunction,
         server_version_func: ServerVersionFunction,
+        progress_poller: Optional[ProgressPoller] = None,
     ):
         self._run_cypher_func = run_cypher_func
         self._server_version_func = server_version_func
         self._static_progress_provider = StaticProgressProvider()
         self._query_progress_provider = QueryProgressProvider(run_cypher_func, server_version_func)
+        self._progress_poller = progress_poller if progress_poller is not None else ProgressPoller.instance()
 
     def run_with_progress_logging(
         self, runnable: DataFrameProducer, job_id: str, database: Optional[str] = None
@@ -36,15 +38,25 @@ class QueryProgressLogger:
         # Entries in the static progress store are already visible at this point.
         progress_provider = self._select_progress_provider(job_id)
 
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(runnable)
+        pbar: Optional[tqdm[NoReturn]] = None
+        warn_if_failure = True
 
-            self._log(future, job_id, progress_provider, database)
+        def on_progress(task_with_progress: TaskWithProgress) -> None:
+            nonlocal pbar
+            pbar = self.update_progress_bar(pbar, task_with_progress)
 
-            if future.exception():
-                raise future.exception()  # type: ignore
-            else:
-                return future.result()
+        def on_error(e: Exception) -> None:
+            nonlocal warn_if_failure
+            warn_if_failure = self.handle_progress_failure(e, job_id, warn_if_failure)
+
+        # the procedure runs on the calling thread, while the shared poller fetches its progress
+        watch = self._progress_poller.watch(job_id, progress_provider, database, on_progress, on_error)
+        try:
+            return runnable()
+        finally:
+            self._progress_poller.unwatch(watch)
+            if pbar is not None:
+                self.finish_progress_bar(pbar)
 
     def _select_progress_provider(self, job_id: str) -> ProgressProvider:
         return (
@@ -53,53 +65,52 @@ class QueryProgressLogger:
             else self._query_progress_provider
         )
 
-    def _log(
-        self, future: "Future[Any]", job_id: str, progress_provider: ProgressProvider, database: Optional[str] = None
-    ) -> None:
-        pbar: Optional[tqdm[NoReturn]] = None
-        warn_if_failure = True
-
-        while wait([future], timeout=self._LOG_POLLING_INTERVAL).not_done:
-            try:
-                task_with_progress = progress_provider.root_task_with_progress(job_id, database)
-                root_task_name = task_with_progress.task_name
-                progress_percent = task_with_progress.progress_percent
-
-                has_relative_progress = progress_percent != "n/a"
-                if pbar is None:
-                    if has_relative_progress:
-                        pbar = tqdm(total=100, unit="%", desc=root_task_name, maxinterval=self._LOG_POLLING_INTERVAL)
-                    else:
-                        # TODO add {n_fmt} once task_with_progress provides the absolute progress
-                        pbar = tqdm(
-                            total=None,
-                            unit="",
-                            desc=root_task_name,
-                            maxinterval=self._LOG_POLLING_INTERVAL,
-                            bar_format="{desc} [elapsed: {elapsed} {postfix}]",
-                        )
-
-                pbar.set_postfix_str(f"status: {task_with_progress.status}")
-                if has_relative_progress:
-                    parsed_progress = float(progress_percent[:-1])
-                    new_progress = parsed_progress - pbar.n
-                    pbar.update(new_progress)
-                else:
-                    pbar.refresh()  # show latest elapsed time + postfix
-            except Exception as e:
-                # Do nothing if the procedure either:
-                # * has not started yet,
-                # * has already completed.
-                if f"No task with job id `{job_id}` was found" in str(e):
-                    continue
-                else:
-                    if warn_if_failure:
-                        warnings.warn(f"Unable to get progress: {str(e)}", RuntimeWarning)
-                        warn_if_failure = False
-                    continue
-
-        if pbar is not None:
-            if pbar.total is not None:
-                pbar.update(pbar.total - pbar.n)
-            pbar.set_postfix_str("status: finished")
-            pbar.refresh()
+    @staticmethod
+    def update_progress_bar(pbar: Optional["tqdm[NoReturn]"], task_with_progress: TaskWithProgress) -> "tqdm[NoReturn]":
+        root_task_name = task_with_progress.task_name
+        progress_percent = task_with_progress.progress_percent
+
+        has_relative_progress = progress_percent != "n/a"
+        if pbar is None:
+            if has_relative_progress:
+                pbar = tqdm(
+                    total=100, unit="%", desc=root_task_name, maxinterval=QueryProgressLogger._LOG_POLLING_INTERVAL
+                )
+            else:
+                # TODO add {n_fmt} once task_with_progress provides the absolute progress
+                pbar = tqdm(
+                    total=None,
+                    unit="",
+                    desc=root_task_name,
+                    maxinterval=QueryProgressLogger._LOG_POLLING_INTERVAL,
+                    bar_format="{desc} [elapsed: {elapsed} {postfix}]",
+                )
+
+        pbar.set_postfix_str(f"status: {task_with_progress.status}")
+        if has_relative_progress:
+            parsed_progress = float(progress_percent[:-1])
+            new_progress = parsed_progress - pbar.n
+            pbar.update(new_progress)
+        else:
+            pbar.refresh()  # show latest elapsed time + postfix
+
+        return pbar
+
+    @staticmethod
+    def handle_progress_failure(e: Exception, job_id: str, warn_if_failure: bool) -> bool:
+        # Do nothing if the procedure either:
+        # * has not started yet,
+        # * has already completed.
+        if f"No task with job id `{job_id}` was found" in str(e):
+            return warn_if_failure
+
+        if warn_if_failure:
+            warnings.warn(f"Unable to get progress: {str(e)}", RuntimeWarning)
+        return False
+
+    @staticmethod
+    def finish_progress_bar(pbar: "tqdm[NoReturn]") -> None:
+        if pbar.total is not None:
+            pbar.update(pbar.total - pbar.n)
+        pbar.set_postfix_str("status: finished")
+        pbar.refresh()
@@ -1,6 +1,6 @@
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
-from pandas import DataFrame
+from pandas import DataFrame, Series
 
 from ...server_version.server_version import ServerVersion
 from .progress_provider import ProgressProvider, TaskWithProgress
@@ -20,17 +20,50 @@ class QueryProgressProvider(ProgressProvider):
         self._server_version_func = server_version_func
 
     def root_task_with_progress(self, job_id: str, database: Optional[str] = None) -> TaskWithProgress:
-        tier = "beta." if self._server_version_func() < ServerVersion(2, 5, 0) else ""
-        # we only retrieve the progress of the root task
         progress = self._run_cypher_func(
+            self.root_task_query(job_id, self._server_version_func()),
+            database,
+        ).squeeze()  # expect at exactly one row (query will fail if not existing)
+
+        return self.parse_root_task(progress)
+
+    @staticmethod
+    def root_task_query(job_id: str, server_version: ServerVersion) -> str:
+        tier = "beta." if server_version < ServerVersion(2, 5, 0) else ""
+        # we only retrieve the progress of the root task
+        return (
             f"CALL gds.{tier}listProgress('{job_id}')"
             + " YIELD taskName, progress, status"
             + " RETURN taskName, progress, status"
-            + " LIMIT 1",
-            database,
-        ).squeeze()  # expect at exactly one row (query will fail if not existing)
+            + " LIMIT 1"
+        )
+
+    def root_tasks_with_progress(
+        self, job_ids: list[str], database: Optional[str] = None
+    ) -> dict[str, TaskWithProgress]:
+        if not job_ids:
+            return {}
+
+        progress = self._run_cypher_func(self.root_tasks_query(job_ids, self._server_version_func()), database)
+
+        return {row["jobId"]: self.parse_root_task(row) for _, row in progress.iterrows()}
+
+    @staticmethod
+    def root_tasks_query(job_ids: list[str], server_version: ServerVersion) -> str:
+        tier = "beta." if server_version < ServerVersion(2, 5, 0) else ""
+        job_id_literals = ", ".join("'" + job_id.replace("\\", "\\\\").replace("'", "\\'") + "'" for job_id in job_ids)
+        # without a job id, only the root task of every job is listed
+        return (
+            f"CALL gds.{tier}listProgress()"
+            + " YIELD jobId, taskName, progress, status"
+            + f" WHERE jobId IN [{job_id_literals}]"
+            + " RETURN jobId, taskName, progress, status"
+        )
 
+    @staticmethod
+    def parse_root_task(progress: "Series[Any]") -> TaskWithProgress:
         progress_percent = progress["progress"]
-        root_task_name = progress["taskName"].split("|--")[-1][1:]
+        # the task tree of a single job prefixes the task names, while the list of all jobs does not
+        root_task_name = progress["taskName"].split("|--")[-1].strip()
 
         return TaskWithProgress(root_task_name, progress_percent, progress["status"])
@@ -1,14 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Iterator, NamedTuple, Optional
 
 from pandas import DataFrame
 
 from ..call_parameters import CallParameters
 from ..server_version.server_version import ServerVersion
+from .arrow_result_format import ArrowResult
 from .graph_constructor import GraphConstructor
+from .server_capabilities import ServerCapabilities
+
+
+class ProcedureCall(NamedTuple):
+    endpoint: str
+    params: Optional[CallParameters] = None
+    yields: Optional[list[str]] = None
 
 
 class QueryRunner(ABC):
+    _server_capabilities: Optional[ServerCapabilities] = None
+
     @abstractmethod
     def call_procedure(
         self,
@@ -21,6 +31,15 @@ class QueryRunner(ABC):
     ) -> DataFrame:
         pass
 
+    def call_procedures(self, calls: list[ProcedureCall], database: Optional[str] = None) -> list[DataFrame]:
+        return [self.call_procedure(call.endpoint, call.params, call.yields, database) for call in calls]
+
+    def call_stream_procedure(
+        self, endpoint: str, params: Optional[CallParameters] = None, database: Optional[str] = None
+    ) -> ArrowResult:
+        # only results streamed over Arrow can be returned in another format than pandas
+        return self.call_procedure(endpoint, params, database=database)
+
     @abstractmethod
     def call_function(self, endpoint: str, params: Optional[CallParameters] = None) -> Any:
         pass
@@ -35,6 +54,21 @@ class QueryRunner(ABC):
     ) -> DataFrame:
         pass
 
+    def run_cypher_iter(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+        chunk_size: int = 10_000,
+    ) -> Iterator[DataFrame]:
+        if chunk_size < 1:
+            raise ValueError(f"The chunk size must be a positive number, but got {chunk_size}.")
+
+        # runners without a streaming connection fetch the complete result and split it
+        result = self.run_cypher(query, params, database, custom_error)
+        return (result.iloc[offset : offset + chunk_size] for offset in range(0, len(result), chunk_size))
+
     @abstractmethod
     def server_version(self) -> ServerVersion:
         pass
@@ -82,3 +116,8 @@ class QueryRunner(ABC):
 
     def set_server_version(self, _: ServerVersion) -> None:
         pass
+
+    def server_capabilities(self) -> ServerCapabilities:
+        if self._server_capabilities is None:
+            self._server_capabilities = ServerCapabilities(self)
+        return self._server_capabilities
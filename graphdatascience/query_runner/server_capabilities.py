@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import re
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar
+
+from neo4j.exceptions import Neo4jError
+
+from ..server_version.server_version import ServerVersion
+from .arrow_info import ArrowInfo
+
+if TYPE_CHECKING:
+    from .query_runner import QueryRunner
+
+T = TypeVar("T")
+
+
+class ServerCapabilities:
+    """
+    Properties of the GDS server behind a query runner, which do not change during its lifetime.
+    Each property is fetched from the server on first access only.
+    """
+
+    def __init__(self, query_runner: QueryRunner):
+        self._query_runner = query_runner
+        self._lock = Lock()
+        self._cache: dict[str, object] = {}
+
+    def server_version(self) -> ServerVersion:
+        return self._cached("server_version", self._query_runner.server_version)
+
+    def edition(self) -> Optional[str]:
+        """
+        The `gdsEdition` reported by `gds.debug.sysInfo`, or `None` if the procedure is not available such as on AuraDS.
+        """
+        return self._cached("edition", self._fetch_edition)
+
+    def is_licensed(self) -> bool:
+        return self._cached("is_licensed", self._fetch_is_licensed)
+
+    def arrow_info(self) -> ArrowInfo:
+        return self._cached("arrow_info", self._fetch_arrow_info)
+
+    def protocol_versions(self) -> list[str]:
+        return self._cached("protocol_versions", self._fetch_protocol_versions)
+
+    def procedure_yields(self, endpoints: list[str]) -> dict[str, list[str]]:
+        """
+        The names of the output columns of the given procedures, fetched together for all procedures not seen before.
+        """
+        with self._lock:
+            missing = [endpoint for endpoint in endpoints if f"yields.{endpoint}" not in self._cache]
+
+        if missing:
+            fetched = self._fetch_procedure_yields(missing)
+            with self._lock:
+                for endpoint, yields in fetched.items():
+                    self._cache.setdefault(f"yields.{endpoint}", yields)
+
+        with self._lock:
+            return {endpoint: self._cache[f"yields.{endpoint}"] for endpoint in endpoints}  # type: ignore
+
+    def _cached(self, key: str, fetch: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]  # type: ignore
+
+        # fetched outside of the lock, as fetching may depend on other capabilities
+        value = fetch()
+
+        with self._lock:
+            return self._cache.setdefault(key, value)  # type: ignore
+
+    def _fetch_edition(self) -> Optional[str]:
+        try:
+            edition: str = self._query_runner.run_cypher(
+                "CALL gds.debug.sysInfo() YIELD key, value WHERE key = 'gdsEdition' RETURN value", custom_error=False
+            ).squeeze()
+        except Exception as e:
+            if (
+                "There is no procedure with the name `gds.debug.sysInfo` "
+                "registered for this database instance." in str(e)
+            ):
+                return None
+            raise e
+
+        return edition
+
+    def _fetch_is_licensed(self) -> bool:
+        if self.server_version() >= ServerVersion(2, 5, 0):
+            query = "RETURN gds.isLicensed()"
+        else:
+            query = """
+            CALL gds.debug.sysInfo()
+            YIELD key, value
+            WHERE key = 'gdsEdition'
+            RETURN
+                CASE value
+                    WHEN 'Licensed' THEN true
+                    ELSE false
+                END
+            """
+
+        try:
+            is_licensed: bool = self._query_runner.run_cypher(query, custom_error=False).squeeze()
+        except Exception as e:
+            # AuraDS does not have `gds.isLicensed`, but is always GDS EE.
+            if re.match(r".*Unknown function 'gds.isLicensed'.*", str(e)):
+                return True
+            raise e
+
+        return is_licensed
+
+    def _fetch_arrow_info(self) -> ArrowInfo:
+        result = self._query_runner.call_procedure(
+            endpoint="gds.debug.arrow", custom_error=False, yields=ArrowInfo.debug_yields(self.server_version())
+        )
+
+        return ArrowInfo.from_debug_result(result)
+
+    def _fetch_procedure_yields(self, endpoints: list[str]) -> dict[str, list[str]]:
+        result = self._query_runner.run_cypher(
+            "SHOW PROCEDURES YIELD name, returnDescription WHERE name IN $names"
+            " RETURN name, [output IN returnDescription | output.name] AS yields",
+            {"names": endpoints},
+            custom_error=False,
+        )
+        yields = {name: list(outputs) for name, outputs in zip(result.get("name", []), result.get("yields", []))}
+
+        unknown_endpoints = [endpoint for endpoint in endpoints if endpoint not in yields]
+        if unknown_endpoints:
+            raise ValueError(
+                f"There is no procedure with the name `{unknown_endpoints[0]}` registered for this database instance."
+            )
+
+        return yields
+
+    def _fetch_protocol_versions(self) -> list[str]:
+        try:
+            versions: list[str] = self._query_runner.call_procedure(
+                "gds.session.dbms.protocol.version", yields=["version"]
+            )["version"].to_list()
+        except Neo4jError:
+            # servers without the procedure only support the first protocol version
+            return ["v1"]
+
+        return versions
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 from uuid import uuid4
 
 from pandas import DataFrame
@@ -12,10 +12,12 @@ from graphdatascience.server_version.server_version import ServerVersion
 
 from ..call_parameters import CallParameters
 from ..session.dbms.protocol_resolver import ProtocolVersionResolver
+from .arrow_result_format import ArrowResult
 from .gds_arrow_client import GdsArrowClient
 from .protocol.project_protocols import ProjectProtocol
 from .protocol.write_protocols import WriteProtocol
 from .query_runner import QueryRunner
+from .server_capabilities import ServerCapabilities
 
 
 class SessionQueryRunner(QueryRunner):
@@ -53,6 +55,16 @@ class SessionQueryRunner(QueryRunner):
     ) -> DataFrame:
         return self._db_query_runner.run_cypher(query, params, database, custom_error)
 
+    def run_cypher_iter(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+        chunk_size: int = 10_000,
+    ) -> Iterator[DataFrame]:
+        return self._db_query_runner.run_cypher_iter(query, params, database, custom_error, chunk_size)
+
     def call_function(self, endpoint: str, params: Optional[CallParameters] = None) -> Any:
         return self._gds_query_runner.call_function(endpoint, params)
 
@@ -76,6 +88,11 @@ class SessionQueryRunner(QueryRunner):
 
         return self._gds_query_runner.call_procedure(endpoint, params, yields, database, logging, custom_error)
 
+    def call_stream_procedure(
+        self, endpoint: str, params: Optional[CallParameters] = None, database: Optional[str] = None
+    ) -> ArrowResult:
+        return self._gds_query_runner.call_stream_procedure(endpoint, params, database)
+
     def is_remote_projected_graph(self, graph_name: str) -> bool:
         database_location: str = self._gds_query_runner.call_procedure(
             endpoint="gds.graph.list",
@@ -87,6 +104,9 @@ class SessionQueryRunner(QueryRunner):
     def server_version(self) -> ServerVersion:
         return self._db_query_runner.server_version()
 
+    def server_capabilities(self) -> ServerCapabilities:
+        return self._db_query_runner.server_capabilities()
+
     def driver_config(self) -> dict[str, Any]:
         return self._db_query_runner.driver_config()
 
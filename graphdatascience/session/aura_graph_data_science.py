@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Iterator, Optional, Union
 
 from pandas import DataFrame
 
@@ -15,7 +15,7 @@ from graphdatascience.error.uncallable_namespace import UncallableNamespace
 from graphdatascience.graph.graph_remote_proc_runner import GraphRemoteProcRunner
 from graphdatascience.query_runner.arrow_info import ArrowInfo
 from graphdatascience.query_runner.arrow_query_runner import ArrowQueryRunner
-from graphdatascience.query_runner.gds_arrow_client import GdsArrowClient
+from graphdatascience.query_runner.gds_arrow_client import GdsArrowClient, PandasConversionOptions
 from graphdatascience.query_runner.neo4j_query_runner import Neo4jQueryRunner
 from graphdatascience.query_runner.session_query_runner import SessionQueryRunner
 from graphdatascience.session.dbms_connection_info import DbmsConnectionInfo
@@ -38,6 +38,11 @@ class AuraGraphDataScience(DirectEndpoints, UncallableNamespace):
         arrow_tls_root_certs: Optional[bytes] = None,
         bookmarks: Optional[Any] = None,
         show_progress: bool = True,
+        arrow_compression: Optional[str] = None,
+        arrow_result_format: str = "pandas",
+        arrow_upload_window: int = 1,
+        arrow_parallel_streams: int = 1,
+        arrow_pandas_conversion: Optional[PandasConversionOptions] = None,
     ) -> AuraGraphDataScience:
         # we need to explicitly set this as the default value is None
         # database in the session is always neo4j
@@ -55,6 +60,11 @@ class AuraGraphDataScience(DirectEndpoints, UncallableNamespace):
             encrypted=session_bolt_query_runner.encrypted(),
             disable_server_verification=arrow_disable_server_verification,
             tls_root_certs=arrow_tls_root_certs,
+            pandas_conversion=arrow_pandas_conversion,
+            parallel_streams=arrow_parallel_streams,
+            upload_window=arrow_upload_window,
+            compression=arrow_compression,
+            result_format=arrow_result_format,
         )
 
         # TODO: merge with the gds_arrow_client created inside ArrowQueryRunner
@@ -64,6 +74,8 @@ class AuraGraphDataScience(DirectEndpoints, UncallableNamespace):
             session_bolt_query_runner.encrypted(),
             arrow_disable_server_verification,
             arrow_tls_root_certs,
+            upload_window=arrow_upload_window,
+            compression=arrow_compression,
         )
 
         if isinstance(db_endpoint, Neo4jQueryRunner):
@@ -124,6 +136,32 @@ class AuraGraphDataScience(DirectEndpoints, UncallableNamespace):
         """
         return self._query_runner.run_cypher(query, params, database, False)
 
+    def run_cypher_iter(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        database: Optional[str] = None,
+        chunk_size: int = 10_000,
+    ) -> Iterator[DataFrame]:
+        """
+        Run a Cypher query against the Neo4j database and consume its result in chunks.
+
+        Parameters
+        ----------
+        query: str
+            the Cypher query
+        params: dict[str, Any]
+            parameters to the query
+        database: str
+            the database on which to run the query
+        chunk_size: int
+            the maximum number of rows per chunk
+
+        Returns:
+            An iterator over the query result as DataFrames of at most `chunk_size` rows
+        """
+        return self._query_runner.run_cypher_iter(query, params, database, False, chunk_size)
+
     @property
     def graph(self) -> GraphRemoteProcRunner:
         return GraphRemoteProcRunner(self._query_runner, f"{self._namespace}.graph", self._server_version)
@@ -1,7 +1,5 @@
 from typing import Optional
 
-from neo4j.exceptions import Neo4jError
-
 from graphdatascience import QueryRunner
 from graphdatascience.session.dbms.protocol_version import ProtocolVersion
 
@@ -34,19 +32,13 @@ class ProtocolVersionResolver:
         return cached_protocol_versions
 
     def _fetch_from_server(self) -> list[ProtocolVersion]:
-        try:
-            version_list = []
-            for version_string in self._query_runner.call_procedure(
-                "gds.session.dbms.protocol.version", yields=["version"]
-            )["version"].to_list():
-                parsed_version = self._from_str(version_string)
-                if parsed_version:
-                    version_list.append(parsed_version)
-
-            return version_list
+        version_list = []
+        for version_string in self._query_runner.server_capabilities().protocol_versions():
+            parsed_version = self._from_str(version_string)
+            if parsed_version:
+                version_list.append(parsed_version)
 
-        except Neo4jError:
-            return [ProtocolVersion.V1]
+        return version_list
 
     @staticmethod
     def _from_str(version_string: str) -> Optional[ProtocolVersion]:
@@ -50,30 +50,7 @@ class LicenseProcRunner(UncallableNamespace, IllegalAttrChecker):
 class DirectSystemEndpoints(CallerBase):
     @client_only_endpoint("gds")
     def is_licensed(self) -> bool:
-        if self._server_version >= ServerVersion(2, 5, 0):
-            query = "RETURN gds.isLicensed()"
-        else:
-            query = """
-            CALL gds.debug.sysInfo()
-            YIELD key, value
-            WHERE key = 'gdsEdition'
-            RETURN
-                CASE value
-                    WHEN 'Licensed' THEN true
-                    ELSE false
-                END
-            """
-
-        try:
-            isLicensed: bool = self._query_runner.run_cypher(query, custom_error=False).squeeze()
-        except Exception as e:
-            # AuraDS does not have `gds.isLicensed`, but is always GDS EE.
-            if re.match(r".*Unknown function 'gds.isLicensed'.*", str(e)):
-                isLicensed = True
-            else:
-                raise e
-
-        return isLicensed
+        return self._query_runner.server_capabilities().is_licensed()
 
     @property
     def license(self) -> LicenseProcRunner:
@@ -16,3 +16,4 @@ def pytest_addoption(parser: Any) -> None:
     parser.addoption(
         "--include-cloud-architecture", action="store_true", help="include tests resuiring a cloud architecture setup"
     )
+    parser.addoption("--include-benchmarks", action="store_true", help="include client side performance benchmarks")
@@ -154,6 +154,12 @@ def pytest_collection_modifyitems(config: Any, items: Any) -> None:
             if "ogb" in item.keywords:
                 item.add_marker(skip_ogb_only)
 
+    if not config.getoption("--include-benchmarks"):
+        skip_benchmark = pytest.mark.skip(reason="need --include-benchmarks option to run")
+        for item in items:
+            if "benchmark" in item.keywords:
+                item.add_marker(skip_benchmark)
+
     if not config.getoption("--include-enterprise"):
         skip_enterprise = pytest.mark.skip(reason="need --include-enterprise option to run")
         for item in items:
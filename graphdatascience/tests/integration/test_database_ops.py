@@ -1,14 +1,13 @@
-import concurrent.futures as f
 import re
 import time
 
 import pytest
 from neo4j import Driver
+from pandas import DataFrame
 
 from graphdatascience.graph_data_science import GraphDataScience
 from graphdatascience.query_runner.neo4j_query_runner import Neo4jQueryRunner
-from graphdatascience.query_runner.progress.static_progress_provider import StaticProgressProvider
-from graphdatascience.tests.integration.conftest import AUTH, URI
+from graphdatascience.tests.integration.conftest import AUTH, DB, URI
 from graphdatascience.version import __version__
 
 GRAPH_NAME = "g"
@@ -183,10 +182,12 @@ def test_no_db_explicitly_set() -> None:
 
 
 def test_warning_when_logging_fails(runner: Neo4jQueryRunner) -> None:
-    with f.ThreadPoolExecutor(1) as pool:
-        future = pool.submit(lambda: time.sleep(2))
-        with pytest.warns(RuntimeWarning, match=r"^Unable to get progress:"):
-            runner._progress_logger._log(future, "DUMMY", StaticProgressProvider(), "bad_database")
+    def runnable() -> DataFrame:
+        time.sleep(2)
+        return DataFrame()
+
+    with pytest.warns(RuntimeWarning, match=r"^Unable to get progress:"):
+        runner._progress_logger.run_with_progress_logging(runnable, "DUMMY", "bad_database")
 
 
 def test_bookmarks(runner: Neo4jQueryRunner) -> None:
@@ -204,3 +205,18 @@ def test_bookmarks(runner: Neo4jQueryRunner) -> None:
 
     runner.run_cypher("MATCH (n) DETACH DELETE n")
     runner.set_bookmarks(None)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("reuse_sessions", [False, True])
+def test_benchmark_run_cypher(reuse_sessions: bool) -> None:
+    runner = Neo4jQueryRunner.create_for_db(URI, AUTH, database=DB, reuse_sessions=reuse_sessions)
+    num_calls = 1_000
+
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        runner.run_cypher("RETURN gds.version()")
+    elapsed = time.perf_counter() - start
+
+    runner.close()
+    print(f"\n{num_calls / elapsed:,.0f} calls/s with reuse_sessions={reuse_sessions}")
@@ -5,6 +5,7 @@ import numpy as np
 import pytest
 from pandas import DataFrame, Series
 
+from graphdatascience.graph.graph_entity_ops_runner import TopologyDataFrame
 from graphdatascience.graph_data_science import GraphDataScience
 from graphdatascience.query_runner.arrow_query_runner import ArrowQueryRunner
 from graphdatascience.query_runner.query_runner import QueryRunner
@@ -294,6 +295,7 @@ def test_graph_streamNodeProperty_with_arrow(gds: GraphDataScience) -> None:
 
     with pytest.warns(DeprecationWarning):
         result = gds.graph.streamNodeProperty(G, "x", concurrency=2)
+        assert isinstance(result, DataFrame)
     assert {e for e in result["propertyValue"]} == {1, 2, 3}
 
 
@@ -302,6 +304,7 @@ def test_graph_nodeProperty_stream(gds: GraphDataScience) -> None:
     G, _ = gds.graph.project(GRAPH_NAME, {"Node": {"properties": "x"}}, "*")
 
     result = gds.graph.nodeProperty.stream(G, "x", concurrency=2)
+    assert isinstance(result, DataFrame)
     assert {e for e in result["propertyValue"]} == {1, 2, 3}
 
 
@@ -340,6 +343,7 @@ def test_graph_streamNodeProperty_without_arrow(gds_without_arrow: GraphDataScie
 
     with pytest.warns(DeprecationWarning):
         result = gds_without_arrow.graph.streamNodeProperty(G, "x", concurrency=2)
+        assert isinstance(result, DataFrame)
 
     assert {e for e in result["propertyValue"]} == {1, 2, 3}
 
@@ -349,6 +353,7 @@ def test_graph_nodeProperty_stream_without_arrow(gds_without_arrow: GraphDataSci
     G, _ = gds_without_arrow.graph.project(GRAPH_NAME, {"Node": {"properties": "x"}}, "*")
 
     result = gds_without_arrow.graph.nodeProperty.stream(G, "x", concurrency=2)
+    assert isinstance(result, DataFrame)
 
     assert {e for e in result["propertyValue"]} == {1, 2, 3}
 
@@ -358,6 +363,7 @@ def test_graph_nodeProperty_stream_db_properties(gds: GraphDataScience) -> None:
     G, _ = gds.graph.project(GRAPH_NAME, {"Node": {"properties": "x"}}, "*")
 
     result = gds.graph.nodeProperty.stream(G, "x", db_node_properties=["z", "name"], concurrency=2)
+    assert isinstance(result, DataFrame)
 
     assert {"nodeId", "nodeProperty", "propertyValue"}.issubset(set(result.keys()))
 
@@ -378,6 +384,7 @@ def test_graph_nodeProperty_stream_db_properties_without_arrow(gds_without_arrow
     G, _ = gds_without_arrow.graph.project(GRAPH_NAME, {"Node": {"properties": "x"}}, "*")
 
     result = gds_without_arrow.graph.nodeProperty.stream(G, "x", db_node_properties=["z", "name"], concurrency=2)
+    assert isinstance(result, DataFrame)
 
     assert {"nodeId", "nodeProperty", "propertyValue"}.issubset(set(result.keys()))
 
@@ -415,6 +422,7 @@ def test_graph_nodeProperties_stream_with_arrow(gds: GraphDataScience) -> None:
 
     # also check duplicates will be filtered out
     result = gds.graph.nodeProperties.stream(G, ["x", "y"], db_node_properties=["z", "name"], concurrency=2)
+    assert isinstance(result, DataFrame)
 
     assert list(result.keys()) == ["nodeId", "nodeProperty", "propertyValue"]
     assert result.shape == (G.node_count() * 4, 3)  # 4 properties
@@ -440,6 +448,7 @@ def test_graph_nodeProperties_stream_listNodeLabels_with_arrow(gds: GraphDataSci
     G, _ = gds.graph.project(GRAPH_NAME, {"Node": {"properties": ["x"]}}, "*")
 
     result = gds.graph.nodeProperties.stream(G, ["x"], concurrency=2, listNodeLabels=True)
+    assert isinstance(result, DataFrame)
 
     assert list(result.keys()) == ["nodeId", "nodeLabels", "nodeProperty", "propertyValue"]
 
@@ -454,6 +463,7 @@ def test_graph_nodeProperties_stream_listNodeLabels(gds_without_arrow: GraphData
     G, _ = gds_without_arrow.graph.project(GRAPH_NAME, {"Node": {"properties": ["x"]}}, "*")
 
     result = gds_without_arrow.graph.nodeProperties.stream(G, ["x"], concurrency=2, listNodeLabels=True)
+    assert isinstance(result, DataFrame)
 
     assert list(result.keys()) == ["nodeId", "nodeProperty", "propertyValue", "nodeLabels"]
 
@@ -470,6 +480,7 @@ def test_graph_nodeProperties_stream_listNodeLabels_with_seperate_cols(gds_witho
     result = gds_without_arrow.graph.nodeProperties.stream(
         G, ["x", "y"], concurrency=2, listNodeLabels=True, separate_property_columns=True
     )
+    assert isinstance(result, DataFrame)
 
     expected_columns = ["nodeId", "x", "y", "nodeLabels"]
     assert list(result.keys()) == expected_columns
@@ -484,6 +495,7 @@ def test_graph_streamNodeProperties_with_arrow_separate_property_columns(gds: Gr
 
     with pytest.warns(DeprecationWarning):
         result = gds.graph.streamNodeProperties(G, ["x", "y"], separate_property_columns=True, concurrency=2)
+        assert isinstance(result, DataFrame)
     assert list(result.keys()) == ["nodeId", "x", "y"]
     assert {e for e in result["x"]} == {1, 2, 3}
     assert {e for e in result["y"]} == {2, 3, 4}
@@ -496,6 +508,7 @@ def test_graph_nodeProperties_stream_with_arrow_separate_property_columns(gds: G
     result = gds.graph.nodeProperties.stream(
         G, ["x", "y"], db_node_properties=["z", "name"], separate_property_columns=True, concurrency=2
     )
+    assert isinstance(result, DataFrame)
     assert set(result.keys()) == {"nodeId", "x", "y", "z", "name"}
     assert {e for e in result["x"]} == {1, 2, 3}
     assert {e for e in result["y"]} == {2, 3, 4}
@@ -520,6 +533,7 @@ def test_graph_streamNodeProperties_without_arrow(gds_without_arrow: GraphDataSc
 
     with pytest.warns(DeprecationWarning):
         result = gds_without_arrow.graph.streamNodeProperties(G, ["x", "y"], concurrency=2)
+        assert isinstance(result, DataFrame)
 
     assert {"nodeId", "nodeProperty", "propertyValue"}.issubset(set(result.keys()))
 
@@ -537,6 +551,7 @@ def test_graph_nodeProperties_stream_without_arrow(gds_without_arrow: GraphDataS
     result = gds_without_arrow.graph.nodeProperties.stream(
         G, ["x", "y"], db_node_properties=["z", "name"], concurrency=2
     )
+    assert isinstance(result, DataFrame)
 
     assert {"nodeId", "nodeProperty", "propertyValue", "nodeLabels"} == set(
         result.keys()
@@ -577,6 +592,7 @@ def test_graph_streamNodeProperties_without_arrow_separate_property_columns(
         result = gds_without_arrow.graph.streamNodeProperties(
             G, ["x", "z"], separate_property_columns=True, concurrency=2
         )
+        assert isinstance(result, DataFrame)
 
     assert list(result.keys()) == ["nodeId", "x", "z"]
 
@@ -596,6 +612,7 @@ def test_graph_nodeProperties_stream_without_arrow_separate_property_columns(
     result = gds_without_arrow.graph.nodeProperties.stream(
         G, ["x", "y"], db_node_properties=["z", "name"], separate_property_columns=True, concurrency=2
     )
+    assert isinstance(result, DataFrame)
 
     assert set(result.keys()) == {"nodeId", "x", "y", "z", "name"}
 
@@ -612,6 +629,7 @@ def test_graph_streamRelationshipProperty_with_arrow(gds: GraphDataScience) -> N
 
     with pytest.warns(DeprecationWarning):
         result = gds.graph.streamRelationshipProperty(G, "relX", concurrency=2)
+        assert isinstance(result, DataFrame)
     assert {e for e in result["propertyValue"]} == {4, 5, 6}
 
 
@@ -620,6 +638,7 @@ def test_graph_relationshipProperty_stream_with_arrow(gds: GraphDataScience) ->
     G, _ = gds.graph.project(GRAPH_NAME, "*", {"REL": {"properties": "relX"}})
 
     result = gds.graph.relationshipProperty.stream(G, "relX", concurrency=2)
+    assert isinstance(result, DataFrame)
     assert {e for e in result["propertyValue"]} == {4, 5, 6}
 
 
@@ -628,6 +647,7 @@ def test_graph_streamRelationshipProperty_without_arrow(gds_without_arrow: Graph
 
     with pytest.warns(DeprecationWarning):
         result = gds_without_arrow.graph.streamRelationshipProperty(G, "relX", concurrency=2)
+        assert isinstance(result, DataFrame)
     assert {e for e in result["propertyValue"]} == {4, 5, 6}
 
 
@@ -636,6 +656,7 @@ def test_graph_relationshipProperty_stream_without_arrow(gds_without_arrow: Grap
     G, _ = gds_without_arrow.graph.project(GRAPH_NAME, "*", {"REL": {"properties": "relX"}})
 
     result = gds_without_arrow.graph.relationshipProperty.stream(G, "relX", concurrency=2)
+    assert isinstance(result, DataFrame)
     assert {e for e in result["propertyValue"]} == {4, 5, 6}
 
 
@@ -644,6 +665,7 @@ def test_graph_streamRelationshipProperties_with_arrow(gds: GraphDataScience) ->
 
     with pytest.warns(DeprecationWarning):
         result = gds.graph.streamRelationshipProperties(G, ["relX", "relY"], concurrency=2)
+        assert isinstance(result, DataFrame)
 
     assert list(result.keys()) == [
         "sourceNodeId",
@@ -664,6 +686,7 @@ def test_graph_relationshipProperties_stream_with_arrow(gds: GraphDataScience) -
     G, _ = gds.graph.project(GRAPH_NAME, "*", {"REL": {"properties": ["relX", "relY"]}})
 
     result = gds.graph.relationshipProperties.stream(G, ["relX", "relY"], concurrency=2)
+    assert isinstance(result, DataFrame)
 
     assert list(result.keys()) == [
         "sourceNodeId",
@@ -686,6 +709,7 @@ def test_graph_streamRelationshipProperties_with_arrow_separate_property_columns
         result = gds.graph.streamRelationshipProperties(
             G, ["relX", "relY"], separate_property_columns=True, concurrency=2
         )
+        assert isinstance(result, DataFrame)
 
     assert list(result.keys()) == ["sourceNodeId", "targetNodeId", "relationshipType", "relX", "relY"]
     assert {e for e in result["relX"]} == {4, 5, 6}
@@ -697,6 +721,7 @@ def test_graph_relationshipProperties_stream_with_arrow_separate_property_column
     G, _ = gds.graph.project(GRAPH_NAME, "*", {"REL": {"properties": ["relX", "relY"]}})
 
     result = gds.graph.relationshipProperties.stream(G, ["relX", "relY"], separate_property_columns=True, concurrency=2)
+    assert isinstance(result, DataFrame)
 
     assert list(result.keys()) == ["sourceNodeId", "targetNodeId", "relationshipType", "relX", "relY"]
     assert {e for e in result["relX"]} == {4, 5, 6}
@@ -708,6 +733,7 @@ def test_graph_relationshipProperties_stream_with_arrow_rel_as_str(gds: GraphDat
     G, _ = gds.graph.project(GRAPH_NAME, "*", {"REL": {"properties": ["relX", "relY"]}})
 
     result = gds.graph.relationshipProperties.stream(G, ["relX", "relY"], "REL", concurrency=2)
+    assert isinstance(result, DataFrame)
 
     assert list(result.keys()) == [
         "sourceNodeId",
@@ -730,6 +756,7 @@ def test_graph_relationshipProperties_stream_with_arrow_rel_as_str_sep(gds: Grap
     result = gds.graph.relationshipProperties.stream(
         G, ["relX", "relY"], "REL", separate_property_columns=True, concurrency=2
     )
+    assert isinstance(result, DataFrame)
 
     assert list(result.keys()) == [
         "sourceNodeId",
@@ -748,6 +775,7 @@ def test_graph_streamRelationshipProperties_without_arrow(gds_without_arrow: Gra
 
     with pytest.warns(DeprecationWarning):
         result = gds_without_arrow.graph.streamRelationshipProperties(G, ["relX", "relY"], concurrency=2)
+        assert isinstance(result, DataFrame)
 
     assert list(result.keys()) == [
         "sourceNodeId",
@@ -768,6 +796,7 @@ def test_graph_relationshipProperties_stream_without_arrow(gds_without_arrow: Gr
     G, _ = gds_without_arrow.graph.project(GRAPH_NAME, "*", {"REL": {"properties": ["relX", "relY"]}})
 
     result = gds_without_arrow.graph.relationshipProperties.stream(G, ["relX", "relY"], concurrency=2)
+    assert isinstance(result, DataFrame)
 
     assert list(result.keys()) == [
         "sourceNodeId",
@@ -792,6 +821,7 @@ def test_graph_streamRelationshipProperties_without_arrow_separate_property_colu
         result = gds_without_arrow.graph.streamRelationshipProperties(
             G, ["relX", "relY"], separate_property_columns=True, concurrency=2
         )
+        assert isinstance(result, DataFrame)
 
     assert list(result.keys()) == ["sourceNodeId", "targetNodeId", "relationshipType", "relX", "relY"]
     assert {e for e in result["relX"]} == {4, 5, 6}
@@ -807,6 +837,7 @@ def test_graph_relationshipProperties_stream_without_arrow_separate_property_col
     result = gds_without_arrow.graph.relationshipProperties.stream(
         G, ["relX", "relY"], separate_property_columns=True, concurrency=2
     )
+    assert isinstance(result, DataFrame)
 
     assert list(result.keys()) == ["sourceNodeId", "targetNodeId", "relationshipType", "relX", "relY"]
     assert {e for e in result["relX"]} == {4, 5, 6}
@@ -819,8 +850,10 @@ def test_graph_relationships_stream_without_arrow(gds_without_arrow: GraphDataSc
 
     if gds_without_arrow.server_version() >= ServerVersion(2, 5, 0):
         result = gds_without_arrow.graph.relationships.stream(G, ["REL", "REL2"])
+        assert isinstance(result, TopologyDataFrame)
     else:
         result = gds_without_arrow.beta.graph.relationships.stream(G, ["REL", "REL2"])
+        assert isinstance(result, TopologyDataFrame)
 
     warnings.filterwarnings(
         "ignore", category=DeprecationWarning, message="The query used a deprecated function: `id`."
@@ -860,8 +893,10 @@ def test_graph_relationships_stream_with_arrow(gds: GraphDataScience) -> None:
 
     if gds.server_version() >= ServerVersion(2, 5, 0):
         result = gds.graph.relationships.stream(G, ["REL", "REL2"])
+        assert isinstance(result, TopologyDataFrame)
     else:
         result = gds.beta.graph.relationships.stream(G, ["REL", "REL2"])
+        assert isinstance(result, TopologyDataFrame)
 
     with pytest.warns(DeprecationWarning):
         expected = gds.run_cypher("MATCH (n)-[r]->(m) RETURN id(n) AS src_id, id(m) AS trg_id, type(r) AS rel_type")
@@ -1059,4 +1094,5 @@ def test_empty_relationships_stream(gds: GraphDataScience) -> None:
     assert G.relationship_types()
 
     result = gds.graph.relationships.stream(G, ["SIMILAR"])
+    assert isinstance(result, TopologyDataFrame)
     assert result.empty
@@ -191,3 +191,11 @@ def aura_gds(runner: CollectingQueryRunner, mocker: MockerFixture) -> Generator[
 @pytest.fixture(scope="package")
 def server_version() -> ServerVersion:
     return DEFAULT_SERVER_VERSION
+
+
+def pytest_collection_modifyitems(config: Any, items: Any) -> None:
+    if not config.getoption("--include-benchmarks"):
+        skip_benchmark = pytest.mark.skip(reason="need --include-benchmarks option to run")
+        for item in items:
+            if "benchmark" in item.keywords:
+                item.add_marker(skip_benchmark)
@@ -0,0 +1,65 @@
+import asyncio
+from typing import Optional
+
+import pytest
+from pandas import DataFrame
+
+from graphdatascience import ServerVersion
+from graphdatascience.query_runner.progress.async_query_progress_logger import AsyncQueryProgressLogger
+
+
+def test_polls_progress_while_awaiting() -> None:
+    progress_queries = []
+
+    async def fake_run_cypher(query: str, database: Optional[str] = None) -> DataFrame:
+        progress_queries.append(query)
+        assert database == "database"
+
+        return DataFrame([{"progress": "50%", "taskName": "Test task", "status": "RUNNING"}])
+
+    async def fake_server_version() -> ServerVersion:
+        return ServerVersion(3, 0, 0)
+
+    async def fake_query() -> DataFrame:
+        await asyncio.sleep(0.6)
+        return DataFrame([{"result": 42}])
+
+    qpl = AsyncQueryProgressLogger(fake_run_cypher, fake_server_version)
+    df = asyncio.run(qpl.run_with_progress_logging(fake_query, "foo", "database"))
+
+    assert df["result"][0] == 42
+    assert progress_queries == [
+        "CALL gds.listProgress('foo') YIELD taskName, progress, status RETURN taskName, progress, status LIMIT 1"
+    ]
+
+
+def test_skips_progress_logging_for_old_server_version() -> None:
+    async def fake_run_cypher(query: str, database: Optional[str] = None) -> DataFrame:
+        assert False, "Should not be called!"
+
+    async def fake_server_version() -> ServerVersion:
+        return ServerVersion(2, 0, 0)
+
+    async def fake_query() -> DataFrame:
+        return DataFrame([{"result": 42}])
+
+    qpl = AsyncQueryProgressLogger(fake_run_cypher, fake_server_version)
+    df = asyncio.run(qpl.run_with_progress_logging(fake_query, "foo", "database"))
+
+    assert df["result"][0] == 42
+
+
+def test_propagates_failure_of_runnable() -> None:
+    async def fake_run_cypher(query: str, database: Optional[str] = None) -> DataFrame:
+        raise RuntimeError("No task with job id `foo` was found")
+
+    async def fake_server_version() -> ServerVersion:
+        return ServerVersion(3, 0, 0)
+
+    async def fake_query() -> DataFrame:
+        await asyncio.sleep(0.6)
+        raise ValueError("Procedure failed")
+
+    qpl = AsyncQueryProgressLogger(fake_run_cypher, fake_server_version)
+    with pytest.raises(ValueError, match="Procedure failed"):
+        asyncio.run(qpl.run_with_progress_logging(fake_query, "foo", "database"))
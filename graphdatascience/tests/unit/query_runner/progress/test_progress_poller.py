@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import Optional
+
+from graphdatascience.query_runner.progress.progress_poller import ProgressPoller, ProgressWatch
+from graphdatascience.query_runner.progress.progress_provider import ProgressProvider, TaskWithProgress
+
+
+class FastProgressPoller(ProgressPoller):
+    _MIN_POLLING_INTERVAL = 0.01
+    _MAX_POLLING_INTERVAL = 0.05
+
+
+class CollectingProgressProvider(ProgressProvider):
+    def __init__(self, progress: str = "50%") -> None:
+        self.lookups: list[list[str]] = []
+        self.progress = progress
+
+    def root_task_with_progress(self, job_id: str, database: Optional[str] = None) -> TaskWithProgress:
+        raise AssertionError("Jobs should be looked up in batches")
+
+    def root_tasks_with_progress(
+        self, job_ids: list[str], database: Optional[str] = None
+    ) -> dict[str, TaskWithProgress]:
+        self.lookups.append(sorted(job_ids))
+        return {job_id: TaskWithProgress("Test task", self.progress, "RUNNING") for job_id in job_ids}
+
+
+def _watch(poller: ProgressPoller, provider: ProgressProvider, job_id: str) -> ProgressWatch:
+    return poller.watch(job_id, provider, "database", lambda _: None, lambda e: None)
+
+
+def test_batches_lookups_of_all_jobs() -> None:
+    poller = FastProgressPoller()
+    provider = CollectingProgressProvider()
+
+    # register all jobs before the first tick is due
+    with poller._condition:
+        watches = [_watch(poller, provider, f"job{i}") for i in range(10)]
+    time.sleep(0.05)
+    for watch in watches:
+        poller.unwatch(watch)
+
+    assert provider.lookups
+    assert provider.lookups[0] == sorted(f"job{i}" for i in range(10))
+
+
+def test_calls_back_with_progress() -> None:
+    poller = FastProgressPoller()
+    received = threading.Event()
+    tasks: list[TaskWithProgress] = []
+
+    def on_progress(task: TaskWithProgress) -> None:
+        tasks.append(task)
+        received.set()
+
+    watch = poller.watch("foo", CollectingProgressProvider(), None, on_progress, lambda e: None)
+    assert received.wait(timeout=5)
+    poller.unwatch(watch)
+    num_tasks = len(tasks)
+    time.sleep(0.1)
+
+    assert tasks[0] == TaskWithProgress("Test task", "50%", "RUNNING")
+    assert len(tasks) == num_tasks
+
+
+def test_backs_off_while_progress_is_unchanged() -> None:
+    poller = ProgressPoller()
+    provider = CollectingProgressProvider()
+    watch = ProgressWatch("foo", provider, None, lambda _: None, lambda e: None, interval=0.5, next_poll_at=0.0)
+
+    poller._poll([watch])
+    assert watch.interval == 0.5
+
+    poller._poll([watch])
+    assert watch.interval == 0.75
+
+    for _ in range(10):
+        poller._poll([watch])
+    assert watch.interval == ProgressPoller._MAX_POLLING_INTERVAL
+
+    provider.progress = "60%"
+    poller._poll([watch])
+    assert watch.interval == ProgressPoller._MIN_POLLING_INTERVAL
+
+
+def test_passes_lookup_errors_to_watches() -> None:
+    class FailingProgressProvider(ProgressProvider):
+        def root_task_with_progress(self, job_id: str, database: Optional[str] = None) -> TaskWithProgress:
+            raise RuntimeError("Lookup failed")
+
+    errors: list[Exception] = []
+    watch = ProgressWatch(
+        "foo", FailingProgressProvider(), None, lambda _: None, errors.append, interval=0.5, next_poll_at=0.0
+    )
+
+    ProgressPoller()._poll([watch])
+
+    assert str(errors[0]) == "Lookup failed"
+    assert watch.interval == 0.75
+
+
+def test_stops_thread_without_watches() -> None:
+    poller = FastProgressPoller()
+    watch = _watch(poller, CollectingProgressProvider(), "foo")
+    thread = poller._thread
+    assert thread is not None
+
+    poller.unwatch(watch)
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert poller._thread is None
@@ -14,11 +14,11 @@ def test_call_through_functions() -> None:
     def fake_run_cypher(query: str, database: Optional[str] = None) -> DataFrame:
         assert (
             query
-            == "CALL gds.listProgress('foo') YIELD taskName, progress, status RETURN taskName, progress, status LIMIT 1"
+            == "CALL gds.listProgress() YIELD jobId, taskName, progress, status WHERE jobId IN ['foo'] RETURN jobId, taskName, progress, status"
         )
         assert database == "database"
 
-        return DataFrame([{"progress": "n/a", "taskName": "Test task", "status": "RUNNING"}])
+        return DataFrame([{"jobId": "foo", "progress": "n/a", "taskName": "Test task", "status": "RUNNING"}])
 
     def fake_query() -> DataFrame:
         time.sleep(1)
@@ -48,11 +48,11 @@ def test_uses_beta_endpoint() -> None:
     def fake_run_cypher(query: str, database: Optional[str] = None) -> DataFrame:
         assert (
             query
-            == "CALL gds.beta.listProgress('foo') YIELD taskName, progress, status RETURN taskName, progress, status LIMIT 1"
+            == "CALL gds.beta.listProgress() YIELD jobId, taskName, progress, status WHERE jobId IN ['foo'] RETURN jobId, taskName, progress, status"
         )
         assert database == "database"
 
-        return DataFrame([{"progress": "n/a", "taskName": "Test task", "status": "RUNNING"}])
+        return DataFrame([{"jobId": "foo", "progress": "n/a", "taskName": "Test task", "status": "RUNNING"}])
 
     def fake_query() -> DataFrame:
         time.sleep(1)
@@ -1,5 +1,14 @@
+import threading
+
+import pytest
+from neo4j import Record
+from neo4j.exceptions import ServiceUnavailable
+from pandas import DataFrame
+from pytest_mock import MockerFixture
+
 from graphdatascience.call_parameters import CallParameters
 from graphdatascience.query_runner.neo4j_query_runner import Neo4jQueryRunner
+from graphdatascience.query_runner.query_runner import ProcedureCall
 
 
 def test_job_id_extraction() -> None:
@@ -22,3 +31,217 @@ def test_job_id_extraction() -> None:
     params = CallParameters(config={"jobId": "bar"})
     job_id = Neo4jQueryRunner._extract_or_create_job_id(params)
     assert job_id == "bar"
+
+
+def test_connectivity_verified_once_within_interval(mocker: MockerFixture) -> None:
+    driver = mocker.MagicMock()
+    query_runner = Neo4jQueryRunner(driver, database="neo4j")
+
+    query_runner.run_cypher("RETURN 1")
+    query_runner.run_cypher("RETURN 2")
+
+    driver.verify_connectivity.assert_called_once_with(database="neo4j")
+    assert driver.session.return_value.__enter__.return_value.run.call_count == 2
+
+
+def test_connectivity_verified_on_every_query_without_interval(mocker: MockerFixture) -> None:
+    driver = mocker.MagicMock()
+    query_runner = Neo4jQueryRunner(driver, database="neo4j", connectivity_check_interval=0)
+
+    query_runner.run_cypher("RETURN 1")
+    query_runner.run_cypher("RETURN 2")
+
+    assert driver.verify_connectivity.call_count == 2
+
+
+def test_driver_checks_liveness_of_idle_connections(mocker: MockerFixture) -> None:
+    driver_factory = mocker.patch("neo4j.GraphDatabase.driver")
+
+    query_runner = Neo4jQueryRunner.create_for_db("neo4j://localhost", connectivity_check_interval=30)
+
+    assert driver_factory.call_args.kwargs["liveness_check_timeout"] == 30
+    assert query_runner._connectivity_check_interval == 30
+
+
+def test_query_not_retried_after_lost_connection_while_sending(mocker: MockerFixture) -> None:
+    driver = mocker.MagicMock()
+    session = driver.session.return_value.__enter__.return_value
+    query_runner = Neo4jQueryRunner(driver, database="neo4j")
+
+    query_runner.run_cypher("CALL gds.graph.project('g', '*', '*')")
+
+    session.run.side_effect = ServiceUnavailable("Failed to read from defunct connection")  # type: ignore
+    with pytest.raises(ServiceUnavailable, match="defunct connection"):
+        query_runner.run_cypher("CALL gds.graph.project('g2', '*', '*')")
+
+    assert session.run.call_count == 2
+    assert driver.verify_connectivity.call_count == 1
+
+    # the next query verifies the connectivity again
+    session.run.side_effect = None
+    query_runner.run_cypher("RETURN 1")
+    assert driver.verify_connectivity.call_count == 2
+
+
+def test_query_not_retried_after_lost_connection_while_streaming(mocker: MockerFixture) -> None:
+    driver = mocker.MagicMock()
+    session = driver.session.return_value.__enter__.return_value
+    query_runner = Neo4jQueryRunner(driver, database="neo4j")
+
+    query_runner.run_cypher("RETURN 1")
+
+    session.run.return_value.to_df.side_effect = ServiceUnavailable("connection lost")  # type: ignore
+    with pytest.raises(ServiceUnavailable, match="connection lost"):
+        query_runner.run_cypher("RETURN 2")
+
+    assert session.run.call_count == 2
+
+
+def test_run_cypher_iter(mocker: MockerFixture) -> None:
+    driver = mocker.MagicMock()
+    result = driver.session.return_value.__enter__.return_value.run.return_value
+    result.keys.return_value = ["nodeId", "score"]
+    result.__iter__.return_value = iter([Record(zip(["nodeId", "score"], [i, i / 10])) for i in range(5)])  # type: ignore
+    query_runner = Neo4jQueryRunner(driver, database="neo4j")
+
+    chunks = query_runner.run_cypher_iter("CALL gds.pageRank.stream('g')", chunk_size=2)
+
+    # the query is only sent once the chunks are consumed
+    driver.session.assert_not_called()
+
+    first_chunk = next(chunks)
+    assert first_chunk.to_dict("records") == [{"nodeId": 0, "score": 0.0}, {"nodeId": 1, "score": 0.1}]
+    driver.session.return_value.__exit__.assert_not_called()
+
+    assert [chunk["nodeId"].tolist() for chunk in chunks] == [[2, 3], [4]]
+    driver.session.return_value.__exit__.assert_called_once()
+
+
+def test_run_cypher_iter_validates_chunk_size(mocker: MockerFixture) -> None:
+    query_runner = Neo4jQueryRunner(mocker.MagicMock(), database="neo4j")
+
+    with pytest.raises(ValueError, match="The chunk size must be a positive number, but got 0."):
+        query_runner.run_cypher_iter("RETURN 1", chunk_size=0)
+
+
+def test_sessions_reused(mocker: MockerFixture) -> None:
+    driver = mocker.MagicMock()
+    query_runner = Neo4jQueryRunner(driver, database="neo4j", reuse_sessions=True)
+
+    query_runner.run_cypher("RETURN 1")
+    query_runner.run_cypher("RETURN 2")
+
+    driver.session.assert_called_once_with(database="neo4j", bookmarks=None)
+    assert driver.session.return_value.run.call_count == 2
+    driver.session.return_value.close.assert_not_called()
+
+    query_runner.close()
+
+    driver.session.return_value.close.assert_called_once()
+
+
+def test_reused_session_replaced_after_error(mocker: MockerFixture) -> None:
+    driver = mocker.MagicMock()
+    failing_session, session = mocker.MagicMock(), mocker.MagicMock()
+    failing_session.run.side_effect = ValueError("broken")
+    driver.session.side_effect = [failing_session, session]
+    query_runner = Neo4jQueryRunner(driver, database="neo4j", reuse_sessions=True)
+
+    with pytest.raises(ValueError, match="broken"):
+        query_runner.run_cypher("RETURN 1")
+    query_runner.run_cypher("RETURN 2")
+
+    failing_session.close.assert_called_once()
+    session.run.assert_called_once_with("RETURN 2", {})
+
+
+def test_reused_session_replaced_after_bookmarks_change(mocker: MockerFixture) -> None:
+    driver = mocker.MagicMock()
+    query_runner = Neo4jQueryRunner(driver, database="neo4j", reuse_sessions=True)
+
+    query_runner.run_cypher("RETURN 1")
+    query_runner.set_bookmarks(["bookmark"])
+    query_runner.run_cypher("RETURN 2")
+
+    assert driver.session.call_args_list == [
+        mocker.call(database="neo4j", bookmarks=None),
+        mocker.call(database="neo4j", bookmarks=["bookmark"]),
+    ]
+
+
+def test_sessions_of_finished_threads_closed(mocker: MockerFixture) -> None:
+    driver = mocker.MagicMock()
+    worker_session, main_session = mocker.MagicMock(), mocker.MagicMock()
+    driver.session.side_effect = [worker_session, main_session]
+    query_runner = Neo4jQueryRunner(driver, database="neo4j", reuse_sessions=True)
+
+    worker = threading.Thread(target=lambda: query_runner.run_cypher("RETURN 1"))
+    worker.start()
+    worker.join()
+    worker_session.close.assert_not_called()
+
+    query_runner.run_cypher("RETURN 2")
+
+    worker_session.close.assert_called_once()
+    main_session.run.assert_called_once_with("RETURN 2", {})
+    assert [key[0] for key in query_runner._sessions] == [threading.current_thread()]
+
+
+def test_call_procedures(mocker: MockerFixture) -> None:
+    query_runner = Neo4jQueryRunner(mocker.MagicMock(), database="neo4j")
+    run_cypher = mocker.patch.object(
+        query_runner,
+        "run_cypher",
+        side_effect=[
+            DataFrame([{"name": "gds.graph.drop", "yields": ["graphName", "nodeCount"]}]),
+            DataFrame([{"r0": [{"graphName": "a", "nodeCount": 1}], "r1": [], "r2": [{"modelName": "m"}]}]),
+        ],
+    )
+
+    results = query_runner.call_procedures(
+        [
+            ProcedureCall("gds.graph.drop", CallParameters(graph_name="a", fail_if_missing=False)),
+            ProcedureCall("gds.graph.drop", CallParameters(graph_name="b", fail_if_missing=False)),
+            ProcedureCall("gds.model.drop", CallParameters(model_name="m"), yields=["modelName"]),
+        ]
+    )
+
+    assert run_cypher.call_args_list[0].args[1] == {"names": ["gds.graph.drop", "gds.graph.drop"]}
+    assert run_cypher.call_args_list[1].args == (
+        "CALL { CALL gds.graph.drop($p0_graph_name, $p0_fail_if_missing) YIELD `graphName`, `nodeCount`"
+        " RETURN collect({`graphName`: `graphName`, `nodeCount`: `nodeCount`}) AS r0 }"
+        " CALL { CALL gds.graph.drop($p1_graph_name, $p1_fail_if_missing) YIELD `graphName`, `nodeCount`"
+        " RETURN collect({`graphName`: `graphName`, `nodeCount`: `nodeCount`}) AS r1 }"
+        " CALL { CALL gds.model.drop($p2_model_name) YIELD `modelName` RETURN collect({`modelName`: `modelName`}) AS r2 }"
+        " RETURN r0, r1, r2",
+        {
+            "p0_graph_name": "a",
+            "p0_fail_if_missing": False,
+            "p1_graph_name": "b",
+            "p1_fail_if_missing": False,
+            "p2_model_name": "m",
+        },
+        None,
+    )
+
+    assert results[0].to_dict("records") == [{"graphName": "a", "nodeCount": 1}]
+    assert results[1].empty
+    assert list(results[1].columns) == ["graphName", "nodeCount"]
+    assert results[2].to_dict("records") == [{"modelName": "m"}]
+
+    # the output columns of procedures are only looked up once
+    run_cypher.side_effect = [DataFrame([{"r0": []}])]
+    query_runner.call_procedures([ProcedureCall("gds.graph.drop", CallParameters(graph_name="c"))])
+    assert run_cypher.call_count == 3
+    assert query_runner.server_capabilities().procedure_yields(["gds.graph.drop"]) == {
+        "gds.graph.drop": ["graphName", "nodeCount"]
+    }
+    assert run_cypher.call_count == 3
+
+
+def test_call_procedures_unknown_procedure(mocker: MockerFixture) -> None:
+    query_runner = Neo4jQueryRunner(mocker.MagicMock(), database="neo4j")
+    mocker.patch.object(query_runner, "run_cypher", return_value=DataFrame(columns=["name", "yields"]))
+
+    with pytest.raises(ValueError, match="There is no procedure with the name `gds.nope`"):
+        query_runner.call_procedures([ProcedureCall("gds.nope")])
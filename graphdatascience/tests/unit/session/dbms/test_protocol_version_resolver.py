@@ -61,3 +61,11 @@ def test_protocol_versions_newer_dbms_no_matching() -> None:
         match=r"The GDS Python Client does not support any procedure protocol version in the server",
     ):
         resolver.resolve()
+
+
+def test_protocol_versions_cached_per_query_runner() -> None:
+    runner = CollectingQueryRunner(result_mock=DataFrame([{"version": "v2"}]), server_version=ServerVersion(1, 2, 3))
+
+    assert ProtocolVersionResolver(runner).resolve() == ProtocolVersion.V2
+    assert ProtocolVersionResolver(runner).resolve() == ProtocolVersion.V2
+    assert runner.queries == ["CALL gds.session.dbms.protocol.version() YIELD version"]
@@ -1,8 +1,13 @@
 import pytest
+from pandas import DataFrame
 from pyarrow.flight import FlightUnavailableError
+from pytest_mock import MockerFixture
 
+from graphdatascience.call_parameters import CallParameters
 from graphdatascience.query_runner.arrow_info import ArrowInfo
 from graphdatascience.query_runner.arrow_query_runner import ArrowQueryRunner
+from graphdatascience.query_runner.arrow_result_format import ArrowResultFormat
+from graphdatascience.query_runner.gds_arrow_client import GdsArrowClient
 from graphdatascience.server_version.server_version import ServerVersion
 
 from .conftest import CollectingQueryRunner
@@ -37,3 +42,52 @@ def test_create_with_provided_connection(runner: CollectingQueryRunner) -> None:
 
     with pytest.raises(FlightUnavailableError, match=".+ failed to connect .+ ipv4:127.0.0.1:4321: .+"):
         arrow_runner._gds_arrow_client._send_action("TEST", {})
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_partitionable_entities(runner: CollectingQueryRunner) -> None:
+    runner.set__mock_result(DataFrame([{"schema": {"nodes": {"A": {}, "B": {}}, "relationships": {"R": {}}}}]))
+    arrow_runner = ArrowQueryRunner(GdsArrowClient("localhost", 1234), runner, runner.server_version(), 4)
+
+    assert arrow_runner._partitionable_entities("g", ["*"], "nodes") == ["A", "B"]
+    assert runner.last_query() == "CALL gds.graph.list($graph_name) YIELD schema"
+
+    # a single relationship type cannot be partitioned
+    assert arrow_runner._partitionable_entities("g", ["*"], "relationships") == ["*"]
+    assert arrow_runner._partitionable_entities("g", ["C", "D"], "nodes") == ["C", "D"]
+
+    arrow_runner.set_parallel_streams(1)
+    assert arrow_runner._partitionable_entities("g", ["*"], "nodes") == ["*"]
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_partitionable_entities_cached_per_graph(runner: CollectingQueryRunner) -> None:
+    runner.set__mock_result(DataFrame([{"schema": {"nodes": {"A": {}, "B": {}}, "relationships": {"R": {}}}}]))
+    runner.set_database("neo4j")
+    arrow_runner = ArrowQueryRunner(GdsArrowClient("localhost", 1234), runner, runner.server_version(), 4)
+
+    arrow_runner._partitionable_entities("g", ["*"], "nodes")
+    arrow_runner._partitionable_entities("g", ["*"], "relationships")
+    arrow_runner.call_procedure("gds.pageRank.stream", CallParameters(graph_name="g", config={}))
+    assert arrow_runner._partitionable_entities("g", ["*"], "nodes") == ["A", "B"]
+    assert [q for q in runner.queries if "gds.graph.list" in q] == ["CALL gds.graph.list($graph_name) YIELD schema"]
+
+    # the graph might have been changed by a mutation, so its schema is looked up again
+    arrow_runner.call_procedure("gds.graph.nodeLabel.mutate", CallParameters(graph_name="g", config={}))
+    arrow_runner._partitionable_entities("g", ["*"], "nodes")
+    assert len([q for q in runner.queries if "gds.graph.list" in q]) == 2
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_procedures_called_by_name_return_pandas(runner: CollectingQueryRunner, mocker: MockerFixture) -> None:
+    runner.set_database("neo4j")
+    gds_arrow_client = mocker.MagicMock()
+    arrow_runner = ArrowQueryRunner(gds_arrow_client, runner, runner.server_version())
+    params = CallParameters(graph_name="g", relationship_types=["*"], config={})
+
+    arrow_runner.call_procedure("gds.graph.relationships.stream", params)
+    assert gds_arrow_client.get_relationships.call_args.args[-1] == ArrowResultFormat.PANDAS
+
+    # the graph endpoints stream in the configured result format
+    arrow_runner.call_stream_procedure("gds.graph.relationships.stream", params)
+    assert gds_arrow_client.get_relationships.call_args.args[-1] is None
@@ -0,0 +1,315 @@
+import asyncio
+from typing import Any, Optional
+
+import pytest
+from pandas import DataFrame
+from pytest_mock import MockerFixture
+
+from graphdatascience import AsyncGraphDataScience, ServerVersion
+from graphdatascience.call_parameters import CallParameters
+from graphdatascience.error.gds_not_installed import GdsNotFound
+from graphdatascience.query_runner.arrow_result_format import ArrowResultFormat
+from graphdatascience.query_runner.async_arrow_query_runner import AsyncArrowQueryRunner
+from graphdatascience.query_runner.async_neo4j_query_runner import AsyncNeo4jQueryRunner
+from graphdatascience.query_runner.async_query_runner import AsyncQueryRunner
+
+
+class CollectingAsyncQueryRunner(AsyncQueryRunner):
+    def __init__(self, server_version: ServerVersion, arrow_enabled: bool = False):
+        self.queries: list[str] = []
+        self.params: list[dict[str, Any]] = []
+        self.logging: list[bool] = []
+        self._server_version = server_version
+        self._arrow_enabled = arrow_enabled
+        self._database: Optional[str] = "neo4j"
+        self.closed = False
+
+    async def call_procedure(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[list[str]] = None,
+        database: Optional[str] = None,
+        logging: bool = False,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        if params is None:
+            params = CallParameters()
+        yields_clause = "" if yields is None else " YIELD " + ", ".join(yields)
+        self.logging.append(logging)
+
+        return await self.run_cypher(f"CALL {endpoint}({params.placeholder_str()}){yields_clause}", params)
+
+    async def call_function(self, endpoint: str, params: Optional[CallParameters] = None) -> Any:
+        if params is None:
+            params = CallParameters()
+
+        return (await self.run_cypher(f"RETURN {endpoint}({params.placeholder_str()})", params)).squeeze()
+
+    async def run_cypher(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        self.queries.append(query)
+        self.params.append(dict(params or {}))
+
+        if "gds.debug.arrow" in query:
+            return DataFrame(
+                [{"listenAddress": "localhost:1234", "enabled": self._arrow_enabled, "running": True, "versions": []}]
+            )
+
+        return DataFrame([{"result": len(self.queries)}])
+
+    async def server_version(self) -> ServerVersion:
+        return self._server_version
+
+    def encrypted(self) -> bool:
+        return False
+
+    def set_database(self, database: str) -> None:
+        self._database = database
+
+    def database(self) -> Optional[str]:
+        return self._database
+
+    def set_show_progress(self, show_progress: bool) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_call_procedure_through_attributes() -> None:
+    query_runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+
+    async def run() -> DataFrame:
+        async with await AsyncGraphDataScience.create(query_runner) as gds:
+            return await gds.pageRank.stream("g", maxIterations=3)
+
+    result = asyncio.run(run())
+
+    assert result["result"][0] == 2
+    assert query_runner.queries[-1] == "CALL gds.pageRank.stream($arg0, $config)"
+    assert query_runner.params[-1] == {"arg0": "g", "config": {"maxIterations": 3}}
+    assert query_runner.closed
+
+
+def test_call_procedure_without_config() -> None:
+    query_runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+    gds = asyncio.run(AsyncGraphDataScience.create(query_runner, arrow=False))
+
+    asyncio.run(gds.graph.drop("g"))
+
+    assert query_runner.queries == ["CALL gds.graph.drop($arg0)"]
+    assert query_runner.params == [{"arg0": "g"}]
+
+
+@pytest.mark.parametrize(
+    "endpoint, with_logging",
+    [
+        ("gds.pageRank.stream", True),
+        ("gds.beta.pipeline.linkPrediction.train", True),
+        ("gds.fastRP.write.estimate", False),
+        ("gds.graph.project", True),
+        ("gds.graph.project.cypher", True),
+        ("gds.alpha.graph.sample.rwr", True),
+        ("gds.graph.project.estimate", False),
+        ("gds.graph.list", False),
+        ("gds.graph.drop", False),
+        ("gds.graph.nodeProperties.write", False),
+        ("gds.model.list", False),
+    ],
+)
+def test_progress_logged_for_algorithms_and_projections(endpoint: str, with_logging: bool) -> None:
+    query_runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+    gds = asyncio.run(AsyncGraphDataScience.create(query_runner, arrow=False))
+
+    builder: Any = gds
+    for attr in endpoint.split(".")[1:]:
+        builder = getattr(builder, attr)
+    asyncio.run(builder("g"))
+
+    assert query_runner.queries[-1].startswith(f"CALL {endpoint}(")
+    assert query_runner.logging[-1] == with_logging
+
+
+def test_concurrent_calls() -> None:
+    query_runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+    gds = asyncio.run(AsyncGraphDataScience.create(query_runner, arrow=False))
+
+    async def run() -> list[DataFrame]:
+        return await asyncio.gather(*[gds.wcc.stats(f"g{i}") for i in range(10)])
+
+    results = asyncio.run(run())
+
+    assert len(results) == 10
+    assert sorted(params["arg0"] for params in query_runner.params) == sorted(f"g{i}" for i in range(10))
+
+
+def test_private_attributes_are_not_endpoints() -> None:
+    gds = asyncio.run(AsyncGraphDataScience.create(CollectingAsyncQueryRunner(ServerVersion(2, 6, 0)), arrow=False))
+
+    with pytest.raises(AttributeError):
+        gds._foo
+
+    with pytest.raises(AttributeError):
+        gds.graph._foo
+
+
+def test_run_cypher() -> None:
+    query_runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+    gds = asyncio.run(AsyncGraphDataScience.create(query_runner, arrow=False))
+
+    asyncio.run(gds.run_cypher("RETURN $x", {"x": 1}))
+
+    assert query_runner.queries == ["RETURN $x"]
+    assert query_runner.params == [{"x": 1}]
+
+
+def test_arrow_streams_are_run_in_executor(mocker: MockerFixture) -> None:
+    gds_arrow_client = mocker.MagicMock()
+    gds_arrow_client.get_node_properties.return_value = DataFrame([{"nodeId": 0, "pr": 0.5}])
+    query_runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+    arrow_query_runner = AsyncArrowQueryRunner(gds_arrow_client, query_runner)
+
+    result = asyncio.run(
+        arrow_query_runner.call_procedure(
+            "gds.graph.nodeProperties.stream",
+            CallParameters(arg0="g", arg1=["pr"], config={"concurrency": 2}),
+        )
+    )
+
+    assert result.to_dict("records") == [{"nodeId": 0, "nodeProperty": "pr", "propertyValue": 0.5}]
+    gds_arrow_client.get_node_properties.assert_called_once_with(
+        "g", "neo4j", ["pr"], ["*"], False, 2, result_format=ArrowResultFormat.PANDAS
+    )
+    assert query_runner.queries == []
+
+    asyncio.run(arrow_query_runner.call_procedure("gds.graph.list"))
+    assert query_runner.queries == ["CALL gds.graph.list()"]
+
+
+def test_arrow_streams_return_cypher_layout(mocker: MockerFixture) -> None:
+    gds_arrow_client = mocker.MagicMock()
+    gds_arrow_client.get_node_properties.return_value = DataFrame(
+        [{"nodeId": 0, "nodeLabels": ["A"], "pr": 0.5, "wcc": 1}]
+    )
+    gds_arrow_client.get_relationship_properties.return_value = DataFrame(
+        [{"sourceNodeId": 0, "targetNodeId": 1, "relationshipType": "REL", "weight": 2.0}]
+    )
+    arrow_query_runner = AsyncArrowQueryRunner(gds_arrow_client, CollectingAsyncQueryRunner(ServerVersion(2, 6, 0)))
+
+    node_result = asyncio.run(
+        arrow_query_runner.call_procedure(
+            "gds.graph.nodeProperties.stream",
+            CallParameters(arg0="g", arg1=["pr", "wcc"], config={"listNodeLabels": True}),
+        )
+    )
+    relationship_result = asyncio.run(
+        arrow_query_runner.call_procedure(
+            "gds.graph.relationshipProperties.stream", CallParameters(arg0="g", arg1=["weight"])
+        )
+    )
+
+    assert node_result.to_dict("records") == [
+        {"nodeId": 0, "nodeLabels": ["A"], "nodeProperty": "pr", "propertyValue": 0.5},
+        {"nodeId": 0, "nodeLabels": ["A"], "nodeProperty": "wcc", "propertyValue": 1},
+    ]
+    assert relationship_result.to_dict("records") == [
+        {
+            "sourceNodeId": 0,
+            "targetNodeId": 1,
+            "relationshipType": "REL",
+            "relationshipProperty": "weight",
+            "propertyValue": 2.0,
+        }
+    ]
+
+
+def test_arrow_requires_database(mocker: MockerFixture) -> None:
+    query_runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+    query_runner._database = None
+    arrow_query_runner = AsyncArrowQueryRunner(mocker.MagicMock(), query_runner)
+
+    with pytest.raises(ValueError, match="valid Neo4j database to target"):
+        asyncio.run(arrow_query_runner.call_procedure("gds.graph.relationships.stream", CallParameters(arg0="g")))
+
+
+def test_neo4j_runner_run_cypher(mocker: MockerFixture) -> None:
+    result = mocker.MagicMock()
+    result.to_df = mocker.AsyncMock(return_value=DataFrame([{"x": 1}]))
+    result.consume = mocker.AsyncMock(return_value=mocker.MagicMock(notifications=None))
+    session = mocker.MagicMock()
+    session.run = mocker.AsyncMock(return_value=result)
+    session.last_bookmarks = mocker.AsyncMock(return_value="bookmark")
+    session.__aenter__ = mocker.AsyncMock(return_value=session)
+    session.__aexit__ = mocker.AsyncMock(return_value=None)
+    driver = mocker.MagicMock()
+    driver.session.return_value = session
+
+    query_runner = AsyncNeo4jQueryRunner(driver, database="db")
+    df = asyncio.run(query_runner.run_cypher("RETURN $x AS x", {"x": 1}))
+
+    assert df["x"][0] == 1
+    driver.session.assert_called_once_with(database="db", bookmarks=None)
+    session.run.assert_awaited_once_with("RETURN $x AS x", {"x": 1})
+    assert query_runner.last_bookmarks() == "bookmark"
+
+
+def test_neo4j_runner_suggests_endpoint(mocker: MockerFixture) -> None:
+    list_result = mocker.MagicMock()
+    list_result.to_df = mocker.AsyncMock(return_value=DataFrame([{"name": "gds.pageRank.stream"}]))
+    session = mocker.MagicMock()
+    session.run = mocker.AsyncMock(
+        side_effect=[
+            Exception(
+                "There is no procedure with the name `gds.pagerank.stream` registered for this database instance."
+            ),
+            list_result,
+        ]
+    )
+    session.__aenter__ = mocker.AsyncMock(return_value=session)
+    session.__aexit__ = mocker.AsyncMock(return_value=None)
+    driver = mocker.MagicMock()
+    driver.session.return_value = session
+
+    query_runner = AsyncNeo4jQueryRunner(driver, database="db")
+
+    with pytest.raises(SyntaxError, match="gds.pageRank.stream"):
+        asyncio.run(query_runner.call_procedure("gds.pagerank.stream", CallParameters(arg0="g")))
+
+
+def test_neo4j_runner_raises_gds_not_found(mocker: MockerFixture) -> None:
+    session = mocker.MagicMock()
+    session.run = mocker.AsyncMock(side_effect=Exception("Unknown function 'gds.version'"))
+    session.__aenter__ = mocker.AsyncMock(return_value=session)
+    session.__aexit__ = mocker.AsyncMock(return_value=None)
+    driver = mocker.MagicMock()
+    driver.session.return_value = session
+
+    query_runner = AsyncNeo4jQueryRunner(driver, database="db")
+
+    with pytest.raises(GdsNotFound, match="not correctly installed on the Neo4j DBMS"):
+        asyncio.run(query_runner.server_version())
+
+
+def test_neo4j_runner_forwards_warnings(mocker: MockerFixture) -> None:
+    notification = {"severity": "WARNING", "description": "The procedure is deprecated."}
+    result = mocker.MagicMock()
+    result.to_df = mocker.AsyncMock(return_value=DataFrame([{"x": 1}]))
+    result.consume = mocker.AsyncMock(return_value=mocker.MagicMock(notifications=[notification]))
+    session = mocker.MagicMock()
+    session.run = mocker.AsyncMock(return_value=result)
+    session.last_bookmarks = mocker.AsyncMock(return_value=None)
+    session.__aenter__ = mocker.AsyncMock(return_value=session)
+    session.__aexit__ = mocker.AsyncMock(return_value=None)
+    driver = mocker.MagicMock()
+    driver.session.return_value = session
+
+    query_runner = AsyncNeo4jQueryRunner(driver, database="db")
+
+    with pytest.warns(DeprecationWarning, match="The procedure is deprecated."):
+        asyncio.run(query_runner.run_cypher("CALL gds.deprecated()"))
@@ -1,14 +1,24 @@
 import json
+import pickle
 import re
+import time
+from pathlib import Path
 from typing import Any, Generator, Union
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.dataset as ds
 import pytest
+from pandas import DataFrame
 from pyarrow import flight
 from pyarrow._flight import GeneratorStream
 from pyarrow.flight import Action, Ticket
+from pytest_mock import MockerFixture
 
-from graphdatascience.query_runner.gds_arrow_client import AuthMiddleware, GdsArrowClient
+from graphdatascience.graph.base_graph_proc_runner import BaseGraphProcRunner
+from graphdatascience.query_runner.arrow_graph_constructor import ArrowGraphConstructor
+from graphdatascience.query_runner.arrow_result_format import ArrowResultFormat
+from graphdatascience.query_runner.gds_arrow_client import AuthMiddleware, GdsArrowClient, PandasConversionOptions
 
 ActionParam = Union[str, tuple[str, Any], Action]
 
@@ -19,12 +29,25 @@ class FlightServer(flight.FlightServerBase):  # type: ignore
         self._location: str = location
         self._actions: list[ActionParam] = []
         self._tickets: list[Ticket] = []
+        self._table = pa.Table.from_pydict({"ids": [42, 1337, 1234]})
+        self._uploaded_batches: list[pa.RecordBatch] = []
 
     def do_get(self, context: Any, ticket: Ticket) -> GeneratorStream:
         self._tickets.append(ticket)
-        table = pa.Table.from_pydict({"ids": [42, 1337, 1234]})
+        table = self._table
         return GeneratorStream(schema=table.schema, generator=table.to_batches())
 
+    def do_put(
+        self,
+        context: Any,
+        descriptor: flight.FlightDescriptor,
+        reader: flight.MetadataRecordBatchReader,
+        writer: flight.FlightMetadataWriter,
+    ) -> None:
+        for chunk in reader:
+            self._uploaded_batches.append(chunk.data)
+            writer.write(b"ack")
+
     def do_action(self, context: Any, action: ActionParam) -> list[bytes]:
         self._actions.append(action)
 
@@ -286,6 +309,576 @@ def test_get_relationship_topologys(flight_server: FlightServer, flight_client:
     )
 
 
+@pytest.mark.parametrize("upload_window", [1, 3, 10])
+def test_upload_nodes(flight_server: FlightServer, upload_window: int) -> None:
+    uploaded_rows: list[int] = []
+    data = pa.Table.from_pydict({"nodeId": list(range(10))})
+
+    with GdsArrowClient("localhost", flight_server.port, upload_window=upload_window) as client:
+        client.upload_nodes("g", data, batch_size=3, progress_callback=uploaded_rows.append)
+
+    assert uploaded_rows == [3, 3, 3, 1]
+    assert pa.Table.from_batches(flight_server._uploaded_batches).equals(data)
+
+
+def test_upload_nodes_with_target_batch_bytes(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    uploaded_rows: list[int] = []
+    # 8 bytes per row for the id and 32 bytes per row for the embedding
+    data = pa.Table.from_pydict(
+        {
+            "nodeId": list(range(10)),
+            "embedding": pa.FixedSizeListArray.from_arrays(pa.array([0.5] * 40, pa.float64()), 4),
+        }
+    )
+
+    flight_client.upload_nodes(
+        "g", data, batch_size=2, progress_callback=uploaded_rows.append, target_batch_bytes=4 * 40
+    )
+
+    assert uploaded_rows == [4, 4, 2]
+    assert pa.Table.from_batches(flight_server._uploaded_batches).equals(data)
+
+
+def test_rows_per_batch() -> None:
+    narrow = pa.Table.from_pydict({"sourceNodeId": [0, 1], "targetNodeId": [1, 2]})
+    wide = pa.Table.from_pydict({"nodeId": [0, 1], "embedding": [[0.5] * 255, [0.5] * 255]})
+
+    assert GdsArrowClient._rows_per_batch(narrow, 1024 * 1024) == 65_536
+    # more than 256 * 8 bytes per row
+    assert GdsArrowClient._rows_per_batch(wide, 1024 * 1024) < 512
+    assert GdsArrowClient._rows_per_batch(wide, 1) == 1
+    assert GdsArrowClient._rows_per_batch(narrow.slice(0, 0), 1024) == 1
+
+
+class FailingUploadFlightServer(FlightServer):
+    def do_put(
+        self,
+        context: Any,
+        descriptor: flight.FlightDescriptor,
+        reader: flight.MetadataRecordBatchReader,
+        writer: flight.FlightMetadataWriter,
+    ) -> None:
+        for idx, _ in enumerate(reader):
+            if idx == 2:
+                raise flight.FlightServerError("Upload failed")
+            writer.write(b"ack")
+
+
+@pytest.mark.parametrize("upload_window", [1, 4])
+def test_upload_nodes_failure(upload_window: int) -> None:
+    uploaded_rows: list[int] = []
+    data = pa.Table.from_pydict({"nodeId": list(range(10))})
+
+    with FailingUploadFlightServer() as server:
+        with GdsArrowClient("localhost", server.port, upload_window=upload_window) as client:
+            with pytest.raises(flight.FlightServerError, match="Upload failed"):
+                client.upload_nodes("g", data, batch_size=3, progress_callback=uploaded_rows.append)
+
+    # only acknowledged batches are reported as progress
+    assert sum(uploaded_rows) <= 6
+
+
+def test_upload_nodes_retries_stream_that_failed_to_open(flight_server: FlightServer, mocker: MockerFixture) -> None:
+    uploaded_rows: list[int] = []
+    data = pa.Table.from_pydict({"nodeId": list(range(10))})
+
+    with GdsArrowClient("localhost", flight_server.port) as client:
+        unreachable_client = mocker.Mock()
+        unreachable_client.do_put.side_effect = flight.FlightUnavailableError("Connection refused")
+        pooled_client = client._pooled_client
+        mocker.patch.object(client, "_pooled_client", side_effect=[unreachable_client, pooled_client()])
+
+        client.upload_nodes("g", data, batch_size=2, progress_callback=uploaded_rows.append)
+
+    assert unreachable_client.do_put.call_count == 1
+    assert pa.Table.from_batches(flight_server._uploaded_batches).equals(data)
+    assert uploaded_rows == [2, 2, 2, 2, 2]
+
+
+class LostAckUploadFlightServer(FlightServer):
+    def __init__(self) -> None:
+        super().__init__()
+        self._upload_attempts = 0
+
+    def do_put(
+        self,
+        context: Any,
+        descriptor: flight.FlightDescriptor,
+        reader: flight.MetadataRecordBatchReader,
+        writer: flight.FlightMetadataWriter,
+    ) -> None:
+        self._upload_attempts += 1
+        for idx, chunk in enumerate(reader):
+            self._uploaded_batches.append(chunk.data)
+            if idx == 2:
+                # the batch was received, but the connection is lost before it is acknowledged
+                raise flight.FlightUnavailableError("Connection lost")
+            writer.write(b"ack")
+
+
+@pytest.mark.parametrize("upload_window", [1, 2])
+def test_upload_nodes_fails_on_lost_ack(upload_window: int) -> None:
+    uploaded_rows: list[int] = []
+    data = pa.Table.from_pydict({"nodeId": list(range(10))})
+
+    with LostAckUploadFlightServer() as server:
+        with GdsArrowClient("localhost", server.port, upload_window=upload_window) as client:
+            with pytest.raises(flight.FlightServerError, match="awaiting an acknowledgement"):
+                client.upload_nodes("g", data, batch_size=2, progress_callback=uploaded_rows.append)
+
+        # the batch without acknowledgement might have been applied, so it is not sent again
+        assert server._upload_attempts == 1
+        received_node_ids = pa.Table.from_batches(server._uploaded_batches).column("nodeId").to_pylist()
+        assert received_node_ids == [0, 1, 2, 3, 4, 5]
+
+    assert uploaded_rows == [2, 2]
+
+
+class SlowUploadFlightServer(FlightServer):
+    def do_put(
+        self,
+        context: Any,
+        descriptor: flight.FlightDescriptor,
+        reader: flight.MetadataRecordBatchReader,
+        writer: flight.FlightMetadataWriter,
+    ) -> None:
+        for _ in reader:
+            # simulates the server side processing of a batch
+            time.sleep(0.005)
+            writer.write(b"ack")
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("pooled", [True, False])
+@pytest.mark.parametrize("concurrency", [1, 2, 4, 8])
+def test_benchmark_concurrent_uploads(concurrency: int, pooled: bool, mocker: MockerFixture) -> None:
+    num_rows = 1_000_000
+    df = DataFrame({"sourceNodeId": range(num_rows), "targetNodeId": range(num_rows)})
+
+    with SlowUploadFlightServer() as server:
+        with GdsArrowClient("localhost", server.port) as client:
+            if not pooled:
+                # all concurrent streams share a single connection, to compare against the pool at equal concurrency
+                mocker.patch.object(client, "ensure_client_pool_size")
+            constructor = ArrowGraphConstructor(
+                "db", "g", client, concurrency, None, chunk_size=1_000, target_batch_bytes=None
+            )
+
+            start = time.perf_counter()
+            constructor.run([], [df])
+            elapsed = time.perf_counter() - start
+
+    connections = "pooled connections" if pooled else "a single connection"
+    print(f"\nUploaded {num_rows / elapsed:,.0f} rows/s with concurrency {concurrency} over {connections}")
+
+
+def test_partition_df() -> None:
+    constructor = ArrowGraphConstructor("db", "g", GdsArrowClient("localhost", 1234), 2, None, chunk_size=1)
+
+    partitions = constructor._partition_df(DataFrame({"nodeId": range(25)}))
+
+    assert [p.num_rows for p in partitions] == [9, 8, 8]
+    assert pa.concat_tables(partitions).column("nodeId").to_pylist() == list(range(25))
+    # the partitions are slices of a single converted table
+    first_buffer = partitions[0].column("nodeId").chunk(0).buffers()[1]
+    assert partitions[1].column("nodeId").chunk(0).buffers()[1].address == first_buffer.address
+    assert all(p.schema == partitions[0].schema for p in partitions)
+
+
+def test_construct_graph(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    constructor = ArrowGraphConstructor("db", "g", flight_client, 2, None, chunk_size=1)
+    node_dfs = [DataFrame({"nodeId": range(25)}), DataFrame({"nodeId": range(25, 30)})]
+    relationship_dfs = [DataFrame({"sourceNodeId": range(29), "targetNodeId": range(1, 30)})]
+
+    constructor.run(node_dfs, relationship_dfs)
+
+    action_types = [action.type for action in flight_server._actions if isinstance(action, Action)]
+    assert action_types == ["v1/CREATE_GRAPH", "v1/NODE_LOAD_DONE", "v1/RELATIONSHIP_LOAD_DONE"]
+    node_batches = [b for b in flight_server._uploaded_batches if "nodeId" in b.schema.names]
+    relationship_batches = [b for b in flight_server._uploaded_batches if "sourceNodeId" in b.schema.names]
+    assert sorted(pa.Table.from_batches(node_batches).column("nodeId").to_pylist()) == list(range(30))
+    assert sum(batch.num_rows for batch in relationship_batches) == 29
+
+
+def test_construct_graph_with_batch_size(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    constructor = ArrowGraphConstructor("db", "g", flight_client, 2, None, chunk_size=1)
+    node_dfs = [DataFrame({"nodeId": range(25)}), DataFrame({"nodeId": range(25, 30)})]
+
+    constructor.run(node_dfs, [], batch_size=3)
+
+    node_batches = [b for b in flight_server._uploaded_batches if "nodeId" in b.schema.names]
+    assert sorted(pa.Table.from_batches(node_batches).column("nodeId").to_pylist()) == list(range(30))
+    assert max(batch.num_rows for batch in node_batches) == 3
+
+    with pytest.raises(ValueError, match="The batch size must be a positive number, but got 0."):
+        constructor.run(node_dfs, [], batch_size=0)
+
+
+def test_construct_graph_from_arrow(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    constructor = ArrowGraphConstructor("db", "g", flight_client, 2, None, chunk_size=1)
+    relationships = pa.table({"sourceNodeId": range(29), "targetNodeId": range(1, 30)})
+
+    def node_dfs() -> Generator[DataFrame, None, None]:
+        for i in range(3):
+            yield DataFrame({"nodeId": range(i * 10, i * 10 + 10)})
+
+    constructor.run(
+        [node_dfs(), pa.table({"nodeId": [30, 31]})],
+        [pa.RecordBatchReader.from_batches(relationships.schema, relationships.to_batches(max_chunksize=5))],
+    )
+
+    node_batches = [b for b in flight_server._uploaded_batches if "nodeId" in b.schema.names]
+    relationship_batches = [b for b in flight_server._uploaded_batches if "sourceNodeId" in b.schema.names]
+    assert sorted(pa.Table.from_batches(node_batches).column("nodeId").to_pylist()) == list(range(32))
+    # the reader is streamed as is
+    assert [b.num_rows for b in relationship_batches] == [5, 5, 5, 5, 5, 4]
+
+
+def test_construct_graph_conversion_failure(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    constructor = ArrowGraphConstructor("db", "g", flight_client, 2, None, chunk_size=1)
+    # mixed types cannot be converted to Arrow
+    relationship_dfs = [DataFrame({"sourceNodeId": [0, "a"], "targetNodeId": [1, 2]})]
+
+    with pytest.raises(pa.ArrowException):
+        constructor.run([DataFrame({"nodeId": range(3)})], relationship_dfs)
+
+    action_types = [action.type for action in flight_server._actions if isinstance(action, Action)]
+    assert action_types == ["v1/CREATE_GRAPH", "v1/NODE_LOAD_DONE", "v1/ABORT"]
+
+
+def test_construct_graph_from_files(flight_server: FlightServer, flight_client: GdsArrowClient, tmp_path: Path) -> None:
+    for i in range(3):
+        DataFrame({"nodeId": range(i * 10, i * 10 + 10), "score": [0.5] * 10}).to_parquet(
+            tmp_path / f"nodes-{i}.parquet"
+        )
+    DataFrame({"sourceNodeId": range(29), "targetNodeId": range(1, 30), "weight": range(29)}).to_parquet(
+        tmp_path / "rels.parquet"
+    )
+    node_scan = BaseGraphProcRunner._scan_files(str(tmp_path / "nodes-*.parquet"), "parquet", ["nodeId"], None)
+    relationship_scan = BaseGraphProcRunner._scan_files(
+        str(tmp_path / "rels.parquet"), "parquet", ["sourceNodeId", "targetNodeId"], ds.field("weight") < 5
+    )
+
+    ArrowGraphConstructor("db", "g", flight_client, 2, None).run([node_scan], [relationship_scan])
+
+    node_batches = [b for b in flight_server._uploaded_batches if "nodeId" in b.schema.names]
+    relationship_batches = [b for b in flight_server._uploaded_batches if "sourceNodeId" in b.schema.names]
+    # only the projected columns of the matching rows are uploaded
+    assert all(b.schema.names == ["nodeId"] for b in node_batches)
+    assert sorted(pa.Table.from_batches(node_batches).column("nodeId").to_pylist()) == list(range(30))
+    assert pa.Table.from_batches(relationship_batches).to_pydict() == {
+        "sourceNodeId": [0, 1, 2, 3, 4],
+        "targetNodeId": [1, 2, 3, 4, 5],
+    }
+
+
+@pytest.mark.parametrize("compression", ["lz4", "zstd"])
+def test_upload_nodes_with_compression(flight_server: FlightServer, compression: str) -> None:
+    data = pa.Table.from_pydict({"nodeId": list(range(10)), "score": [1.0] * 10})
+
+    with GdsArrowClient("localhost", flight_server.port, compression=compression) as client:
+        client.upload_nodes("g", data, batch_size=4)
+
+    assert pa.Table.from_batches(flight_server._uploaded_batches).equals(data)
+
+
+def test_invalid_compression() -> None:
+    with pytest.raises(ValueError, match="Invalid compression `gzip`. Supported are `lz4` and `zstd`"):
+        GdsArrowClient("localhost", 1234, compression="gzip")
+
+
+def test_invalid_upload_window() -> None:
+    with pytest.raises(ValueError, match="The upload window must be at least 1, but was 0"):
+        GdsArrowClient("localhost", 1234, upload_window=0)
+
+
+def test_client_pool(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    flight_client.ensure_client_pool_size(3)
+    assert len(flight_client._pooled_flight_clients) == 2
+
+    # the pool never shrinks
+    flight_client.ensure_client_pool_size(2)
+    assert len(flight_client._pooled_flight_clients) == 2
+
+    handed_out = [id(flight_client._pooled_client()) for _ in range(6)]
+    # consecutive streams use distinct clients, cycling through the whole pool in order
+    assert len(set(handed_out[:3])) == 3
+    assert handed_out[3:] == handed_out[:3]
+    assert id(flight_client._client()) in handed_out
+
+    flight_client.upload_nodes("g", pa.Table.from_pydict({"nodeId": [1, 2, 3]}))
+    assert len(flight_server._uploaded_batches) == 1
+
+
+def test_pickle_client_with_pool() -> None:
+    client = GdsArrowClient("localhost", 1234)
+    client.ensure_client_pool_size(2)
+
+    restored_client = pickle.loads(pickle.dumps(client))
+
+    assert restored_client._pooled_flight_clients == []
+    assert restored_client.connection_info() == ("localhost", 1234)
+    restored_client.ensure_client_pool_size(2)
+    assert len(restored_client._pooled_flight_clients) == 1
+
+
+def test_get_node_properties_in_parallel(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    flight_server._table = pa.Table.from_pydict({"nodeId": [42, 1337, 1234], "foo": [1.0, 2.0, 3.0]})
+
+    result = flight_client.get_node_properties("g", "db", ["foo"], ["A", "B", "C"], parallel_streams=2)
+
+    # every partition returns the same nodes, which must only be contained once
+    assert isinstance(result, DataFrame)
+    assert result.to_dict("list") == {"nodeId": [42, 1337, 1234], "foo": [1.0, 2.0, 3.0]}
+
+    tickets = flight_server._tickets
+    assert len(tickets) == 2
+    requested_labels = sorted(json.loads(t.ticket.decode())["body"]["configuration"]["node_labels"] for t in tickets)
+    assert requested_labels == [["A", "C"], ["B"]]
+
+
+def test_get_node_properties_in_parallel_without_labels(
+    flight_server: FlightServer, flight_client: GdsArrowClient
+) -> None:
+    result = flight_client.get_node_properties("g", "db", ["foo"], ["*"], parallel_streams=4)
+
+    assert result["ids"].tolist() == [42, 1337, 1234]
+    assert len(flight_server._tickets) == 1
+
+
+def test_get_relationships_in_parallel(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    result = flight_client.get_relationships("g", "db", ["FOO", "BAR"], parallel_streams=8)
+
+    assert result["ids"].tolist() == [42, 1337, 1234, 42, 1337, 1234]
+
+    tickets = flight_server._tickets
+    assert len(tickets) == 2
+    requested_types = sorted(
+        json.loads(t.ticket.decode())["body"]["configuration"]["relationship_types"] for t in tickets
+    )
+    assert requested_types == [["BAR"], ["FOO"]]
+
+
+def test_get_node_properties_iter(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    batches = list(flight_client.get_node_properties_iter("g", "db", ["foo", "bar"], ["Person"], list_node_labels=True))
+
+    assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+    assert pa.Table.from_batches(batches).to_pydict() == {"ids": [42, 1337, 1234]}
+
+    tickets = flight_server._tickets
+    assert len(tickets) == 1
+    assert_ticket(
+        tickets[0],
+        {
+            "configuration": {"list_node_labels": True, "node_labels": ["Person"], "node_properties": ["foo", "bar"]},
+            "database_name": "db",
+            "graph_name": "g",
+            "procedure_name": "gds.graph.nodeProperties.stream",
+        },
+    )
+
+
+def test_get_relationship_properties_iter(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    batches = list(
+        flight_client.get_relationship_properties_iter(
+            "g", "db", relationship_properties="prop", relationship_types=["FOO"], concurrency=42
+        )
+    )
+
+    assert pa.Table.from_batches(batches).to_pydict() == {"ids": [42, 1337, 1234]}
+
+    tickets = flight_server._tickets
+    assert len(tickets) == 1
+    assert_ticket(
+        tickets[0],
+        {
+            "concurrency": 42,
+            "configuration": {"relationship_property": "prop", "relationship_types": ["FOO"]},
+            "database_name": "db",
+            "graph_name": "g",
+            "procedure_name": "gds.graph.relationshipProperty.stream",
+        },
+    )
+
+
+def test_get_relationships_iter(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    batches = list(flight_client.get_relationships_iter("g", "db", relationship_types=["FOO"]))
+
+    assert pa.Table.from_batches(batches).to_pydict() == {"ids": [42, 1337, 1234]}
+
+    tickets = flight_server._tickets
+    assert len(tickets) == 1
+    assert_ticket(
+        tickets[0],
+        {
+            "configuration": {"relationship_types": ["FOO"]},
+            "database_name": "db",
+            "graph_name": "g",
+            "procedure_name": "gds.graph.relationships.stream",
+        },
+    )
+
+
+def test_sanitize_record_batch_decodes_dictionary() -> None:
+    labels = pa.DictionaryArray.from_arrays(pa.array([0, 1, 0], pa.int32()), pa.array([["A"], ["B"]]))
+    batch = pa.RecordBatch.from_arrays([pa.array([1, 2, 3]), labels], names=["nodeId", "labels"])
+
+    sanitized = GdsArrowClient._sanitize_record_batch(batch)
+
+    assert not pa.types.is_dictionary(sanitized.schema.field("labels").type)
+    assert sanitized.column(1).to_pylist() == [["A"], ["B"], ["A"]]
+
+
+def test_to_pandas_with_default_conversion() -> None:
+    client = GdsArrowClient("localhost", 1234)
+    table = pa.Table.from_pydict({"nodeId": [0, 1], "embedding": [[0.1, 0.2], [0.3, 0.4]]})
+
+    df = client._to_pandas(table)
+
+    assert df["nodeId"].tolist() == [0, 1]
+    assert [list(row) for row in df["embedding"]] == [[0.1, 0.2], [0.3, 0.4]]
+
+
+def test_to_pandas_with_self_destruct() -> None:
+    client = GdsArrowClient(
+        "localhost", 1234, pandas_conversion=PandasConversionOptions(self_destruct=True, split_blocks=True)
+    )
+    table = pa.Table.from_pydict({"nodeId": [0, 1], "score": [0.5, 1.5]})
+
+    df = client._to_pandas(table)
+
+    assert df.to_dict("list") == {"nodeId": [0, 1], "score": [0.5, 1.5]}
+
+
+def test_to_pandas_with_arrow_dtypes() -> None:
+    pd = pytest.importorskip("pandas", minversion="2.0")
+    client = GdsArrowClient("localhost", 1234, pandas_conversion=PandasConversionOptions(arrow_dtypes=True))
+    table = pa.Table.from_pydict({"nodeId": [0, 1], "score": [0.5, 1.5]})
+
+    df = client._to_pandas(table)
+
+    assert isinstance(df["nodeId"].dtype, pd.ArrowDtype)
+    assert df["score"].tolist() == [0.5, 1.5]
+
+
+def test_to_pandas_with_embeddings_as_matrix() -> None:
+    client = GdsArrowClient("localhost", 1234)
+    client.set_pandas_conversion(PandasConversionOptions(embeddings_as_matrix=True))
+    table = pa.Table.from_pydict(
+        {
+            "nodeId": [0, 1, 2],
+            "embedding": [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]],
+            "ragged": [[1], [2, 3], [4]],
+        }
+    )
+
+    df = client._to_pandas(table)
+
+    assert df.columns.tolist() == ["nodeId", "embedding", "ragged"]
+    assert [row.tolist() for row in df["embedding"]] == [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]
+    assert_contiguous_rows(df["embedding"].tolist())
+    assert [list(row) for row in df["ragged"]] == [[1], [2, 3], [4]]
+
+
+def test_embedding_matrix_of_converted_column() -> None:
+    client = GdsArrowClient("localhost", 1234, pandas_conversion=PandasConversionOptions(embeddings_as_matrix=True))
+    table = pa.Table.from_pydict({"nodeId": [0, 1, 2], "embedding": [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]})
+
+    df = client._to_pandas(table)
+    matrix = GdsArrowClient.embedding_matrix(df["embedding"])
+
+    assert matrix.ndim == 2
+    assert matrix.tolist() == [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]
+    # the matrix is not a copy of the rows
+    assert np.shares_memory(matrix, df["embedding"][1])
+
+
+def test_embedding_matrix_of_filtered_column() -> None:
+    client = GdsArrowClient("localhost", 1234, pandas_conversion=PandasConversionOptions(embeddings_as_matrix=True))
+    table = pa.Table.from_pydict({"nodeId": [0, 1, 2], "embedding": [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]})
+
+    df = client._to_pandas(table)
+    matrix = GdsArrowClient.embedding_matrix(df[df["nodeId"] != 1]["embedding"])
+
+    assert matrix.ndim == 2
+    assert matrix.tolist() == [[0.1, 0.2], [0.5, 0.6]]
+
+    unconverted = DataFrame({"embedding": [[1.0, 2.0], [3.0, 4.0]]})
+    assert GdsArrowClient.embedding_matrix(unconverted["embedding"]).tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+
+def test_to_pandas_with_fixed_size_list_as_matrix() -> None:
+    client = GdsArrowClient("localhost", 1234, pandas_conversion=PandasConversionOptions(embeddings_as_matrix=True))
+    embedding = pa.FixedSizeListArray.from_arrays(pa.array([1.0, 2.0, 3.0, 4.0]), 2)
+    table = pa.Table.from_arrays([embedding, pa.array([0, 1])], names=["embedding", "nodeId"])
+
+    df = client._to_pandas(table)
+
+    assert df.columns.tolist() == ["embedding", "nodeId"]
+    assert df["embedding"][1].tolist() == [3.0, 4.0]
+    assert_contiguous_rows(df["embedding"].tolist())
+
+
+def test_to_pandas_with_dictionaries_as_categorical() -> None:
+    client = GdsArrowClient(
+        "localhost", 1234, pandas_conversion=PandasConversionOptions(dictionaries_as_categorical=True)
+    )
+    rel_types = pa.array(["A", "B", "A"]).dictionary_encode()
+    labels = pa.DictionaryArray.from_arrays(pa.array([0, 1, 0], pa.int32()), pa.array([["A"], ["B"]]))
+    table = pa.Table.from_arrays([rel_types, labels], names=["relationshipType", "nodeLabels"])
+
+    df = client._to_pandas(client._sanitize_arrow_table(table, keep_dictionaries=True))
+
+    assert df["relationshipType"].dtype == "category"
+    assert df["relationshipType"].cat.codes.tolist() == [0, 1, 0]
+    assert df["relationshipType"].tolist() == ["A", "B", "A"]
+    # dictionaries of lists cannot be represented as a Categorical
+    assert [list(labels) for labels in df["nodeLabels"]] == [["A"], ["B"], ["A"]]
+
+
+def test_get_node_properties_as_arrow(flight_server: FlightServer) -> None:
+    with GdsArrowClient("localhost", flight_server.port, result_format="arrow") as client:
+        result = client.get_node_properties("g", "db", ["foo"])
+
+    assert isinstance(result, pa.Table)
+    assert result.column("ids").to_pylist() == [42, 1337, 1234]
+
+
+def test_get_node_properties_as_numpy(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    flight_server._table = pa.Table.from_pydict({"nodeId": [0, 1], "embedding": [[0.1, 0.2], [0.3, 0.4]]})
+    flight_client.set_result_format(ArrowResultFormat.NUMPY)
+
+    result = flight_client.get_node_properties("g", "db", ["embedding"])
+
+    assert isinstance(result, dict)
+    assert result["nodeId"].tolist() == [0, 1]
+    assert result["embedding"].shape == (2, 2)
+    assert result["embedding"].tolist() == [[0.1, 0.2], [0.3, 0.4]]
+
+
+def test_get_node_properties_as_polars(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    polars = pytest.importorskip("polars")
+    flight_client.set_result_format("polars")
+
+    result = flight_client.get_node_properties("g", "db", ["foo"])
+
+    assert isinstance(result, polars.DataFrame)
+    assert result["ids"].to_list() == [42, 1337, 1234]
+
+
+def test_invalid_result_format() -> None:
+    with pytest.raises(ValueError, match="Invalid result format `excel`"):
+        GdsArrowClient("localhost", 1234, result_format="excel")
+
+
+def test_sanitize_record_batch_keeps_dictionary() -> None:
+    rel_types = pa.array(["A", "B", "A"]).dictionary_encode()
+    batch = pa.RecordBatch.from_arrays([rel_types], names=["relationshipType"])
+
+    assert GdsArrowClient._sanitize_record_batch(batch, keep_dictionaries=True) is batch
+    assert not pa.types.is_dictionary(GdsArrowClient._sanitize_record_batch(batch).schema[0].type)
+
+
 def test_auth_middleware() -> None:
     middleware = AuthMiddleware(("user", "password"))
 
@@ -305,6 +898,40 @@ def test_auth_middleware() -> None:
     assert second_header == {"authorization": "Bearer token"}
 
 
+def test_auth_middleware_token_expiry(mocker: MockerFixture) -> None:
+    middleware = AuthMiddleware(("user", "password"))
+    middleware.received_headers({"authorization": ["Bearer token"]})
+
+    assert middleware.token() == "token"
+    assert middleware.token(min_remaining_lifetime=300) == "token"
+
+    mocker.patch("time.time", return_value=middleware._token_timestamp + 400)
+    assert middleware.token() == "token"
+    assert middleware.token(min_remaining_lifetime=300) is None
+
+    mocker.patch("time.time", return_value=middleware._token_timestamp + 601)
+    assert middleware.token() is None
+    assert middleware._token is None
+
+
+def test_request_token_reuses_valid_token(mocker: MockerFixture) -> None:
+    client = GdsArrowClient("localhost", 1234, auth=("user", "password"))
+    flight_client = mocker.Mock()
+    flight_client.authenticate_basic_token.side_effect = lambda user, password: client._auth_middleware._set_token(
+        "token"
+    )
+    client._flight_client = flight_client
+
+    assert client.request_token() == "token"
+    assert client.request_token() == "token"
+    assert flight_client.authenticate_basic_token.call_count == 1
+
+    # a token that is about to expire is renewed
+    client._auth_middleware._token_timestamp -= 500
+    assert client.request_token() == "token"
+    assert flight_client.authenticate_basic_token.call_count == 2
+
+
 def test_auth_middleware_bad_headers() -> None:
     middleware = AuthMiddleware(("user", "password"))
 
@@ -334,6 +961,12 @@ def test_handle_flight_error() -> None:
         )
 
 
+def assert_contiguous_rows(rows: list[Any]) -> None:
+    addresses = [row.__array_interface__["data"][0] for row in rows]
+    assert all(not row.flags.owndata for row in rows)
+    assert all(b - a == rows[0].nbytes for a, b in zip(addresses, addresses[1:]))
+
+
 def assert_action(action: Action, expected_type: str, expected_body: dict[str, Any]) -> None:
     assert action.type == expected_type
     assert json.loads(action.body.to_pybytes().decode()) == expected_body
@@ -1,7 +1,14 @@
+import time
+from pathlib import Path
+from typing import Generator, Optional, Sequence
+
+import pyarrow as pa
 import pytest
 from pandas import DataFrame
+from pytest_mock import MockerFixture
 
 from graphdatascience.graph_data_science import GraphDataScience
+from graphdatascience.query_runner.graph_constructor import GraphConstructor, GraphData
 
 from .conftest import CollectingQueryRunner
 
@@ -27,18 +34,35 @@ def test_graph_project_based_construct_without_arrow(runner: CollectingQueryRunn
     gds.graph.construct("hello", nodes, relationships, concurrency=2)
 
     expected_query = (
-        "UNWIND $data AS data WITH data, "
-        "CASE WHEN data[6] THEN data[5] ELSE null END AS sourceNodeLabels, "
-        "CASE WHEN data[3] THEN data[2] ELSE null END AS relationshipType, "
-        "CASE WHEN data[10] THEN data[9] ELSE null END AS targetNodeId, "
-        "\nCASE WHEN data[8] THEN data[7] ELSE null END AS sourceNodeProperties, "
-        "\nCASE WHEN data[1] THEN data[0] ELSE null END AS relationshipProperties "
-        "RETURN gds.graph.project($graph_name, data[4], targetNodeId, {sourceNodeLabels: sourceNodeLabels, targetNodeLabels: NULL, sourceNodeProperties: sourceNodeProperties, targetNodeProperties: NULL, relationshipType: relationshipType, relationshipProperties: relationshipProperties}, $configuration)"
+        "UNWIND range(0, size($sourceNodeId) - 1) AS i"
+        " WITH i,"
+        " $relationshipProperties[i] AS relationshipProperties,"
+        " $relationshipType[i] AS relationshipType,"
+        " $sourceNodeLabels[i] AS sourceNodeLabels,"
+        " $sourceNodeProperties[i] AS sourceNodeProperties,"
+        " $targetNodeId[i] AS targetNodeId"
+        " RETURN gds.graph.project("
+        "$graph_name, $sourceNodeId[i], targetNodeId, {"
+        "sourceNodeLabels: sourceNodeLabels, targetNodeLabels: NULL, "
+        "sourceNodeProperties: sourceNodeProperties, targetNodeProperties: NULL, "
+        "relationshipType: relationshipType, relationshipProperties: relationshipProperties"
+        "}, $configuration)"
     )
 
     assert runner.last_query() == expected_query
 
 
+def test_construct_without_arrow_probes_edition_once(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    nodes = DataFrame({"nodeId": [0, 1]})
+    runner.add__mock_result("gds.graph.exists", DataFrame([{"exists": False}]))
+    runner.add__mock_result("gds.debug.sysInfo", DataFrame([{"gdsEdition": "Unlicensed"}]))
+
+    gds.graph.construct("hello", nodes)
+    gds.graph.construct("hello2", nodes)
+
+    assert len([query for query in runner.queries if "gds.debug.sysInfo" in query]) == 1
+
+
 def test_multi_df(
     runner: CollectingQueryRunner,
     gds: GraphDataScience,
@@ -59,15 +83,15 @@ def test_multi_df(
     gds.graph.construct("hello", nodes, relationships)
 
     expected_proc_query = (
-        "UNWIND $data AS data"
-        " WITH data,"
-        " CASE WHEN data[6] THEN data[5] ELSE null END AS sourceNodeLabels,"
-        " CASE WHEN data[3] THEN data[2] ELSE null END AS relationshipType,"
-        " CASE WHEN data[10] THEN data[9] ELSE null END AS targetNodeId,"
-        " CASE WHEN data[8] THEN data[7] ELSE null END AS sourceNodeProperties,"
-        " CASE WHEN data[1] THEN data[0] ELSE null END AS relationshipProperties"
+        "UNWIND range(0, size($sourceNodeId) - 1) AS i"
+        " WITH i,"
+        " $relationshipProperties[i] AS relationshipProperties,"
+        " $relationshipType[i] AS relationshipType,"
+        " $sourceNodeLabels[i] AS sourceNodeLabels,"
+        " $sourceNodeProperties[i] AS sourceNodeProperties,"
+        " $targetNodeId[i] AS targetNodeId"
         " RETURN gds.graph.project("
-        "$graph_name, data[4], targetNodeId, {"
+        "$graph_name, $sourceNodeId[i], targetNodeId, {"
         "sourceNodeLabels: sourceNodeLabels, targetNodeLabels: NULL, "
         "sourceNodeProperties: sourceNodeProperties, targetNodeProperties: NULL, "
         "relationshipType: relationshipType, relationshipProperties: relationshipProperties"
@@ -78,24 +102,47 @@ def test_multi_df(
 
     actual_params = runner.last_params()
 
-    expected_df = [
-        [None, False, None, False, 0, "a", True, {"property": 6.0}, True, -1, False],
-        [None, False, None, False, 1, "a", True, {"property": 7.0}, True, -1, False],
-        [None, False, None, False, 2, "b", True, {"q": -500}, True, -1, False],
-        [None, False, None, False, 3, "b", True, {"q": -400}, True, -1, False],
-        [{"weights": 0.2}, True, "A", True, 0, None, False, None, False, 1, True],
-        [{"weights": 0.3}, True, "A", True, 1, None, False, None, False, 2, True],
-        [{}, True, "B", True, 2, None, False, None, False, 3, True],
-        [{}, True, "B", True, 3, None, False, None, False, 0, True],
-    ]
-
     assert actual_params == {
         "configuration": {"readConcurrency": 4, "undirectedRelationshipTypes": None},
         "graph_name": "hello",
-        "data": expected_df,
+        "relationshipProperties": [None, None, None, None, {"weights": 0.2}, {"weights": 0.3}, {}, {}],
+        "relationshipType": [None, None, None, None, "A", "A", "B", "B"],
+        "sourceNodeId": [0, 1, 2, 3, 0, 1, 2, 3],
+        "sourceNodeLabels": ["a", "a", "b", "b", None, None, None, None],
+        "sourceNodeProperties": [
+            {"property": 6.0},
+            {"property": 7.0},
+            {"q": -500},
+            {"q": -400},
+            None,
+            None,
+            None,
+            None,
+        ],
+        "targetNodeId": [None, None, None, None, 1, 2, 3, 0],
     }
 
 
+def test_construct_in_batches_requires_arrow(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    nodes = DataFrame({"nodeId": [0, 1, 2]})
+    relationships = DataFrame({"sourceNodeId": [0, 1, 2], "targetNodeId": [1, 2, 0]})
+    runner.add__mock_result("gds.graph.exists", DataFrame([{"exists": False}]))
+
+    with pytest.raises(ValueError, match="Graph construction in batches requires Apache Arrow"):
+        gds.graph.construct("hello", nodes, relationships, batch_size=4)
+
+    # nothing is written to the database
+    assert not any("CREATE" in query or "gds.graph.project" in query for query in runner.queries)
+
+
+def test_construct_in_batches_validates_batch_size(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    nodes = DataFrame({"nodeId": [0, 1]})
+    runner.add__mock_result("gds.graph.exists", DataFrame([{"exists": False}]))
+
+    with pytest.raises(ValueError, match="The batch size must be a positive number, but got 0."):
+        gds.graph.construct("hello", nodes, batch_size=0)
+
+
 def test_graph_aggregation_based_construct_without_arrow(
     runner: CollectingQueryRunner,
     gds: GraphDataScience,
@@ -123,37 +170,39 @@ def test_graph_aggregation_based_construct_without_arrow(
     gds.graph.construct("hello", nodes, relationships, concurrency=2, undirected_relationship_types=["REL"])
 
     expected_proc_query = (
-        "UNWIND $data AS data"
-        " WITH data,"
-        " CASE WHEN data[6] THEN data[5] ELSE null END AS sourceNodeLabels,"
-        " CASE WHEN data[3] THEN data[2] ELSE null END AS relationshipType,"
-        " CASE WHEN data[10] THEN data[9] ELSE null END AS targetNodeId,"
-        " CASE WHEN data[8] THEN data[7] ELSE null END AS sourceNodeProperties,"
-        " CASE WHEN data[1] THEN data[0] ELSE null END AS relationshipProperties"
+        "UNWIND range(0, size($sourceNodeId) - 1) AS i"
+        " WITH i,"
+        " $relationshipProperties[i] AS relationshipProperties,"
+        " $relationshipType[i] AS relationshipType,"
+        " $sourceNodeLabels[i] AS sourceNodeLabels,"
+        " $sourceNodeProperties[i] AS sourceNodeProperties,"
+        " $targetNodeId[i] AS targetNodeId"
         " RETURN gds.graph.project("
-        "$graph_name, data[4], targetNodeId, {"
+        "$graph_name, $sourceNodeId[i], targetNodeId, {"
         "sourceNodeLabels: sourceNodeLabels, targetNodeLabels: NULL, "
         "sourceNodeProperties: sourceNodeProperties, targetNodeProperties: NULL, "
         "relationshipType: relationshipType, relationshipProperties: relationshipProperties"
         "}, $configuration)"
     )
 
-    # indices are based off the combined df
     assert runner.last_query().replace("\n", "") == expected_proc_query
 
     actual_params = runner.last_params()
 
-    expected_df = [
-        [None, False, None, False, 0, ["A"], True, {"pF": 1337.0, "pI": 1337, "pList": [4, 5, 6, 7]}, True, -1, False],
-        [None, False, None, False, 1, ["B"], True, {"pF": 42.42, "pI": 42, "pList": [1, 2, 3]}, True, -1, False],
-        [{"relPropA": 1337.2}, True, "REL", True, 0, None, False, None, False, 1, True],
-        [{"relPropA": 42.0}, True, "REL2", True, 1, None, False, None, False, 0, True],
-    ]
-
     assert actual_params == {
         "configuration": {"readConcurrency": 2, "undirectedRelationshipTypes": ["REL"]},
         "graph_name": "hello",
-        "data": expected_df,
+        "relationshipProperties": [None, None, {"relPropA": 1337.2}, {"relPropA": 42.0}],
+        "relationshipType": [None, None, "REL", "REL2"],
+        "sourceNodeId": [0, 1, 0, 1],
+        "sourceNodeLabels": [["A"], ["B"], None, None],
+        "sourceNodeProperties": [
+            {"pF": 1337.0, "pI": 1337, "pList": [4, 5, 6, 7]},
+            {"pF": 42.42, "pI": 42, "pList": [1, 2, 3]},
+            None,
+            None,
+        ],
+        "targetNodeId": [None, None, 1, 0],
     }
 
 
@@ -196,6 +245,91 @@ def test_graph_construct_validate_df_columns(runner: CollectingQueryRunner, gds:
         gds.graph.construct("hello", nodes, relationships, concurrency=2)
 
 
+def test_graph_construct_from_arrow_without_arrow(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    nodes = DataFrame({"nodeId": [0, 1], "labels": ["A", "B"]})
+    relationships = DataFrame({"sourceNodeId": [0, 1], "targetNodeId": [1, 0], "relationshipType": ["REL", "REL"]})
+    runner.add__mock_result("gds.graph.exists", DataFrame([{"exists": False}]))
+    runner.add__mock_result("gds.debug.sysInfo", DataFrame([{"gdsEdition": "Unlicensed"}]))
+
+    gds.graph.construct("hello", nodes, relationships)
+    expected_query, expected_params = runner.last_query(), runner.last_params()
+
+    def relationship_batches() -> Generator[pa.RecordBatch, None, None]:
+        yield from pa.Table.from_pandas(relationships).to_batches(max_chunksize=1)
+
+    gds.graph.construct("hello", pa.Table.from_pandas(nodes), relationship_batches())
+    assert runner.last_query() == expected_query
+    assert runner.last_params() == expected_params
+
+    relationships_table = pa.Table.from_pandas(relationships)
+    reader = pa.RecordBatchReader.from_batches(relationships_table.schema, relationships_table.to_batches())
+    gds.graph.construct("hello", (df for df in [nodes]), reader)
+    assert runner.last_query() == expected_query
+    assert runner.last_params() == expected_params
+
+
+def test_graph_construct_with_custom_constructor(
+    runner: CollectingQueryRunner, gds: GraphDataScience, mocker: MockerFixture
+) -> None:
+    class RecordingGraphConstructor(GraphConstructor):
+        def run(
+            self, nodes: Sequence[GraphData], relationships: Sequence[GraphData], batch_size: Optional[int] = None
+        ) -> None:
+            runs.append((list(nodes), list(relationships), batch_size))
+
+    runs: list[tuple[list[GraphData], list[GraphData], Optional[int]]] = []
+    mocker.patch.object(runner, "create_graph_constructor", return_value=RecordingGraphConstructor())
+    runner.add__mock_result("gds.graph.exists", DataFrame([{"exists": False}]))
+
+    nodes = pa.table({"nodeId": [0, 1]})
+    relationships = DataFrame({"sourceNodeId": [0, 1], "targetNodeId": [1, 0]})
+    gds.graph.construct("hello", nodes, relationships, batch_size=10)
+
+    # the data is passed on as given, the constructor decides how to convert it
+    assert runs == [([nodes], [relationships], 10)]
+
+
+def test_graph_construct_validate_arrow_columns(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    nodes = pa.table({"nodeIds": [0, 1]})
+    relationships = (batch for batch in pa.table({"sourceNodeId": [0, 1], "TargetNodeIds": [1, 0]}).to_batches())
+
+    runner.add__mock_result("gds.graph.exists", DataFrame([{"exists": False}]))
+
+    with pytest.raises(ValueError, match=r"(.*'nodeId'.*\s.*'targetNodeId'.*)|(.*'targetNodeId'.*\s.*'nodeId'.*)"):
+        gds.graph.construct("hello", nodes, relationships, concurrency=2)
+
+
+def test_graph_construct_from_files_validate_columns(
+    runner: CollectingQueryRunner, gds: GraphDataScience, tmp_path: Path
+) -> None:
+    DataFrame({"nodeIds": [0, 1]}).to_parquet(tmp_path / "nodes.parquet")
+    DataFrame({"sourceNodeId": [0], "targetNodeId": [1]}).to_parquet(tmp_path / "rels.parquet")
+
+    runner.add__mock_result("gds.graph.exists", DataFrame([{"exists": False}]))
+
+    with pytest.raises(ValueError, match="Node files at index 0 needs to contain a 'nodeId' column"):
+        gds.graph.construct_from_files("hello", str(tmp_path / "nodes.parquet"), str(tmp_path / "rels.parquet"))
+
+    with pytest.raises(ValueError, match=r"The columns \['weight'\] do not exist"):
+        gds.graph.construct_from_files(
+            "hello", str(tmp_path / "nodes.parquet"), str(tmp_path / "rels.parquet"), relationship_columns=["weight"]
+        )
+
+    with pytest.raises(ValueError, match="No files match the pattern"):
+        gds.graph.construct_from_files("hello", str(tmp_path / "*.csv"))
+
+
+def test_graph_construct_from_files_without_arrow(
+    runner: CollectingQueryRunner, gds: GraphDataScience, tmp_path: Path
+) -> None:
+    DataFrame({"nodeId": [0, 1]}).to_parquet(tmp_path / "nodes.parquet")
+
+    runner.add__mock_result("gds.graph.exists", DataFrame([{"exists": False}]))
+
+    with pytest.raises(ValueError, match="requires a connection to the GDS Arrow Flight server"):
+        gds.graph.construct_from_files("hello", str(tmp_path / "*.parquet"))
+
+
 def test_graph_alpha_construct_backward_compat(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
     nodes = DataFrame(
         {
@@ -233,3 +367,25 @@ def test_nodes_graph(gds: GraphDataScience, runner: CollectingQueryRunner) -> No
     other_query = runner.last_query()
 
     assert query == other_query
+
+
+@pytest.mark.benchmark
+def test_benchmark_construct_without_arrow(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    num_rows = 1_000_000
+    nodes = DataFrame({"nodeId": range(num_rows), "labels": "A", "score": 0.5, "rank": range(num_rows)})
+    relationships = DataFrame(
+        {
+            "sourceNodeId": range(num_rows),
+            "targetNodeId": range(1, num_rows + 1),
+            "relationshipType": "REL",
+            "weight": 1.0,
+        }
+    )
+    runner.add__mock_result("gds.graph.exists", DataFrame([{"exists": False}]))
+    runner.add__mock_result("gds.debug.sysInfo", DataFrame([{"gdsEdition": "Unlicensed"}]))
+
+    start = time.perf_counter()
+    gds.graph.construct("hello", nodes, relationships)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nPrepared {2 * num_rows / elapsed:,.0f} rows/s for the Cypher based construction")
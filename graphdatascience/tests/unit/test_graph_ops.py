@@ -1,5 +1,7 @@
+import pyarrow as pa
 import pytest
 from pandas import DataFrame
+from pytest_mock import MockerFixture
 
 from graphdatascience.graph_data_science import GraphDataScience
 from graphdatascience.server_version.server_version import ServerVersion
@@ -236,6 +238,19 @@ def test_graph_streamNodeProperties(runner: CollectingQueryRunner, gds: GraphDat
     }
 
 
+def test_graph_streamNodeProperties_arrow_result(
+    runner: CollectingQueryRunner, gds: GraphDataScience, mocker: MockerFixture
+) -> None:
+    G, _ = gds.graph.project("g", "*", "*")
+
+    arrow_result = pa.Table.from_pydict({"nodeId": [0], "dummyProp": [2]})
+    mocker.patch.object(runner, "call_procedure", return_value=arrow_result)
+
+    # the wide Arrow layout is returned as-is instead of being melted into a pandas DataFrame
+    assert gds.graph.streamNodeProperties(G, ["dummyProp"]) is arrow_result
+    assert gds.graph.streamNodeProperties(G, ["dummyProp"], separate_property_columns=True) is arrow_result
+
+
 def test_graph_nodeProperties_stream(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
     G, _ = gds.graph.project("g", "*", "*")
 
@@ -260,6 +275,21 @@ def test_graph_nodeProperties_stream(runner: CollectingQueryRunner, gds: GraphDa
     }
 
 
+def test_graph_nodeProperties_stream_arrow_result(
+    runner: CollectingQueryRunner, gds: GraphDataScience, mocker: MockerFixture
+) -> None:
+    G, _ = gds.graph.project("g", "*", "*")
+
+    arrow_result = pa.Table.from_pydict({"nodeId": [0], "dummyProp": [2]})
+    mocker.patch.object(runner, "call_procedure", return_value=arrow_result)
+
+    # the wide Arrow layout is returned as-is instead of being melted into a pandas DataFrame
+    assert gds.graph.nodeProperties.stream(G, ["dummyProp"]) is arrow_result
+
+    with pytest.raises(ValueError, match="only supported for pandas results"):
+        gds.graph.nodeProperties.stream(G, ["dummyProp"], db_node_properties=["name"])
+
+
 def test_graph_streamRelationshipProperty(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
     G, _ = gds.graph.project("g", "*", "*")
 
@@ -356,6 +386,21 @@ def test_graph_streamRelationshipProperties(runner: CollectingQueryRunner, gds:
     }
 
 
+def test_graph_streamRelationshipProperties_arrow_result(
+    runner: CollectingQueryRunner, gds: GraphDataScience, mocker: MockerFixture
+) -> None:
+    G, _ = gds.graph.project("g", "*", "*")
+
+    arrow_result = pa.Table.from_pydict(
+        {"sourceNodeId": [0], "targetNodeId": [1], "relationshipType": ["REL"], "dummyProp": [2]}
+    )
+    mocker.patch.object(runner, "call_procedure", return_value=arrow_result)
+
+    # the wide Arrow layout is returned as-is instead of being melted into a pandas DataFrame
+    assert gds.graph.streamRelationshipProperties(G, ["dummyProp"]) is arrow_result
+    assert gds.graph.streamRelationshipProperties(G, ["dummyProp"], separate_property_columns=True) is arrow_result
+
+
 def test_graph_relationshipProperties_stream(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
     G, _ = gds.graph.project("g", "*", "*")
 
@@ -3,8 +3,10 @@ from dataclasses import asdict
 import pytest
 from pandas import DataFrame
 
+from graphdatascience import PandasConversionOptions
 from graphdatascience.graph_data_science import GraphDataScience
 from graphdatascience.query_runner.arrow_info import ArrowInfo
+from graphdatascience.query_runner.arrow_query_runner import ArrowQueryRunner
 from graphdatascience.server_version.server_version import ServerVersion
 from graphdatascience.tests.unit.conftest import CollectingQueryRunner
 
@@ -48,3 +50,30 @@ def test_endpoint_as_required_kwparam(runner: CollectingQueryRunner) -> None:
     # Should still be mandatory
     with pytest.raises(TypeError, match=r"__init__\(\) missing 1 required positional argument: 'endpoint'"):
         GraphDataScience()  # type: ignore
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_arrow_upload_window(runner: CollectingQueryRunner) -> None:
+    runner.add__mock_result(
+        "gds.debug.arrow",
+        DataFrame([asdict(ArrowInfo(listenAddress="foo.bar:1234", enabled=True, running=True, versions=[]))]),
+    )
+
+    gds = GraphDataScience(endpoint=runner, arrow_upload_window=4)
+
+    assert isinstance(gds._query_runner, ArrowQueryRunner)
+    assert gds._query_runner._gds_arrow_client._upload_window == 4
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_arrow_pandas_conversion(runner: CollectingQueryRunner) -> None:
+    runner.add__mock_result(
+        "gds.debug.arrow",
+        DataFrame([asdict(ArrowInfo(listenAddress="foo.bar:1234", enabled=True, running=True, versions=[]))]),
+    )
+    pandas_conversion = PandasConversionOptions(split_blocks=True)
+
+    gds = GraphDataScience(endpoint=runner, arrow_pandas_conversion=pandas_conversion)
+
+    assert isinstance(gds._query_runner, ArrowQueryRunner)
+    assert gds._query_runner._gds_arrow_client._pandas_conversion == pandas_conversion
@@ -1,4 +1,5 @@
 import pytest
+from pandas import DataFrame
 
 from graphdatascience.graph_data_science import GraphDataScience
 from graphdatascience.server_version.server_version import ServerVersion
@@ -89,3 +90,12 @@ def test_license_state(runner: CollectingQueryRunner, gds: GraphDataScience) ->
 
     assert runner.last_query() == "CALL gds.license.state()"
     assert runner.last_params() == {}
+
+
+@pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 5, 0))
+def test_is_licensed_cached(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    runner.add__mock_result("gds.isLicensed", DataFrame([{"isLicensed": True}]))
+
+    assert gds.is_licensed()
+    assert gds.is_licensed()
+    assert [query for query in runner.queries if "gds.isLicensed" in query] == ["RETURN gds.isLicensed()"]
@@ -1,7 +1,11 @@
+from typing import Optional
+
 from pandas import DataFrame
 
+from graphdatascience.call_parameters import CallParameters
 from graphdatascience.graph.graph_object import Graph
 from graphdatascience.graph_data_science import GraphDataScience
+from graphdatascience.query_runner.query_runner import ProcedureCall
 from graphdatascience.session.aura_graph_data_science import AuraGraphDataScience
 from graphdatascience.tests.unit.conftest import CollectingQueryRunner
 
@@ -70,3 +74,49 @@ def test_remote_node_property(runner: CollectingQueryRunner, aura_gds: AuraGraph
         "property_key": "my_prop",
         "node_label": "my_label",
     }
+
+
+def test_run_cypher_iter(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    runner.set__mock_result(DataFrame({"nodeId": [0, 1, 2]}))
+
+    chunks = list(gds.run_cypher_iter("MATCH (n) RETURN id(n) AS nodeId", chunk_size=2))
+
+    assert [chunk["nodeId"].tolist() for chunk in chunks] == [[0, 1], [2]]
+    assert runner.last_query() == "MATCH (n) RETURN id(n) AS nodeId"
+
+
+def test_call_procedures(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    runner.add__mock_result("gds.graph.drop", DataFrame([{"graphName": "a"}]))
+
+    results = gds.call_procedures(
+        [
+            ProcedureCall("gds.graph.drop", CallParameters(graph_name="a")),
+            ProcedureCall("gds.graph.drop", CallParameters(graph_name="b")),
+        ]
+    )
+
+    assert [result.to_dict("records") for result in results] == [[{"graphName": "a"}], [{"graphName": "a"}]]
+    assert runner.last_params() == {"graph_name": "b"}
+
+
+def test_call_procedures_without_params_do_not_share_them(runner: CollectingQueryRunner) -> None:
+    class MutatingQueryRunner(CollectingQueryRunner):
+        def call_procedure(
+            self,
+            endpoint: str,
+            params: Optional[CallParameters] = None,
+            yields: Optional[list[str]] = None,
+            database: Optional[str] = None,
+            logging: bool = False,
+            custom_error: bool = True,
+        ) -> DataFrame:
+            if params is not None:
+                params["config"] = {"jobId": endpoint}
+            return super().call_procedure(endpoint, params, yields, database, logging, custom_error)
+
+    first, second = ProcedureCall("gds.list"), ProcedureCall("gds.graph.list")
+    mutating_runner = MutatingQueryRunner(runner.server_version())
+    mutating_runner.call_procedures([first, second])
+
+    assert first.params is None and second.params is None
+    assert mutating_runner.queries == ["CALL gds.list()", "CALL gds.graph.list()"]
@@ -15,6 +15,9 @@ with open("requirements/base/rust-ext.txt", "r", encoding="utf-8") as f:
 with open("requirements/base/networkx.txt", "r", encoding="utf-8") as f:
     nx_reqs = f.read().splitlines()
 
+with open("requirements/base/polars.txt", "r", encoding="utf-8") as f:
+    polars_reqs = f.read().splitlines()
+
 with open("graphdatascience/version.py") as f:
     version = f.readline().strip().split()[-1][1:-1]
 
@@ -59,5 +62,5 @@ setuptools.setup(
     python_requires=">=3.9",
     install_requires=reqs,
     zip_safe=False,
-    extras_require={"ogb": ogb_reqs, "networkx": nx_reqs, "rust_ext": rust_ext_reqs},
+    extras_require={"ogb": ogb_reqs, "networkx": nx_reqs, "rust_ext": rust_ext_reqs, "polars": polars_reqs},
 )